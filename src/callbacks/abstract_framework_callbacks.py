@@ -34,8 +34,8 @@ from py_arg.abstract_argumentation.import_export.argumentation_framework_to_triv
 )
 
 # Utility import for reading the AF from text fields
-from py_arg_visualisation.functions.import_functions.read_argumentation_framework_functions import (
-    read_argumentation_framework,
+from py_arg_visualisation.functions.session_functions.argumentation_framework_session import (
+    get_argumentation_framework_session,
 )
 
 # Check for Graphviz dot path (if needed in this module)
@@ -60,6 +60,14 @@ if dot_path is None:
 
 # -- Callback for downloading a generated abstract argumentation framework --
 
+def _read_argumentation_framework(arguments_text, defeats_text):
+    try:
+        return get_argumentation_framework_session(arguments_text, defeats_text).argumentation_framework
+    except ValueError:
+        # Invalid attacks are reported below the text area (see validate_abstract_argumentation_framework).
+        raise PreventUpdate
+
+
 @callback(
     Output("21-af-download", "data"),
     Input("21-af-download-button", "n_clicks"),
@@ -158,34 +166,34 @@ def download_generated_abstract_argumentation_framework(
                 argumentation_framework_str = json.dumps(argumentation_framework_json)
             except Exception:
                 # Fallback to constructing from text fields only if merging fails
-                argumentation_framework = read_argumentation_framework(arguments_text, defeats_text)
+                argumentation_framework = _read_argumentation_framework(arguments_text, defeats_text)
                 argumentation_framework_json = ArgumentationFrameworkToJSONWriter().to_dict(
                     argumentation_framework
                 )
                 argumentation_framework_str = json.dumps(argumentation_framework_json)
         else:
             # No raw_json available: construct from text fields only
-            argumentation_framework = read_argumentation_framework(arguments_text, defeats_text)
+            argumentation_framework = _read_argumentation_framework(arguments_text, defeats_text)
             argumentation_framework_json = ArgumentationFrameworkToJSONWriter().to_dict(
                 argumentation_framework
             )
             argumentation_framework_str = json.dumps(argumentation_framework_json)
     elif extension == "TGF":
-        argumentation_framework = read_argumentation_framework(arguments_text, defeats_text)
+        argumentation_framework = _read_argumentation_framework(arguments_text, defeats_text)
         argumentation_framework_str = (
             ArgumentationFrameworkToTrivialGraphFormatWriter.write_to_str(
                 argumentation_framework
             )
         )
     elif extension == "APX":
-        argumentation_framework = read_argumentation_framework(arguments_text, defeats_text)
+        argumentation_framework = _read_argumentation_framework(arguments_text, defeats_text)
         argumentation_framework_str = (
             ArgumentationFrameworkToASPARTIXFormatWriter.write_to_str(
                 argumentation_framework
             )
         )
     elif extension == "ICCMA23":
-        argumentation_framework = read_argumentation_framework(arguments_text, defeats_text)
+        argumentation_framework = _read_argumentation_framework(arguments_text, defeats_text)
         argumentation_framework_str = (
             ArgumentationFrameworkToICCMA23FormatWriter.write_to_str(
                 argumentation_framework
@@ -200,6 +208,26 @@ def download_generated_abstract_argumentation_framework(
     }
 
 
+# -- Callback for reporting invalid attacks --
+
+@callback(
+    Output("abstract-attacks", "invalid"),
+    Output("abstract-attacks-feedback", "children"),
+    Input("abstract-arguments", "value"),
+    Input("abstract-attacks", "value"),
+)
+def validate_abstract_argumentation_framework(arguments, attacks):
+    """
+    Show the (line-numbered) errors of the attacks below the text area. The other callbacks do not update while the
+    attacks are invalid, e.g. while an attack is being typed.
+    """
+    try:
+        get_argumentation_framework_session(arguments, attacks)
+    except ValueError as error:
+        return True, str(error)
+    return False, None
+
+
 # -- Callback for choosing examples --
 EXAMPLES_FOLDER = "examples"
 
@@ -2,8 +2,8 @@ from dash import Input, Output, State, callback, callback_context, no_update
 from dash.exceptions import PreventUpdate
 import html
 import clingo
-from py_arg_visualisation.functions.import_functions.read_argumentation_framework_functions import (
-    read_argumentation_framework,
+from py_arg_visualisation.functions.session_functions.argumentation_framework_session import (
+    get_argumentation_framework_session,
 )
 
 
@@ -84,7 +84,11 @@ def handle_critical_attacks(arguments, attacks, selected_extension, selected_rad
     if not all([arguments, attacks, selected_extension]):
         raise PreventUpdate
     
-    arg_framework = read_argumentation_framework(arguments, attacks)
+    try:
+        arg_framework = get_argumentation_framework_session(arguments, attacks).argumentation_framework
+    except ValueError:
+        # Invalid attacks are reported below the text area (see validate_abstract_argumentation_framework).
+        raise PreventUpdate
 
     # Generate attack facts
     attack_facts = "\n".join(
@@ -6,11 +6,8 @@ from dash.exceptions import PreventUpdate
 import json
 
 # Import any necessary functions
-from py_arg_visualisation.functions.import_functions.read_argumentation_framework_functions import (
-    read_argumentation_framework,
-)
-from py_arg_visualisation.functions.graph_data_functions.get_af_dot_string import (
-    get_numbered_grounded_extension,
+from py_arg_visualisation.functions.session_functions.argumentation_framework_session import (
+    get_argumentation_framework_session,
 )
 
 
@@ -35,10 +32,12 @@ def generate_explanations(arguments, attacks, active_item, selected_extension, p
         raise PreventUpdate
 
     # Read the argumentation framework and compute grounded status.
-    arg_framework = read_argumentation_framework(arguments, attacks)
-    gr_status_by_arg, number_by_argument = get_numbered_grounded_extension(
-        arg_framework
-    )
+    try:
+        session = get_argumentation_framework_session(arguments, attacks)
+    except ValueError:
+        # Invalid attacks are reported below the text area (see validate_abstract_argumentation_framework).
+        raise PreventUpdate
+    gr_status_by_arg, number_by_argument = session.get_numbered_grounded_extension()
 
     def determine_hex_color(arg):
         """Return the hex color code based on the argument's status and extension membership."""
@@ -5,11 +5,8 @@ import dash_bootstrap_components as dbc
 from dash.exceptions import PreventUpdate
 
 # Import PyArg semantic functions and readers
-from py_arg.abstract_argumentation.semantics.get_argumentation_framework_extensions import (
-    get_argumentation_framework_extensions,
-)
-from py_arg_visualisation.functions.import_functions.read_argumentation_framework_functions import (
-    read_argumentation_framework,
+from py_arg_visualisation.functions.session_functions.argumentation_framework_session import (
+    get_argumentation_framework_session,
 )
 
 
@@ -31,6 +28,11 @@ def _format_extension_label_from_value(long_value: str, selected_labels):
     return "\n".join(sections) if sections else "{}"
 
 
+def _labelling_to_value(labelling):
+    # Encode an (IN, UNDEC, OUT) labelling as "in1+in2|undec1|out1+out2".
+    return "|".join("+".join(argument.name for argument in sorted(arguments)) for arguments in labelling)
+
+
 @callback(
     [
         Output("extension-radioitems-grounded", "options"),
@@ -83,50 +85,23 @@ def evaluate_abstract_argumentation_framework(
     if active_item != "Evaluation":
         raise PreventUpdate
 
-    arg_framework = read_argumentation_framework(arguments, attacks)
-    frozen_extensions = get_argumentation_framework_extensions(
-        arg_framework, "Complete"
-    )
-    extensions = [set(frozen_ext) for frozen_ext in frozen_extensions]
-
-    extension_dict = {}
-    for extension in sorted(extensions):
-        out_arguments = {
-            attacked
-            for attacked in arg_framework.arguments
-            if any(
-                arg in arg_framework.get_incoming_defeat_arguments(attacked)
-                for arg in extension
-            )
-        }
-        undecided_arguments = {
-            argument
-            for argument in arg_framework.arguments
-            if argument not in extension and argument not in out_arguments
-        }
-        extension_readable_str = (
-            "{" + ", ".join(arg.name for arg in sorted(extension)) + "}"
-        )
-        extension_in_str = "+".join(arg.name for arg in sorted(extension))
-        extension_out_str = "+".join(arg.name for arg in sorted(out_arguments))
-        extension_undecided_str = "+".join(
-            arg.name for arg in sorted(undecided_arguments)
-        )
-        extension_long_str = "|".join(
-            [extension_in_str, extension_undecided_str, extension_out_str]
-        )
-        extension_dict[extension_readable_str] = extension_long_str
-
-    grounded_extensions = get_argumentation_framework_extensions(
-        arg_framework, "Grounded"
-    )
-    stable_extensions = get_argumentation_framework_extensions(arg_framework, "Stable")
-    preferred_extensions = get_argumentation_framework_extensions(
-        arg_framework, "Preferred"
-    )
-    complete_extensions = get_argumentation_framework_extensions(
-        arg_framework, "Complete"
-    )
+    try:
+        session = get_argumentation_framework_session(arguments, attacks)
+    except ValueError:
+        # Invalid attacks are reported below the text area (see validate_abstract_argumentation_framework).
+        raise PreventUpdate
+    # Enumerate the complete labellings once; grounded, preferred and stable are derived from them.
+    labellings = session.get_complete_labellings_by_semantics()
+    grounded_values = [_labelling_to_value(labelling) for labelling in labellings["Grounded"]]
+    stable_values = [_labelling_to_value(labelling) for labelling in labellings["Stable"]]
+    preferred_non_stable_values = [
+        _labelling_to_value(labelling) for labelling in labellings["Preferred"] if labelling[1]
+    ]
+    other_complete_values = [
+        _labelling_to_value(labelling)
+        for labelling in labellings["Complete"]
+        if labelling not in labellings["Grounded"] and labelling not in labellings["Preferred"]
+    ]
 
     # Default labels selection if None
     if not selected_labels:
@@ -139,12 +114,7 @@ def evaluate_abstract_argumentation_framework(
                 "label": _format_extension_label_from_value(value, selected_labels),
                 "value": value,
             }
-            for label, value in extension_dict.items()
-            if label
-            in [
-                f"{{{', '.join(arg.name for arg in sorted(ext))}}}"
-                for ext in grounded_extensions
-            ]
+            for value in grounded_values
         ],
         id="extension-radioitems-grounded",
         inline=True,
@@ -156,12 +126,7 @@ def evaluate_abstract_argumentation_framework(
                 "label": _format_extension_label_from_value(value, selected_labels),
                 "value": value,
             }
-            for label, value in extension_dict.items()
-            if label
-            in [
-                f"{{{', '.join(arg.name for arg in sorted(ext))}}}"
-                for ext in stable_extensions
-            ]
+            for value in stable_values
         ],
         id="extension-radioitems-stable",
         inline=True,
@@ -173,12 +138,7 @@ def evaluate_abstract_argumentation_framework(
                 "label": _format_extension_label_from_value(value, selected_labels),
                 "value": value,
             }
-            for label, value in extension_dict.items()
-            if label
-            in [
-                f"{{{', '.join(arg.name for arg in sorted(ext))}}}"
-                for ext in preferred_extensions - stable_extensions
-            ]
+            for value in preferred_non_stable_values
         ],
         id="extension-radioitems-preferred",
         inline=True,
@@ -190,15 +150,7 @@ def evaluate_abstract_argumentation_framework(
                 "label": _format_extension_label_from_value(value, selected_labels),
                 "value": value,
             }
-            for label, value in extension_dict.items()
-            if label
-            in [
-                f"{{{', '.join(arg.name for arg in sorted(ext))}}}"
-                for ext in complete_extensions
-                - grounded_extensions
-                - stable_extensions
-                - preferred_extensions
-            ]
+            for value in other_complete_values
         ],
         id="extension-radioitems-other",
         inline=True,
@@ -330,13 +282,7 @@ def evaluate_abstract_argumentation_framework(
             ]
         )
 
-    grounded_long_str = ""
-    grounded_extensions_list = list(grounded_extensions)
-    if grounded_extensions_list:
-        grounded_long_str = extension_dict.get(
-            f"{{{', '.join(arg.name for arg in sorted(grounded_extensions_list[0]))}}}",
-            "",
-        )
+    grounded_long_str = grounded_values[0] if grounded_values else ""
     return semantics_div, grounded_long_str
 
 
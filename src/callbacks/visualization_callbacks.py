@@ -1,20 +1,16 @@
 # callbacks/visualization_callbacks.py
 
-import os
-import subprocess
 from dash import callback, Input, Output, State, ctx, html, dcc, no_update, callback_context
 from dash.exceptions import PreventUpdate
 from py_arg_visualisation.functions.graph_data_functions.get_af_dot_string import (
-    generate_plain_dot_string,
-    generate_dot_string,
-    get_provenance,
-    highlight_dot_source,
-    get_local_view_rank,
+    generate_plain_dot_graph,
+    generate_dot_graph,
+    highlight_dot_graph,
     highlight_critical_edges,
     recalculate_fixed_args
 )
-from py_arg_visualisation.functions.import_functions.read_argumentation_framework_functions import (
-    read_argumentation_framework,
+from py_arg_visualisation.functions.session_functions.argumentation_framework_session import (
+    get_argumentation_framework_session,
 )
 import dash_bootstrap_components as dbc
 
@@ -24,6 +20,7 @@ import dash_bootstrap_components as dbc
     Output("21-dot-download", "data"),
     Output("explanation-graph", "dot_source"),
     Output("selected_arguments_changed", "data"),
+    Output("layout-token-store", "data"),
     Input("21-dot-download-button", "n_clicks"),
     Input("abstract-arguments", "value"),
     Input("abstract-attacks", "value"),
@@ -42,6 +39,7 @@ import dash_bootstrap_components as dbc
     State("selected_arguments_changed", "data"),
     State("explanation-graph", "dot_source"),
     State("raw-json", "data"),
+    State("layout-token-store", "data"),
     prevent_initial_call=True,
 )
 def create_visualization(
@@ -63,7 +61,7 @@ def create_visualization(
     selected_arguments_changed,
     current_dot_source,
     raw_json,
-
+    layout_token,
 ):
     if not arguments or not attacks:
         raise PreventUpdate
@@ -83,9 +81,18 @@ def create_visualization(
     if selected_arguments_changed is None:
         selected_arguments_changed = False
 
-    dot_source = None
-    arg_framework = read_argumentation_framework(arguments, attacks)
+    dot_graph = None
+    try:
+        session = get_argumentation_framework_session(arguments, attacks)
+    except ValueError:
+        # Invalid attacks are reported below the text area (see validate_abstract_argumentation_framework).
+        raise PreventUpdate
+    arg_framework = session.argumentation_framework
     triggered_id = ctx.triggered_id
+    if layout_freeze and triggered_id != "layout-freeze-switch":
+        # The frozen layout is kept in the session; if it is not known here (e.g. another worker froze it), take the
+        # positions of the graph that is currently shown instead.
+        layout_token = session.get_layout_token(layout_token, current_dot_source)
 
     # print(triggered_id)
     # print(active_item)
@@ -95,7 +102,7 @@ def create_visualization(
         
         # If we don't have a current dot source, generate a plain one
         if current_dot_source is None:
-            dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+            dot_source = session.get_dot_string(generate_plain_dot_graph, dot_layout, raw_json)
         else:
             dot_source = current_dot_source
         # print(current_dot_source)
@@ -119,6 +126,7 @@ def create_visualization(
             ),
             dot_source,
             selected_arguments_changed,
+            no_update,
         )
 
     # ========================== Argumentation Framework Session ==========================
@@ -127,47 +135,41 @@ def create_visualization(
             if layout_freeze:
                 # When freezing, use current dot source or generate a new one if none exists
                 if current_dot_source is None:
-                    dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                    frozen_dot_source = session.get_dot_string(generate_plain_dot_graph, dot_layout, raw_json)
                 else:
-                    dot_source = current_dot_source
-                os.makedirs("temp", exist_ok=True)
-                with open("temp/layout.dot", "w") as dot_file:
-                    dot_file.write(dot_source)
-                # Generate position information
-                subprocess.run(
-                    ["dot", "-Tplain", "temp/layout.dot", "-o", "temp/layout.txt"],
-                    check=True,
-                )
+                    frozen_dot_source = current_dot_source
+                # Lay out the current graph in memory and keep its positions in the session
+                layout_token = session.freeze_layout(frozen_dot_source)
                 # Immediately update dot source with position information
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json, layout_file="temp/layout.txt")
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json, layout_token=layout_token)
             else:
                 # When unfreezing, generate new layout without saving
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json)
         elif triggered_id in ["21-abstract-graph-layout"]:
             if layout_freeze:
                 # If layout is frozen, use the existing dot source with saved positions
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json, layout_file="temp/layout.txt")
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json, layout_token=layout_token)
             else:
                 # If not frozen, generate new layout without saving
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json)
         else:
             if layout_freeze:
                 # If layout is frozen, use the existing dot source with saved positions
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json, layout_file="temp/layout.txt")
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json, layout_token=layout_token)
             else:
                 # If not frozen, generate new layout without saving
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json)
         selected_arguments_changed = False
     # ========================== Provenance Session ==========================
     elif active_item == "Provenance":
-        # Always use generate_dot_string but adjust dot_rank based on selection
+        # Always use generate_dot_graph but adjust dot_rank based on selection
         if selected_arguments:
             if triggered_id == "layout-freeze-switch":
                 if layout_freeze:
                     # When freezing, use current dot source or generate a new one if none exists
                     if current_dot_source is None:
-                        dot_source = generate_dot_string(
-                            arg_framework,
+                        frozen_dot_source = session.get_dot_string(
+                            generate_dot_graph,
                             selected_arguments,
                             True,
                             dot_layout,
@@ -177,32 +179,25 @@ def create_visualization(
                             raw_json=raw_json,
                         )
                     else:
-                        dot_source = current_dot_source
-                    # Save the current layout
-                    os.makedirs("temp", exist_ok=True)
-                    with open("temp/layout.dot", "w") as dot_file:
-                        dot_file.write(dot_source)
-                    # Generate position information
-                    subprocess.run(
-                        ["dot", "-Tplain", "temp/layout.dot", "-o", "temp/layout.txt"],
-                        check=True,
-                    )
+                        frozen_dot_source = current_dot_source
+                    # Lay out the current graph in memory and keep its positions in the session
+                    layout_token = session.freeze_layout(frozen_dot_source)
                     # Immediately update dot source with position information
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
                         dot_rank,
                         special_handling,
                         layout_freeze,
-                        layout_file="temp/layout.txt",
+                        layout_token=layout_token,
                         raw_json=raw_json,
                     )
                 else:
                     # When unfreezing, generate new layout without saving
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
@@ -213,20 +208,20 @@ def create_visualization(
                     )
             elif layout_freeze:
                 # If layout is frozen, use the saved positions but update highlighting
-                dot_source = generate_dot_string(
-                    arg_framework,
+                dot_graph = session.get_dot_graph(
+                    generate_dot_graph,
                     selected_arguments,
                     True,
                     dot_layout,
                     dot_rank,
                     special_handling,
                     layout_freeze,
-                    layout_file="temp/layout.txt",
+                    layout_token=layout_token,
                     raw_json=raw_json,
                 )
             else:
-                dot_source = generate_dot_string(
-                    arg_framework,
+                dot_graph = session.get_dot_graph(
+                    generate_dot_graph,
                     selected_arguments,
                     True,
                     dot_layout,
@@ -240,48 +235,41 @@ def create_visualization(
                 if layout_freeze:
                     # When freezing, use current dot source or generate a new one if none exists
                     if current_dot_source is None:
-                        dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                        frozen_dot_source = session.get_dot_string(generate_plain_dot_graph, dot_layout, raw_json)
                     else:
-                        dot_source = current_dot_source
-                    # Save the current layout
-                    os.makedirs("temp", exist_ok=True)
-                    with open("temp/layout.dot", "w") as dot_file:
-                        dot_file.write(dot_source)
-                    # Generate position information
-                    subprocess.run(
-                        ["dot", "-Tplain", "temp/layout.dot", "-o", "temp/layout.txt"],
-                        check=True,
-                    )
+                        frozen_dot_source = current_dot_source
+                    # Lay out the current graph in memory and keep its positions in the session
+                    layout_token = session.freeze_layout(frozen_dot_source)
                     # Immediately update dot source with position information
-                    dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json, layout_file="temp/layout.txt")
+                    dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json, layout_token=layout_token)
                 else:
                     # When unfreezing, generate new layout without saving
-                    dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                    dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json)
             elif layout_freeze:
                 # If layout is frozen, use the saved positions
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json, layout_file="temp/layout.txt")
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json, layout_token=layout_token)
             else:
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json)
 
         if prov_arg:
             # Only allow local view if layout is not frozen
             if local_view and not layout_freeze:
-                hl_edges, hl_nodes = get_provenance(arg_framework, prov_type, prov_arg)
-                local_view_rank = get_local_view_rank(arg_framework, prov_arg)
-                dot_source = highlight_dot_source(dot_source, hl_nodes, prov_arg, prov_type, local_view, local_view_rank)
+                hl_edges, hl_nodes = session.get_provenance(prov_type, prov_arg)
+                local_view_rank = session.get_local_view_rank(prov_arg)
+                highlight_dot_graph(dot_graph, hl_nodes, prov_arg, prov_type, local_view, local_view_rank)
             else:
                 # Force global view if layout is frozen
-                hl_edges, hl_nodes = get_provenance(arg_framework, prov_type, prov_arg)
+                hl_edges, hl_nodes = session.get_provenance(prov_type, prov_arg)
                 # Always use global view (False) when layout is frozen
-                dot_source = highlight_dot_source(dot_source, hl_nodes, prov_arg, prov_type, False)
+                highlight_dot_graph(dot_graph, hl_nodes, prov_arg, prov_type, False)
     # ========================== Critical Attacks Session ==========================
     elif active_item == "CriticalAttacks":
         if triggered_id == "layout-freeze-switch":
             if layout_freeze:
                 # When freezing, use current dot source or generate a new one if none exists
                 if current_dot_source is None:
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    frozen_dot_source = session.get_dot_string(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
@@ -291,32 +279,25 @@ def create_visualization(
                         raw_json=raw_json,
                     )
                 else:
-                    dot_source = current_dot_source
-                # Save the current layout
-                os.makedirs("temp", exist_ok=True)
-                with open("temp/layout.dot", "w") as dot_file:
-                    dot_file.write(dot_source)
-                # Generate position information
-                subprocess.run(
-                    ["dot", "-Tplain", "temp/layout.dot", "-o", "temp/layout.txt"],
-                    check=True,
-                )
+                    frozen_dot_source = current_dot_source
+                # Lay out the current graph in memory and keep its positions in the session
+                layout_token = session.freeze_layout(frozen_dot_source)
                 # Immediately update dot source with position information
-                dot_source = generate_dot_string(
-                    arg_framework,
+                dot_graph = session.get_dot_graph(
+                    generate_dot_graph,
                     selected_arguments,
                     True,
                     dot_layout,
                     dot_rank,
                     special_handling,
                     layout_freeze,
-                    layout_file="temp/layout.txt",
+                    layout_token=layout_token,
                     raw_json=raw_json,
                 )
             else:
                 # When unfreezing, generate new layout without saving
-                dot_source = generate_dot_string(
-                    arg_framework,
+                dot_graph = session.get_dot_graph(
+                    generate_dot_graph,
                     selected_arguments,
                     True,
                     dot_layout,
@@ -328,21 +309,21 @@ def create_visualization(
         elif layout_freeze:
             # If layout is frozen, generate a new dot source with the saved positions
             # but with Critical Attacks specific styling and highlighting
-            dot_source = generate_dot_string(
-                arg_framework,
+            dot_graph = session.get_dot_graph(
+                generate_dot_graph,
                 selected_arguments,
                 True,
                 dot_layout,
                 dot_rank,
                 special_handling,
                 layout_freeze,
-                layout_file="temp/layout.txt",
+                layout_token=layout_token,
                 raw_json=raw_json,
             )
         else:
             # Only generate new layout when not frozen
-            dot_source = generate_dot_string(
-                arg_framework,
+            dot_graph = session.get_dot_graph(
+                generate_dot_graph,
                 selected_arguments,
                 True,
                 dot_layout,
@@ -355,35 +336,12 @@ def create_visualization(
         # Add highlighting for selected fixes
         # print(attacks)
         if selected_fix:
-            dot_source = highlight_critical_edges(dot_source, selected_fix)
+            highlight_critical_edges(dot_graph, selected_fix)
             
             if apply_fix_switch:  # Switch is turned ON
-                # Convert selected_fix from list of lists to the format "(A,B)"
-                selected_fix_strings = {f"({fix[0]},{fix[1]})" for fix in selected_fix}
-                
-                # Parse attacks string properly - split by lines and filter out selected fixes
-                import re
-                attack_lines = attacks.strip().split('\n')
-                fixed_attacks_lines = []
-                
-                for line in attack_lines:
-                    line = line.strip()
-                    if line and line not in selected_fix_strings:
-                        fixed_attacks_lines.append(line)
-                
-                # Join the remaining attacks with newlines
-                fixed_attacks_str = '\n'.join(fixed_attacks_lines)
-                
-                # print(fixed_attacks_str)
-                try:
-                    fixed_arg_framework = read_argumentation_framework(arguments, fixed_attacks_str)
-                    dot_source = recalculate_fixed_args(fixed_arg_framework, dot_source)
-                except ValueError as e:
-                    # If there's an error creating the fixed framework (e.g., invalid attacks),
-                    # fall back to using the original framework
-                    print(f"Warning: Could not create fixed framework: {e}")
-                    # Continue with the original dot_source without applying fixes
-                    pass
+                # Recalculate the numbering without the attacks of the fix, in the cached framework of this session
+                fixed_arg_framework = session.get_fixed_argumentation_framework(selected_fix)
+                recalculate_fixed_args(fixed_arg_framework, dot_graph)
     # ========================== Semantics Session ==========================
     else:
         if selected_arguments == {}:
@@ -391,35 +349,29 @@ def create_visualization(
                 if layout_freeze:
                     # When freezing, use current dot source or generate a new one if none exists
                     if current_dot_source is None:
-                        dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                        frozen_dot_source = session.get_dot_string(generate_plain_dot_graph, dot_layout, raw_json)
                     else:
-                        dot_source = current_dot_source
-                    os.makedirs("temp", exist_ok=True)
-                    with open("temp/layout.dot", "w") as dot_file:
-                        dot_file.write(dot_source)
-                    # Generate position information
-                    subprocess.run(
-                        ["dot", "-Tplain", "temp/layout.dot", "-o", "temp/layout.txt"],
-                        check=True,
-                    )
+                        frozen_dot_source = current_dot_source
+                    # Lay out the current graph in memory and keep its positions in the session
+                    layout_token = session.freeze_layout(frozen_dot_source)
                     # Immediately update dot source with position information
-                    dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json, layout_file="temp/layout.txt")
+                    dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json, layout_token=layout_token)
                 else:
                     # When unfreezing, generate new layout without saving
-                    dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                    dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json)
             elif layout_freeze:
                 # If layout is frozen, use the existing dot source with saved positions
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json, layout_file="temp/layout.txt")
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json, layout_token=layout_token)
             else:
                 # If not frozen, generate new layout without saving
-                dot_source = generate_plain_dot_string(arg_framework, dot_layout, raw_json)
+                dot_graph = session.get_dot_graph(generate_plain_dot_graph, dot_layout, raw_json)
         else:
             if triggered_id == "layout-freeze-switch":
                 if layout_freeze:
                     # When freezing, use current dot source or generate a new one if none exists
                     if current_dot_source is None:
-                        dot_source = generate_dot_string(
-                            arg_framework,
+                        frozen_dot_source = session.get_dot_string(
+                            generate_dot_graph,
                             selected_arguments,
                             True,
                             dot_layout,
@@ -429,31 +381,25 @@ def create_visualization(
                             raw_json=raw_json,
                         )
                     else:
-                        dot_source = current_dot_source
-                    os.makedirs("temp", exist_ok=True)
-                    with open("temp/layout.dot", "w") as dot_file:
-                        dot_file.write(dot_source)
-                    # Generate position information
-                    subprocess.run(
-                        ["dot", "-Tplain", "temp/layout.dot", "-o", "temp/layout.txt"],
-                        check=True,
-                    )
+                        frozen_dot_source = current_dot_source
+                    # Lay out the current graph in memory and keep its positions in the session
+                    layout_token = session.freeze_layout(frozen_dot_source)
                     # Immediately update dot source with position information
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
                         dot_rank,
                         special_handling,
                         layout_freeze,
-                        layout_file="temp/layout.txt",
+                        layout_token=layout_token,
                         raw_json=raw_json,
                     )
                 else:
                     # When unfreezing, generate new layout without saving
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
@@ -468,21 +414,21 @@ def create_visualization(
             ):
                 if layout_freeze:
                     # If layout is frozen, use the existing dot source with saved positions
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
                         dot_rank,
                         special_handling,
                         layout_freeze,
-                        layout_file="temp/layout.txt",
+                        layout_token=layout_token,
                         raw_json=raw_json,
                     )
                 else:
                     # If not frozen, generate new layout without saving
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
@@ -498,21 +444,21 @@ def create_visualization(
             ):
                 if layout_freeze:
                     # If layout is frozen, use the existing dot source with saved positions
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
                         dot_rank,
                         special_handling,
                         layout_freeze,
-                        layout_file="temp/layout.txt",
+                        layout_token=layout_token,
                         raw_json=raw_json,
                     )
                 else:
                     # If not frozen, generate new layout without saving
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
@@ -528,21 +474,21 @@ def create_visualization(
             ]:
                 if layout_freeze:
                     # If layout is frozen, use the existing dot source with saved positions
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
                         dot_rank,
                         special_handling,
                         layout_freeze,
-                        layout_file="temp/layout.txt",
+                        layout_token=layout_token,
                         raw_json=raw_json,
                     )
                 else:
                     # If not frozen, generate new layout without saving
-                    dot_source = generate_dot_string(
-                        arg_framework,
+                    dot_graph = session.get_dot_graph(
+                        generate_dot_graph,
                         selected_arguments,
                         True,
                         dot_layout,
@@ -552,7 +498,8 @@ def create_visualization(
                         raw_json=raw_json,
                     )
 
-    return None, dot_source, selected_arguments_changed
+    dot_source = dot_graph.to_dot() if dot_graph is not None else None
+    return None, dot_source, selected_arguments_changed, layout_token if layout_freeze else None
 
 
 @callback(
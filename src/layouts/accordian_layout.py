@@ -12,6 +12,8 @@ def get_abstract_setting_specification_div():
             dcc.Store(id="selected-argument-store-abstract"),
             dcc.Store(id="selected_arguments_changed", data=None),
             dcc.Store(id="raw-json", data=None),
+            # Token of the frozen layout, whose node positions are kept server-side in the framework session
+            dcc.Store(id="layout-token-store", data=None),
             # Add modal for displaying example content
             dbc.Modal(
                 [
@@ -97,6 +99,11 @@ def get_abstract_setting_specification_div():
                                         value="",
                                         style={"height": "300px"},
                                     ),
+                                    dbc.FormFeedback(
+                                        id="abstract-attacks-feedback",
+                                        type="invalid",
+                                        style={"white-space": "pre-line"},
+                                    ),
                                 ]
                             ),
                         ],
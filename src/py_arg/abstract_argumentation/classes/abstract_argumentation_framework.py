@@ -1,13 +1,20 @@
-from typing import Optional, List
+import threading
+from typing import Dict, Optional, List
 
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.classes.compact_graph import CompactGraph
 from py_arg.abstract_argumentation.classes.defeat import Defeat
 
+# Frameworks may be shared between threads (e.g. callbacks of the
+# visualisation); the defeat indexes of a framework are built only once.
+_index_lock = threading.Lock()
+
 
 class AbstractArgumentationFramework:
     def __init__(self, name: str = '',
                  arguments: Optional[List[Argument]] = None,
-                 defeats: Optional[List[Defeat]] = None):
+                 defeats: Optional[List[Defeat]] = None,
+                 compact_graph: Optional[CompactGraph] = None):
         self.name = name
 
         if arguments is None:
@@ -16,10 +23,45 @@ class AbstractArgumentationFramework:
             self._arguments = {argument.name: argument
                                for argument in arguments}
 
+        # The defeats are copied (and only given out as copies), so that they
+        # can only be changed by add_defeat and remove_defeat, which keep the
+        # indexes and the compact graph up to date.
         if defeats is None:
             self._defeats = []
         else:
-            self._defeats = defeats
+            self._defeats = list(defeats)
+
+        # The defeat indexes are built on first use, so that frameworks that
+        # are only used through their compact graph never need them.
+        self._incoming_defeats: Dict[str, List[Defeat]] = {}
+        self._outgoing_defeats: Dict[str, List[Defeat]] = {}
+        self._is_indexed = False
+        # A compact graph of exactly these arguments and defeats (in this
+        # order) can be passed by readers that already built it.
+        self._compact_graph = compact_graph
+
+    def _ensure_indexed(self):
+        """
+        Build the per-argument indexes of incoming and outgoing defeats, keyed
+        by argument name and preserving the order of self._defeats, if this
+        was not done yet. The indexes are built aside and only then published,
+        so that other threads never see them half-built.
+        """
+        if self._is_indexed:
+            return
+        with _index_lock:
+            if self._is_indexed:
+                return
+            incoming_defeats: Dict[str, List[Defeat]] = {}
+            outgoing_defeats: Dict[str, List[Defeat]] = {}
+            for defeat in self._defeats:
+                incoming_defeats.setdefault(
+                    defeat.to_argument.name, []).append(defeat)
+                outgoing_defeats.setdefault(
+                    defeat.from_argument.name, []).append(defeat)
+            self._incoming_defeats = incoming_defeats
+            self._outgoing_defeats = outgoing_defeats
+            self._is_indexed = True
 
     def __repr__(self):
         return '( [' + ', '.join(argument.name
@@ -41,8 +83,8 @@ class AbstractArgumentationFramework:
         Defeats defeat it.
         :return: List of Defeats that defeat this argument.
         """
-        return [defeat for defeat in self._defeats
-                if defeat.to_argument == argument]
+        self._ensure_indexed()
+        return list(self._incoming_defeats.get(argument.name, []))
 
     def get_incoming_defeat_arguments(self, argument: Argument) -> List[
             Argument]:
@@ -74,8 +116,8 @@ class AbstractArgumentationFramework:
         Defeats originate from it.
         :return: List of Defeats coming from this argument.
         """
-        return [defeat for defeat in self._defeats
-                if defeat.from_argument == argument]
+        self._ensure_indexed()
+        return list(self._outgoing_defeats.get(argument.name, []))
 
     def get_outgoing_defeat_arguments(self, argument: Argument) -> List[
             Argument]:
@@ -120,7 +162,8 @@ class AbstractArgumentationFramework:
         >>> af.is_defeated(c)
         True
         """
-        return len(self.get_incoming_defeat_arguments(argument)) > 0
+        self._ensure_indexed()
+        return len(self._incoming_defeats.get(argument.name, [])) > 0
 
     def is_in_arguments(self, argument_name: str) -> bool:
         """
@@ -166,6 +209,130 @@ class AbstractArgumentationFramework:
                              '.')
         return self._arguments[argument_name]
 
+    def add_argument(self, argument: Argument):
+        """
+        Add an argument to the argumentation framework (if there is no argument
+        with the same name yet).
+
+        :param argument: The argument to add.
+
+        >>> a = Argument('a')
+        >>> af = AbstractArgumentationFramework('af', [], [])
+        >>> af.add_argument(a)
+        >>> af.is_in_arguments('a')
+        True
+        """
+        if argument.name not in self._arguments:
+            self._arguments[argument.name] = argument
+            self._compact_graph = None
+
+    def add_defeat(self, defeat: Defeat):
+        """
+        Add a defeat to the argumentation framework, keeping the incoming and
+        outgoing defeat indexes up to date. Both arguments of the defeat must
+        already be in the argumentation framework.
+
+        :param defeat: The defeat to add.
+
+        >>> a = Argument('a')
+        >>> b = Argument('b')
+        >>> af = AbstractArgumentationFramework('af', [a, b], [])
+        >>> af.add_defeat(Defeat(a, b))
+        >>> af.get_incoming_defeat_arguments(b)
+        [a]
+        >>> af.add_defeat(Defeat(a, Argument('c')))
+        Traceback (most recent call last):
+            ...
+        ValueError: Not a valid defeat, since one of the arguments does not \
+exist.
+        """
+        if not self.is_in_arguments(defeat.from_argument.name) or \
+                not self.is_in_arguments(defeat.to_argument.name):
+            raise ValueError('Not a valid defeat, since one of the arguments '
+                             'does not exist.')
+        self._ensure_indexed()
+        if defeat in self._outgoing_defeats.get(
+                defeat.from_argument.name, []):
+            return
+        self._defeats.append(defeat)
+        self._incoming_defeats.setdefault(
+            defeat.to_argument.name, []).append(defeat)
+        self._outgoing_defeats.setdefault(
+            defeat.from_argument.name, []).append(defeat)
+        self._compact_graph = None
+
+    def remove_defeat(self, defeat: Defeat):
+        """
+        Remove a defeat from the argumentation framework, keeping the incoming
+        and outgoing defeat indexes up to date.
+
+        :param defeat: The defeat to remove.
+
+        >>> a = Argument('a')
+        >>> b = Argument('b')
+        >>> af = AbstractArgumentationFramework('af', [a, b], [Defeat(a, b)])
+        >>> af.remove_defeat(Defeat(a, b))
+        >>> af.is_defeated(b)
+        False
+        >>> af.remove_defeat(Defeat(b, a))
+        Traceback (most recent call last):
+            ...
+        ValueError: There is no defeat (b, a).
+        """
+        self._ensure_indexed()
+        outgoing = self._outgoing_defeats.get(defeat.from_argument.name, [])
+        if defeat not in outgoing:
+            raise ValueError('There is no defeat ' + defeat.__repr__() + '.')
+        self._defeats.remove(defeat)
+        outgoing.remove(defeat)
+        self._incoming_defeats[defeat.to_argument.name].remove(defeat)
+        self._compact_graph = None
+
+    def remove_argument(self, argument: Argument):
+        """
+        Remove an argument from the argumentation framework, together with all
+        defeats from or to this argument.
+
+        :param argument: The argument to remove.
+
+        >>> a = Argument('a')
+        >>> b = Argument('b')
+        >>> af = AbstractArgumentationFramework('af', [a, b], [Defeat(a, b)])
+        >>> af.remove_argument(a)
+        >>> af.arguments, af.defeats, af.is_defeated(b)
+        ([b], [], False)
+        """
+        self.get_argument(argument.name)
+        for defeat in self.get_incoming_defeats(argument) + \
+                [defeat for defeat in self.get_outgoing_defeats(argument)
+                 if defeat.to_argument != argument]:
+            self.remove_defeat(defeat)
+        del self._arguments[argument.name]
+        self._compact_graph = None
+
+    @property
+    def compact_graph(self) -> CompactGraph:
+        """
+        Get the integer (CSR) representation of this argumentation framework.
+        It is built on first use and rebuilt after the framework changes.
+
+        :return: The CompactGraph of this argumentation framework.
+
+        >>> a = Argument('a')
+        >>> b = Argument('b')
+        >>> af = AbstractArgumentationFramework('af', [a, b], [Defeat(a, b)])
+        >>> list(af.compact_graph.predecessors(af.compact_graph.index_of['b']))
+        [0]
+        >>> af.add_defeat(Defeat(b, b))
+        >>> list(af.compact_graph.predecessors(1))
+        [0, 1]
+        """
+        compact_graph = self._compact_graph
+        if compact_graph is None:
+            compact_graph = CompactGraph(self.arguments, self._defeats)
+            self._compact_graph = compact_graph
+        return compact_graph
+
     @property
     def arguments(self):
         """
@@ -178,11 +345,18 @@ class AbstractArgumentationFramework:
     @property
     def defeats(self):
         """
-        Get a list of all defeats in this argumentation framework.
+        Get a list of all defeats in this argumentation framework. The list is
+        a copy: use add_defeat and remove_defeat to change the defeats.
 
         :return: A list of all defeats in this argumentation framework.
+
+        >>> a = Argument('a')
+        >>> af = AbstractArgumentationFramework('af', [a], [])
+        >>> af.defeats.append(Defeat(a, a))
+        >>> af.defeats, af.is_defeated(a)
+        ([], False)
         """
-        return self._defeats
+        return list(self._defeats)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
 class Argument:
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -15,4 +17,4 @@ class Argument:
         return self.name < other.name
 
     def __hash__(self):
-        return hash(str(self))
+        return hash(self.name)
@@ -0,0 +1,229 @@
+from array import array
+from typing import Dict, List
+
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.classes.defeat import Defeat
+
+
+class CompactGraph:
+    """
+    Integer view on the defeat graph of an argumentation framework. Arguments
+    are mapped to dense ids 0, ..., n - 1 (in the order of the framework's
+    arguments) and defeats are stored in compressed sparse row format: the
+    successors of argument i are
+    successor_targets[successor_offsets[i]:successor_offsets[i + 1]],
+    and likewise for predecessors. Within each row, the order of the original
+    defeats is preserved.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> graph = CompactGraph([a, b, c], [Defeat(a, b), Defeat(c, b),
+    ...                                  Defeat(b, a)])
+    >>> graph.index_of['b']
+    1
+    >>> list(graph.successors(0)), list(graph.predecessors(1))
+    ([1], [0, 2])
+    >>> graph.nr_of_defeats
+    3
+    """
+
+    def __init__(self, arguments: List[Argument], defeats: List[Defeat]):
+        self.arguments: List[Argument] = list(arguments)
+        self.index_of: Dict[str, int] = \
+            {argument.name: index
+             for index, argument in enumerate(self.arguments)}
+
+        sources = array('i')
+        targets = array('i')
+        for defeat in defeats:
+            try:
+                sources.append(self.index_of[defeat.from_argument.name])
+                targets.append(self.index_of[defeat.to_argument.name])
+            except KeyError:
+                raise ValueError('Not a valid defeat, since one of the '
+                                 'arguments does not exist.')
+        self._set_defeat_ids(sources, targets)
+
+    @classmethod
+    def from_defeat_ids(cls, arguments: List[Argument], sources: array,
+                        targets: array) -> 'CompactGraph':
+        """
+        Build the graph from the ids of the defeating (sources) and defeated
+        (targets) argument of each defeat, without looking up argument names.
+        Readers that already number the arguments use this to avoid a second
+        pass over the defeats.
+
+        >>> a, b = Argument('a'), Argument('b')
+        >>> graph = CompactGraph.from_defeat_ids([a, b], array('i', [0, 1]),
+        ...                                      array('i', [1, 1]))
+        >>> list(graph.predecessors(1))
+        [0, 1]
+        """
+        graph = cls.__new__(cls)
+        graph.arguments = list(arguments)
+        graph.index_of = {argument.name: index
+                          for index, argument in enumerate(graph.arguments)}
+        graph._set_defeat_ids(sources, targets)
+        return graph
+
+    def _set_defeat_ids(self, sources: array, targets: array):
+        self.successor_offsets, self.successor_targets = \
+            self._to_csr(sources, targets)
+        self.predecessor_offsets, self.predecessor_targets = \
+            self._to_csr(targets, sources)
+
+    def _to_csr(self, rows: array, columns: array):
+        nr_of_arguments = len(self.arguments)
+        offsets = array('i', [0]) * (nr_of_arguments + 1)
+        for row in rows:
+            offsets[row + 1] += 1
+        for index in range(nr_of_arguments):
+            offsets[index + 1] += offsets[index]
+
+        entries = array('i', [0]) * len(columns)
+        next_position = offsets[:-1]
+        for row, column in zip(rows, columns):
+            entries[next_position[row]] = column
+            next_position[row] += 1
+        return offsets, entries
+
+    def __len__(self):
+        return len(self.arguments)
+
+    @property
+    def nr_of_defeats(self) -> int:
+        return len(self.successor_targets)
+
+    def successors(self, index: int) -> array:
+        """
+        Get the ids of the arguments defeated by the argument with this id.
+        """
+        return self.successor_targets[self.successor_offsets[index]:
+                                      self.successor_offsets[index + 1]]
+
+    def predecessors(self, index: int) -> array:
+        """
+        Get the ids of the arguments defeating the argument with this id.
+        """
+        return self.predecessor_targets[self.predecessor_offsets[index]:
+                                        self.predecessor_offsets[index + 1]]
+
+    def out_degree(self, index: int) -> int:
+        return self.successor_offsets[index + 1] - \
+            self.successor_offsets[index]
+
+    def in_degree(self, index: int) -> int:
+        return self.predecessor_offsets[index + 1] - \
+            self.predecessor_offsets[index]
+
+    def is_self_defeating(self, index: int) -> bool:
+        return index in self.successors(index)
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """
+        Get the strongly connected components of the defeat graph, in
+        topological order: if an argument in one component defeats an
+        argument in another component, the first component comes first.
+        Computed by an iterative version of Tarjan's algorithm, in time
+        O(|arguments| + |defeats|).
+
+        :return: List of components, each a list of argument ids.
+
+        >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), \\
+        ...     Argument('d')
+        >>> graph = CompactGraph([a, b, c, d], [Defeat(c, a), Defeat(a, b),
+        ...                                     Defeat(b, a), Defeat(b, d)])
+        >>> graph.strongly_connected_components()
+        [[2], [0, 1], [3]]
+        """
+        nr_of_arguments = len(self.arguments)
+        order = [-1] * nr_of_arguments
+        low_link = [0] * nr_of_arguments
+        on_stack = [False] * nr_of_arguments
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(nr_of_arguments):
+            if order[root] != -1:
+                continue
+            order[root] = low_link[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            # Each call frame is an argument and the position of the next
+            # successor to visit.
+            call_stack = [(root, self.successor_offsets[root])]
+            while call_stack:
+                index, position = call_stack[-1]
+                if position < self.successor_offsets[index + 1]:
+                    call_stack[-1] = (index, position + 1)
+                    successor = self.successor_targets[position]
+                    if order[successor] == -1:
+                        order[successor] = low_link[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = True
+                        call_stack.append(
+                            (successor, self.successor_offsets[successor]))
+                    elif on_stack[successor]:
+                        low_link[index] = min(low_link[index],
+                                              order[successor])
+                    continue
+
+                call_stack.pop()
+                if call_stack:
+                    parent = call_stack[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[index])
+                if low_link[index] == order[index]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == index:
+                            break
+                    components.append(sorted(component))
+
+        # Tarjan's algorithm finds the components in reverse topological
+        # order.
+        components.reverse()
+        return components
+
+    def weakly_connected_components(self) -> List[List[int]]:
+        """
+        Get the weakly connected components of the defeat graph: the maximal
+        sets of arguments that are connected by defeats in either direction.
+
+        :return: List of components, each a sorted list of argument ids,
+            ordered by their smallest id.
+
+        >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), \\
+        ...     Argument('d')
+        >>> graph = CompactGraph([a, b, c, d], [Defeat(c, a), Defeat(d, d)])
+        >>> graph.weakly_connected_components()
+        [[0, 2], [1], [3]]
+        """
+        component_of = [-1] * len(self.arguments)
+        components = []
+        for root in range(len(self.arguments)):
+            if component_of[root] != -1:
+                continue
+            component_of[root] = len(components)
+            component = [root]
+            stack = [root]
+            while stack:
+                index = stack.pop()
+                for neighbour in self.successors(index) + \
+                        self.predecessors(index):
+                    if component_of[neighbour] == -1:
+                        component_of[neighbour] = len(components)
+                        component.append(neighbour)
+                        stack.append(neighbour)
+            components.append(sorted(component))
+        return components
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
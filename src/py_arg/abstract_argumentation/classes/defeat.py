@@ -2,6 +2,8 @@ from py_arg.abstract_argumentation.classes.argument import Argument
 
 
 class Defeat:
+    __slots__ = ('from_argument', 'to_argument')
+
     def __init__(self, from_argument: Argument, to_argument: Argument):
         self.from_argument = from_argument
         self.to_argument = to_argument
@@ -23,4 +25,4 @@ class Defeat:
             self.to_argument == other.to_argument
 
     def __hash__(self):
-        return hash(str(self))
+        return hash((self.from_argument, self.to_argument))
@@ -0,0 +1,234 @@
+from typing import Dict, FrozenSet, Iterable, List, Set, TypeVar
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.explanation.reachability_index import \
+    get_reachability_index
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    sufficient_sets_solver import SufficientSetsSolver
+from py_arg.utils.bitset import iterate_bits, to_bitset
+
+T = TypeVar('T', bound=Argument)
+
+
+class ExplanationEngine:
+    """
+    Explanations for all arguments of an argumentation framework with respect
+    to the same extensions. The artifacts that explanations of different
+    arguments share are computed once and kept as bitsets over compact graph
+    ids: the arguments reaching each argument by odd and even attack paths,
+    and the extensions. Each explanation then follows from a few bitset
+    operations, instead of recomputing these artifacts per argument.
+    Sufficient and necessary arguments are found by a single clingo solver
+    (see SufficientSetsSolver), which is grounded once for all arguments.
+
+    The results are the same as those of the per-argument explanation
+    functions (get_defending_arguments_in_extensions and so on).
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c, d], [Defeat(a, b), Defeat(b, c), Defeat(c, d)])
+    >>> engine = ExplanationEngine(af, [frozenset({a, c})])
+    >>> [sorted(defending) for defending in engine.get_defending(c)]
+    [[a]]
+    >>> sorted(engine.get_necessary(c))
+    [a]
+    >>> [sorted(attackers)
+    ...  for attackers in engine.get_attackers_without_defense(d)]
+    [[a, c]]
+    """
+
+    def __init__(self, argumentation_framework: AbstractArgumentationFramework,
+                 extensions: Iterable[FrozenSet[T]]):
+        """
+        :param argumentation_framework: The argumentation framework the
+            explanations should be about.
+        :param extensions: The extensions (sets of accepted arguments) of the
+            argumentation framework.
+        """
+        self.argumentation_framework = argumentation_framework
+        graph = argumentation_framework.compact_graph
+        self._graph = graph
+        self._arguments = graph.arguments
+
+        reachability_index = get_reachability_index(argumentation_framework)
+        self._odd_reaching_masks: List[int] = []
+        self._even_reaching_masks: List[int] = []
+        for argument in self._arguments:
+            odd_mask, even_mask = \
+                reachability_index.get_reaching_bitsets(argument)
+            self._odd_reaching_masks.append(odd_mask)
+            self._even_reaching_masks.append(even_mask)
+        self._defeater_masks = [to_bitset(graph.predecessors(index))
+                                for index in range(len(graph))]
+
+        self._extension_masks = [self._to_mask(extension)
+                                 for extension in extensions]
+        # For each argument, the bitset of (positions of) the extensions that
+        # contain it.
+        self._membership_masks = [0] * len(graph)
+        for position, extension_mask in enumerate(self._extension_masks):
+            for index in iterate_bits(extension_mask):
+                self._membership_masks[index] |= 1 << position
+
+        self._sufficient_sets_solver = None
+
+    def _to_mask(self, arguments: Iterable[T]) -> int:
+        return to_bitset(self._graph.index_of[argument.name]
+                         for argument in arguments)
+
+    def _to_arguments(self, mask: int) -> Set[T]:
+        return {self._arguments[index] for index in iterate_bits(mask)}
+
+    def _get_sufficient_sets_solver(self) -> SufficientSetsSolver:
+        if self._sufficient_sets_solver is None:
+            self._sufficient_sets_solver = SufficientSetsSolver()
+        return self._sufficient_sets_solver
+
+    def _get_extension_masks_with(self, index: int) -> List[int]:
+        return [self._extension_masks[position]
+                for position in iterate_bits(self._membership_masks[index])]
+
+    def _get_extension_masks_without(self, index: int) -> List[int]:
+        return [extension_mask
+                for position, extension_mask in
+                enumerate(self._extension_masks)
+                if not self._membership_masks[index] >> position & 1]
+
+    def _get_distinct_sets(self, masks: Iterable[int]) -> List[Set[T]]:
+        distinct_masks = list(dict.fromkeys(masks))
+        return [self._to_arguments(mask) for mask in distinct_masks]
+
+    def get_defending(self, argument: T) -> List[Set[T]]:
+        """
+        For each extension with the argument, the arguments from the
+        extension that (in)directly defend the argument (Defending).
+        """
+        index = self._graph.index_of[argument.name]
+        defending_mask = self._even_reaching_masks[index]
+        return self._get_distinct_sets(
+            defending_mask & extension_mask
+            for extension_mask in self._get_extension_masks_with(index))
+
+    def get_directly_defending(self, argument: T) -> List[Set[T]]:
+        """
+        For each extension with the argument, the arguments from the
+        extension that directly defend the argument (DirDefending).
+        """
+        index = self._graph.index_of[argument.name]
+        directly_defending_mask = 0
+        for attacker in iterate_bits(self._defeater_masks[index]):
+            directly_defending_mask |= self._defeater_masks[attacker]
+        return self._get_distinct_sets(
+            directly_defending_mask & extension_mask
+            for extension_mask in self._get_extension_masks_with(index))
+
+    def get_attackers_without_defense(self, argument: T) -> \
+            Set[FrozenSet[T]]:
+        """
+        For each extension, the arguments that (in)directly attack the
+        argument and to which the extension provides no defense
+        (NoDefAgainst).
+        """
+        index = self._graph.index_of[argument.name]
+        attackers = list(iterate_bits(self._odd_reaching_masks[index]))
+        result = set()
+        for extension_mask in self._extension_masks:
+            result.add(frozenset(
+                self._arguments[attacker] for attacker in attackers
+                if not self._odd_reaching_masks[attacker] & extension_mask))
+        return result
+
+    def get_no_dir_defending(self, argument: T) -> List[Set[T]]:
+        """
+        For each extension without the argument, the arguments that directly
+        attack the argument and to which the extension provides no direct
+        defense (NoDirDefense).
+        """
+        index = self._graph.index_of[argument.name]
+        attackers = list(iterate_bits(self._defeater_masks[index]))
+        return self._get_distinct_sets(
+            to_bitset(attacker for attacker in attackers
+                      if not self._defeater_masks[attacker] & extension_mask)
+            for extension_mask in self._get_extension_masks_without(index))
+
+    def get_no_self_defense(self, argument: T) -> List[Set[T]]:
+        """
+        For each set of attackers without defense, the attackers that the
+        argument does not (in)directly attack either (NoSelfDefense).
+        """
+        index = self._graph.index_of[argument.name]
+        return self._get_distinct_sets(
+            self._to_mask(attacker
+                          for attacker in attackers
+                          if not self._odd_reaching_masks[
+                              self._graph.index_of[attacker.name]] >>
+                          index & 1)
+            for attackers in self.get_attackers_without_defense(argument))
+
+    def get_sufficient(self, argument: T) -> List[Set[T]]:
+        """
+        The sets of arguments that are sufficient for the acceptance of the
+        argument (Suff).
+        """
+        return self._get_sufficient_sets_solver().get_sufficient_sets(
+            self.argumentation_framework, argument)
+
+    def get_minimal_sufficient(self, argument: T) -> List[Set[T]]:
+        """
+        The subset-minimal sets of arguments that are sufficient for the
+        acceptance of the argument (MinSuff).
+        """
+        return self._get_sufficient_sets_solver().get_sufficient_sets(
+            self.argumentation_framework, argument, minimal=True)
+
+    def get_necessary(self, argument: T) -> List[T]:
+        """
+        The arguments that are necessary for the acceptance of the argument
+        (Nec): those in each sufficient set.
+        """
+        return list(
+            self._get_sufficient_sets_solver().get_necessary_arguments(
+                self.argumentation_framework, argument))
+
+    def get_explanation(self, argument: T, explanation_function: str):
+        """
+        Get the explanation of the argument for the given explanation
+        function.
+        """
+        if explanation_function == 'Defending':
+            return self.get_defending(argument)
+        if explanation_function == 'DirDefending':
+            return self.get_directly_defending(argument)
+        if explanation_function == 'Suff':
+            return self.get_sufficient(argument)
+        if explanation_function == 'MinSuff':
+            return self.get_minimal_sufficient(argument)
+        if explanation_function == 'Nec':
+            return self.get_necessary(argument)
+        if explanation_function == 'NoDefAgainst':
+            return self.get_attackers_without_defense(argument)
+        if explanation_function == 'NoDirDefense':
+            return self.get_no_dir_defending(argument)
+        if explanation_function == 'NoSelfDefense':
+            return self.get_no_self_defense(argument)
+        raise ValueError('Unknown explanation function ' +
+                         explanation_function + '.')
+
+    def get_explanations(self, arguments: Iterable[T],
+                         explanation_function: str) -> Dict[str, object]:
+        """
+        Get, for each of the arguments (by name), its explanation for the
+        given explanation function.
+        """
+        return {str(argument): self.get_explanation(argument,
+                                                    explanation_function)
+                for argument in arguments}
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -1,52 +1,26 @@
-from typing import TypeVar, FrozenSet, Set, Dict
+from typing import TypeVar, FrozenSet, Set
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
-from py_arg.abstract_argumentation.explanation.\
-    get_reachable_arguments_and_distances import \
-    get_reachable_arguments_and_distances
+from py_arg.abstract_argumentation.explanation.reachability_index import \
+    get_reachability_index
 
 T = TypeVar('T', bound=Argument)
 
 
-def _is_reachable_by_odd_path(distance_set: set[int]) -> bool:
-    """
-    Check if there is some even path in the distance_set.
-    """
-    return any(distance % 2 for distance in distance_set)
-
-
-def get_reachable_by_odd_path(
-        reachable_arguments: Set[T],
-        distance_dictionary: Dict[T, Set[int]]
-) -> Set[T]:
-    return {
-        other_argument for other_argument in reachable_arguments
-        if _is_reachable_by_odd_path(distance_dictionary[other_argument])
-    }
-
-
 def get_attackers_without_defense_in_extension(
         argumentation_framework: AbstractArgumentationFramework,
         argument: T,
         extension: FrozenSet[T]
 ) -> Set[T]:
-    reachable_arguments, distance_dict = get_reachable_arguments_and_distances(
-        argumentation_framework, argument)
-    reachable_by_odd_from_a = get_reachable_by_odd_path(
-        reachable_arguments, distance_dict)
-
-    result = set()
-    for candidate_attacker in reachable_by_odd_from_a:
-        reachable_from_attacker, distance_dict_from_attacker = \
-            get_reachable_arguments_and_distances(argumentation_framework,
-                                                  candidate_attacker)
-        reachable_by_odd_from_b = get_reachable_by_odd_path(
-            reachable_from_attacker, distance_dict_from_attacker)
-        if not extension.intersection(reachable_by_odd_from_b):
-            result.add(candidate_attacker)
-    return result
+    reachability_index = get_reachability_index(argumentation_framework)
+    return {candidate_attacker
+            for candidate_attacker in
+            reachability_index.get_reaching_by_odd_path(argument)
+            if not extension.intersection(
+                reachability_index.get_reaching_by_odd_path(
+                    candidate_attacker))}
 
 
 def get_attackers_without_defense_in_extensions(
@@ -67,23 +41,16 @@ def get_attackers_without_defense_in_extensions(
         extensions, containing the arguments that
         attack the argument and to which the extension provides to defense.
     """
-    reachable_arguments, distance = get_reachable_arguments_and_distances(
-        argumentation_framework, argument)
-    reachable_by_odd_from_a = get_reachable_by_odd_path(
-        reachable_arguments, distance)
+    reachability_index = get_reachability_index(argumentation_framework)
+    attackers = reachability_index.get_reaching_by_odd_path(argument)
 
     result = set()
     for extension in extensions:
-        not_defending_for_extension = set()
-        for candidate_attacker in reachable_by_odd_from_a:
-            reachable_from_attacker, distance_dict_from_attacker = \
-                get_reachable_arguments_and_distances(
-                    argumentation_framework, candidate_attacker)
-            reachable_by_odd_from_b = get_reachable_by_odd_path(
-                reachable_from_attacker, distance_dict_from_attacker)
-            if not extension.intersection(reachable_by_odd_from_b):
-                not_defending_for_extension.add(candidate_attacker)
-        not_defending_for_extension = frozenset(not_defending_for_extension)
+        not_defending_for_extension = frozenset(
+            candidate_attacker for candidate_attacker in attackers
+            if not extension.intersection(
+                reachability_index.get_reaching_by_odd_path(
+                    candidate_attacker)))
         result.add(not_defending_for_extension)
     return result
 
@@ -148,19 +115,12 @@ def get_no_self_defense(
     not_defending = get_attackers_without_defense_in_extensions(
         argumentation_framework, argument, extensions)
 
+    reachability_index = get_reachability_index(argumentation_framework)
     not_dir_defending_sets = []
     for not_def_ext in not_defending:
         not_ddef_ext = set()
         for attacker in not_def_ext:
-            reachable_attacker, distance_attacker = \
-                get_reachable_arguments_and_distances(
-                    argumentation_framework, attacker)
-            defenders = set()
-            for pot_defender in reachable_attacker:
-                dist_pot_def = distance_attacker[pot_defender]
-                for dist in dist_pot_def:
-                    if dist % 2:
-                        defenders.add(pot_defender)
+            defenders = reachability_index.get_reaching_by_odd_path(attacker)
             if argument not in defenders:
                 not_ddef_ext.add(attacker)
         if not_ddef_ext not in not_dir_defending_sets:
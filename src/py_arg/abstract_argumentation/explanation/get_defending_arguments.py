@@ -1,32 +1,14 @@
-from typing import TypeVar, FrozenSet, Set, List, Dict
+from typing import TypeVar, FrozenSet, Set, List
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
-from py_arg.abstract_argumentation.explanation.\
-    get_reachable_arguments_and_distances import \
-    get_reachable_arguments_and_distances
+from py_arg.abstract_argumentation.explanation.reachability_index import \
+    get_reachability_index
 
 T = TypeVar('T', bound=Argument)
 
 
-def _is_reachable_by_even_path(distance_set: set[int]) -> bool:
-    """
-    Check if there is some even path in the distance_set.
-    """
-    return any(not distance % 2 for distance in distance_set)
-
-
-def get_reachable_by_even_path(
-        reachable_arguments: Set[T],
-        distance_dictionary: Dict[T, Set[int]]
-) -> Set[T]:
-    return {
-        other_argument for other_argument in reachable_arguments
-        if _is_reachable_by_even_path(distance_dictionary[other_argument])
-    }
-
-
 def get_defending_arguments(
         argumentation_framework: AbstractArgumentationFramework,
         argument: T) -> Set[T]:
@@ -38,9 +20,8 @@ def get_defending_arguments(
     :param argument: The argument for which we need an explanation.
     :return: The set of arguments that defends the argument.
     """
-    reachable_arguments, distance_dict = get_reachable_arguments_and_distances(
-        argumentation_framework, argument)
-    return get_reachable_by_even_path(reachable_arguments, distance_dict)
+    return get_reachability_index(
+        argumentation_framework).get_reaching_by_even_path(argument)
 
 
 def get_defending_arguments_in_extension(
@@ -121,13 +102,12 @@ def get_directly_defending_arguments(
         extensions, containing the arguments from the
         extension that directly defend the argument.
     """
-    reachable_arguments, distance_dict = get_reachable_arguments_and_distances(
-        argumentation_framework, argument)
-
     directly_defending_arguments = {
-        other_argument for other_argument in reachable_arguments
-        if any(distance == 2 for distance in distance_dict[other_argument])
-    }
+        defender
+        for attacker in
+        argumentation_framework.get_incoming_defeat_arguments(argument)
+        for defender in
+        argumentation_framework.get_incoming_defeat_arguments(attacker)}
 
     directly_defending_sets = []
     for extension in extensions:
@@ -0,0 +1,75 @@
+from array import array
+from typing import Dict, List, Optional
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.classes.compact_graph import CompactGraph
+from py_arg.abstract_argumentation.classes.defeat import Defeat
+
+
+class ArgumentationFrameworkBuilder:
+    """
+    Incrementally collect the arguments and defeats of an argumentation
+    framework, as read by a streaming reader. Each argument name is mapped to
+    a single Argument object and a dense id, and defeats are stored as pairs
+    of ids in compact arrays, so that the compact graph of the framework can
+    be built directly.
+
+    >>> builder = ArgumentationFrameworkBuilder()
+    >>> a, b = builder.add_argument('a'), builder.add_argument('b')
+    >>> builder.add_defeat(a, b)
+    >>> af = builder.build('af')
+    >>> af
+    ( [a, b], [(a, b)] )
+    >>> af.defeats[0].from_argument is af.arguments[0]
+    True
+    """
+
+    def __init__(self):
+        self.arguments: List[Argument] = []
+        self.id_by_name: Dict[str, int] = {}
+        self._sources = array('i')
+        self._targets = array('i')
+
+    def add_argument(self, name: str) -> int:
+        """
+        Add the argument with this name, unless it was added already.
+
+        :param name: The name of the argument.
+        :return: The id of the argument.
+        """
+        argument_id = self.id_by_name.get(name)
+        if argument_id is None:
+            argument_id = len(self.arguments)
+            self.id_by_name[name] = argument_id
+            self.arguments.append(Argument(name))
+        return argument_id
+
+    def get_argument_id(self, name: str) -> Optional[int]:
+        return self.id_by_name.get(name)
+
+    def add_defeat(self, from_argument_id: int, to_argument_id: int):
+        self._sources.append(from_argument_id)
+        self._targets.append(to_argument_id)
+
+    def build(self, name: str = '') -> AbstractArgumentationFramework:
+        """
+        Get the argumentation framework with all arguments and defeats added
+        so far, with its compact graph already built.
+        """
+        arguments = self.arguments
+        defeats = [Defeat(arguments[from_argument_id],
+                          arguments[to_argument_id])
+                   for from_argument_id, to_argument_id in
+                   zip(self._sources, self._targets)]
+        compact_graph = CompactGraph.from_defeat_ids(
+            arguments, self._sources, self._targets)
+        return AbstractArgumentationFramework(name, arguments, defeats,
+                                              compact_graph)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
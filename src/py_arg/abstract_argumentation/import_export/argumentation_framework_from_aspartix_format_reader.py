@@ -1,11 +1,21 @@
-from typing import Optional
-
-import parse
+import io
+import re
+from typing import Iterable, Optional
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
-from py_arg.abstract_argumentation.classes.argument import Argument
-from py_arg.abstract_argumentation.classes.defeat import Defeat
+from py_arg.abstract_argumentation.import_export.\
+    argumentation_framework_builder import ArgumentationFrameworkBuilder
+
+# An argument name: a quoted string (quotes are not part of the name) or a
+# constant without separators.
+_NAME = r'\s*(?:"((?:[^"\\]|\\.)*)"|([^\s",()]+))\s*'
+_STATEMENT = re.compile(
+    r'\s*(arg|att)\(' + _NAME + r'(?:,' + _NAME + r')?\)\s*\.\s*')
+
+
+def _get_name(quoted_name: Optional[str], name: Optional[str]) -> str:
+    return name if quoted_name is None else quoted_name
 
 
 class ArgumentationFrameworkFromASPARTIXFormatReader:
@@ -13,16 +23,74 @@ class ArgumentationFrameworkFromASPARTIXFormatReader:
     def from_apx(apx_str: str,
                  argumentation_framework_name: Optional[str] = None) -> \
             AbstractArgumentationFramework:
-        if argumentation_framework_name:
-            name = argumentation_framework_name
-        else:
-            name = ''
-
-        argument_strs = [r[0] for r in parse.findall('arg({}).', apx_str)]
-        defeat_strs = [(r[0], r[1]) for r in parse.findall('att({},{}).',
-                                                           apx_str)]
-
-        arguments = [Argument(arg_str) for arg_str in argument_strs]
-        defeats = [Defeat(Argument(defeat_str[0]), Argument(defeat_str[1]))
-                   for defeat_str in defeat_strs]
-        return AbstractArgumentationFramework(name, arguments, defeats)
+        return ArgumentationFrameworkFromASPARTIXFormatReader.from_lines(
+            io.StringIO(apx_str), argumentation_framework_name)
+
+    @staticmethod
+    def from_file(path: str,
+                  argumentation_framework_name: Optional[str] = None) -> \
+            AbstractArgumentationFramework:
+        with open(path) as apx_file:
+            return ArgumentationFrameworkFromASPARTIXFormatReader.from_lines(
+                apx_file, argumentation_framework_name)
+
+    @staticmethod
+    def from_lines(lines: Iterable[str],
+                   argumentation_framework_name: Optional[str] = None) -> \
+            AbstractArgumentationFramework:
+        """
+        Read an argumentation framework in ASPARTIX format (arg(a). and
+        att(a,b). statements) line by line, so that a file or stream does not
+        have to be in memory as a whole. Lines starting with # or % are
+        comments; blank lines and extra whitespace are ignored. Names may be
+        quoted, as written by ArgumentationFrameworkToASPARTIXFormatWriter.
+        Arguments keep the order in which they first occur.
+
+        :param lines: The lines to read, e.g. an open file.
+        :param argumentation_framework_name: Optional name of the framework.
+        :return: The argumentation framework.
+
+        >>> ArgumentationFrameworkFromASPARTIXFormatReader.from_lines(
+        ...     ['% Example', 'arg(a). arg("b").', 'att(a, "b"). ', 'arg(c).'])
+        ( [a, b, c], [(a, b)] )
+        """
+        builder = ArgumentationFrameworkBuilder()
+        declared_ids = set()
+        for line_number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line or line.startswith('#') or line.startswith('%'):
+                continue
+            position = 0
+            while position < len(line):
+                match = _STATEMENT.match(line, position)
+                if match is None:
+                    raise ValueError(f'Line {line_number} is not a valid '
+                                     f'statement: {line[position:]}')
+                position = match.end()
+                kind, quoted_from, from_name, quoted_to, to_name = \
+                    match.groups()
+                from_argument_id = builder.add_argument(
+                    _get_name(quoted_from, from_name))
+                if kind == 'arg' and quoted_to is None and to_name is None:
+                    declared_ids.add(from_argument_id)
+                elif kind == 'att' and not (quoted_to is None and
+                                            to_name is None):
+                    builder.add_defeat(from_argument_id, builder.add_argument(
+                        _get_name(quoted_to, to_name)))
+                else:
+                    raise ValueError(f'Line {line_number} is not a valid '
+                                     f'statement: {match.group().strip()}')
+
+        if len(declared_ids) < len(builder.arguments):
+            undeclared = [argument.name
+                          for index, argument in enumerate(builder.arguments)
+                          if index not in declared_ids]
+            raise ValueError('Not a valid defeat, since these arguments do '
+                             'not exist: ' + ', '.join(undeclared) + '.')
+        return builder.build(argumentation_framework_name or '')
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -1,9 +1,10 @@
-from typing import Optional
+import io
+from typing import Iterable, Optional
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
-from py_arg.abstract_argumentation.classes.argument import Argument
-from py_arg.abstract_argumentation.classes.defeat import Defeat
+from py_arg.abstract_argumentation.import_export.\
+    argumentation_framework_builder import ArgumentationFrameworkBuilder
 
 
 class ArgumentationFrameworkFromICCMA23FormatReader:
@@ -11,19 +12,70 @@ class ArgumentationFrameworkFromICCMA23FormatReader:
     def from_iccma23(iccma_23_str: str,
                      argumentation_framework_name: Optional[str] = None) -> \
             AbstractArgumentationFramework:
-        if argumentation_framework_name:
-            name = argumentation_framework_name
-        else:
-            name = ''
-
-        lines = iccma_23_str.split('\n')
-        nr_argument_lines = int(lines[0].split(' ')[2])
-        arguments = [Argument('A' + str(index))
-                     for index in range(1, nr_argument_lines + 1)]
-        defeats = []
-        for line in lines[1:]:
-            if line:
-                defeat_parts = line.split(' ')
-                defeats.append(Defeat(Argument('A' + defeat_parts[0]),
-                                      Argument('A' + defeat_parts[1])))
-        return AbstractArgumentationFramework(name, arguments, defeats)
+        return ArgumentationFrameworkFromICCMA23FormatReader.from_lines(
+            io.StringIO(iccma_23_str), argumentation_framework_name)
+
+    @staticmethod
+    def from_file(path: str,
+                  argumentation_framework_name: Optional[str] = None) -> \
+            AbstractArgumentationFramework:
+        with open(path) as iccma_23_file:
+            return ArgumentationFrameworkFromICCMA23FormatReader.from_lines(
+                iccma_23_file, argumentation_framework_name)
+
+    @staticmethod
+    def from_lines(lines: Iterable[str],
+                   argumentation_framework_name: Optional[str] = None) -> \
+            AbstractArgumentationFramework:
+        """
+        Read an argumentation framework in ICCMA 2023 format ("p af n",
+        followed by one "i j" line per attack) line by line, so that a file
+        or stream does not have to be in memory as a whole. Lines starting
+        with # are comments; blank lines and extra whitespace are ignored.
+        Argument i is named Ai.
+
+        :param lines: The lines to read, e.g. an open file.
+        :param argumentation_framework_name: Optional name of the framework.
+        :return: The argumentation framework.
+
+        >>> ArgumentationFrameworkFromICCMA23FormatReader.from_lines(
+        ...     ['# Example', 'p af 3 ', '1 2', '', '2  3', '# End'])
+        ( [A1, A2, A3], [(A1, A2), (A2, A3)] )
+        """
+        builder = ArgumentationFrameworkBuilder()
+        nr_of_arguments = None
+        for line_number, line in enumerate(lines, start=1):
+            parts = line.split()
+            if not parts or parts[0].startswith('#'):
+                continue
+            try:
+                if nr_of_arguments is None:
+                    if len(parts) != 3 or parts[:2] != ['p', 'af']:
+                        raise ValueError
+                    nr_of_arguments = int(parts[2])
+                    for index in range(1, nr_of_arguments + 1):
+                        builder.add_argument('A' + str(index))
+                    continue
+                if len(parts) != 2:
+                    raise ValueError
+                from_argument_id = int(parts[0]) - 1
+                to_argument_id = int(parts[1]) - 1
+            except ValueError:
+                raise ValueError(f'Line {line_number} is not a valid header '
+                                 f'or attack: {line.strip()}')
+            if not 0 <= from_argument_id < nr_of_arguments or \
+                    not 0 <= to_argument_id < nr_of_arguments:
+                raise ValueError(f'Line {line_number} is not a valid attack, '
+                                 f'since one of the arguments does not '
+                                 f'exist: {line.strip()}')
+            builder.add_defeat(from_argument_id, to_argument_id)
+
+        if nr_of_arguments is None:
+            raise ValueError('The header "p af n" is missing.')
+        return builder.build(argumentation_framework_name or '')
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
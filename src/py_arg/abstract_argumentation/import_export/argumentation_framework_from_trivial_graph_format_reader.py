@@ -1,9 +1,10 @@
-from typing import Optional
+import io
+from typing import Iterable, Optional
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
-from py_arg.abstract_argumentation.classes.argument import Argument
-from py_arg.abstract_argumentation.classes.defeat import Defeat
+from py_arg.abstract_argumentation.import_export.\
+    argumentation_framework_builder import ArgumentationFrameworkBuilder
 
 
 class ArgumentationFrameworkFromTrivialGraphFormatReader:
@@ -11,25 +12,65 @@ class ArgumentationFrameworkFromTrivialGraphFormatReader:
     def from_tgf(tgf_str: str,
                  argumentation_framework_name: Optional[str] = None) -> \
             AbstractArgumentationFramework:
-        if argumentation_framework_name:
-            name = argumentation_framework_name
-        else:
-            name = ''
+        return ArgumentationFrameworkFromTrivialGraphFormatReader.from_lines(
+            io.StringIO(tgf_str), argumentation_framework_name)
 
-        arguments = []
-        defeats = []
+    @staticmethod
+    def from_file(path: str,
+                  argumentation_framework_name: Optional[str] = None) -> \
+            AbstractArgumentationFramework:
+        with open(path) as tgf_file:
+            return ArgumentationFrameworkFromTrivialGraphFormatReader.\
+                from_lines(tgf_file, argumentation_framework_name)
+
+    @staticmethod
+    def from_lines(lines: Iterable[str],
+                   argumentation_framework_name: Optional[str] = None) -> \
+            AbstractArgumentationFramework:
+        """
+        Read an argumentation framework in trivial graph format (one argument
+        per line, a line with only #, then one "a b" line per attack) line by
+        line, so that a file or stream does not have to be in memory as a
+        whole. Other lines starting with # are comments; blank lines and
+        extra whitespace are ignored. Anything after the name of an argument
+        is taken to be its label, and ignored.
 
-        lines = tgf_str.split('\n')
+        :param lines: The lines to read, e.g. an open file.
+        :param argumentation_framework_name: Optional name of the framework.
+        :return: The argumentation framework.
+
+        >>> ArgumentationFrameworkFromTrivialGraphFormatReader.from_lines(
+        ...     ['a', 'b Label of b', '', '#', '# Attacks', 'a  b '])
+        ( [a, b], [(a, b)] )
+        """
+        builder = ArgumentationFrameworkBuilder()
         hashtag_seen = False
-        for line in lines:
-            if line == '#':
+        for line_number, line in enumerate(lines, start=1):
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == '#' and len(parts) == 1:
                 hashtag_seen = True
-            else:
-                if not hashtag_seen:
-                    arguments.append(Argument(line))
-                else:
-                    if line:
-                        defeat_parts = line.split(' ')
-                        defeats.append(Defeat(Argument(defeat_parts[0]),
-                                              Argument(defeat_parts[1])))
-        return AbstractArgumentationFramework(name, arguments, defeats)
+                continue
+            if parts[0].startswith('#'):
+                continue
+            if not hashtag_seen:
+                builder.add_argument(parts[0])
+                continue
+            if len(parts) != 2:
+                raise ValueError(f'Line {line_number} is not a valid attack: '
+                                 f'{line.strip()}')
+            from_argument_id = builder.get_argument_id(parts[0])
+            to_argument_id = builder.get_argument_id(parts[1])
+            if from_argument_id is None or to_argument_id is None:
+                raise ValueError(f'Line {line_number} is not a valid attack, '
+                                 f'since one of the arguments does not '
+                                 f'exist: {line.strip()}')
+            builder.add_defeat(from_argument_id, to_argument_id)
+        return builder.build(argumentation_framework_name or '')
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
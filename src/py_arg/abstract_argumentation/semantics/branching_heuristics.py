@@ -0,0 +1,78 @@
+from typing import Callable, List
+
+from py_arg.abstract_argumentation.classes.compact_graph import CompactGraph
+from py_arg.utils.bitset import lowest_bit
+
+
+# A branching heuristic decides on which BLANK argument the recursive
+# labelling algorithm (see get_extensions_recursive) branches next. It gets
+# the compact graph of the argumentation framework once and returns a
+# selector, which maps a (nonzero) bitset of BLANK argument ids to the id of
+# the argument to branch on.
+
+Selector = Callable[[int], int]
+BranchingHeuristic = Callable[[CompactGraph], Selector]
+
+
+def first_blank(graph: CompactGraph) -> Selector:
+    """
+    Branch on the first BLANK argument (in the order of the argumentation
+    framework's arguments). This is the default.
+
+    >>> from py_arg.abstract_argumentation.classes.argument import Argument
+    >>> selector = first_blank(CompactGraph([Argument('a'), Argument('b')],
+    ...                                     []))
+    >>> selector(0b10)
+    1
+    """
+    return lowest_bit
+
+
+def max_attackers(graph: CompactGraph) -> Selector:
+    """
+    Branch on the BLANK argument with the most attackers, which tends to fix
+    the labels of many other arguments early.
+
+    >>> from py_arg.abstract_argumentation.classes.argument import Argument
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> graph = CompactGraph([a, b, c], [Defeat(a, b), Defeat(c, b),
+    ...                                  Defeat(b, c)])
+    >>> selector = max_attackers(graph)
+    >>> selector(0b111), selector(0b101)
+    (1, 2)
+    """
+    return _select_by_priority(
+        sorted(range(len(graph)), key=lambda index: -graph.in_degree(index)))
+
+
+def min_attackers(graph: CompactGraph) -> Selector:
+    """
+    Branch on the BLANK argument with the fewest attackers, so that the
+    arguments that are easiest to defend are decided first.
+
+    >>> from py_arg.abstract_argumentation.classes.argument import Argument
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> graph = CompactGraph([a, b, c], [Defeat(a, b), Defeat(c, b),
+    ...                                  Defeat(b, c), Defeat(b, a)])
+    >>> min_attackers(graph)(0b110)
+    2
+    """
+    return _select_by_priority(
+        sorted(range(len(graph)), key=graph.in_degree))
+
+
+def _select_by_priority(priority: List[int]) -> Selector:
+    def selector(blank_mask: int) -> int:
+        for index in priority:
+            if blank_mask >> index & 1:
+                return index
+        raise ValueError('There is no BLANK argument.')
+    return selector
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -1,13 +1,59 @@
-from typing import FrozenSet, Set
+import functools
+import pathlib
+import time
+from typing import FrozenSet, Set, Dict, Optional, Tuple, Iterator
 
 import clingo
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.acceptance_strategy import \
+    AcceptanceStrategy
+
+
+PATH_TO_ENCODINGS = pathlib.Path(__file__).parent / 'encodings'
+
+
+@functools.lru_cache(maxsize=None)
+def read_encoding(encoding_file_name: str) -> str:
+    """
+    Get the text of an encoding in the encodings folder. Each encoding is only
+    read from disk once per process.
+    """
+    return (PATH_TO_ENCODINGS / encoding_file_name).read_text()
+
+
+def get_argumentation_framework_program(
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        Tuple[Dict[str, str], Dict[str, str], str]:
+    """
+    Translate an argumentation framework to arg/1 and att/2 facts, using ids
+    a0, a1, ... for its arguments.
+
+    :param argumentation_framework: The argumentation framework to translate.
+    :return: Dictionaries from argument names to ids and back, and a single
+        program string containing all facts.
+    """
+    argument_name_to_id = {}
+    id_to_argument_name = {}
+    facts = []
+    for arg_id, argument in enumerate(argumentation_framework.arguments):
+        id_name = 'a' + str(arg_id)
+        argument_name_to_id[argument.name] = id_name
+        id_to_argument_name[id_name] = argument.name
+        facts.append(f'arg({id_name}).')
+    for defeat in argumentation_framework.defeats:
+        from_id = argument_name_to_id[defeat.from_argument.name]
+        to_id = argument_name_to_id[defeat.to_argument.name]
+        facts.append(f'att({from_id},{to_id}).')
+    return argument_name_to_id, id_to_argument_name, '\n'.join(facts)
 
 
 class AbstractSolver:
+    # Name of the file in the encodings folder with the semantics program.
+    encoding_file_name: Optional[str] = None
+
     def __init__(self):
         # Initialize clingo Control for enumerating all models.
         self.control = clingo.Control()
@@ -20,20 +66,25 @@ class AbstractSolver:
         self.all_extensions = set()
 
     def load_argumentation_framework(
-            self, argumentation_framework: AbstractArgumentationFramework):
+            self, argumentation_framework: AbstractArgumentationFramework,
+            program: Optional[Tuple[Dict[str, str], Dict[str, str], str]] =
+            None):
+        """
+        Add the facts of the argumentation framework to the program, all at
+        once. A program that was already made by
+        get_argumentation_framework_program can be passed to reuse it.
+        """
         self.argumentation_framework = argumentation_framework
-        for arg_id, argument in enumerate(argumentation_framework.arguments):
-            id_name = 'a' + str(arg_id)
-            self.argument_name_to_id[argument.name] = id_name
-            self.id_to_argument_name[id_name] = argument.name
-            self.control.add('base', [], f'arg({id_name}).')
-        for defeat in argumentation_framework.defeats:
-            from_id = self.argument_name_to_id[defeat.from_argument.name]
-            to_id = self.argument_name_to_id[defeat.to_argument.name]
-            self.control.add('base', [], f'att({from_id},{to_id}).')
+        if program is None:
+            program = get_argumentation_framework_program(
+                argumentation_framework)
+        self.argument_name_to_id, self.id_to_argument_name, facts = program
+        self.control.add('base', [], facts)
 
     def load_semantics_programs(self):
-        pass
+        if self.encoding_file_name is not None:
+            self.control.add('base', [],
+                             read_encoding(self.encoding_file_name))
 
     def add_model_to_extension(self, model):
         new_extension = self.model_to_extension(model)
@@ -52,10 +103,135 @@ class AbstractSolver:
         return frozenset(extension_elements)
 
     def get_all_extensions(
-            self, argumentation_framework: AbstractArgumentationFramework) -> \
+            self, argumentation_framework: AbstractArgumentationFramework,
+            program: Optional[Tuple[Dict[str, str], Dict[str, str], str]] =
+            None) -> \
             Set[FrozenSet[Argument]]:
-        self.load_argumentation_framework(argumentation_framework)
+        self.load_argumentation_framework(argumentation_framework, program)
         self.load_semantics_programs()
         self.control.ground([('base', [])])
         self.control.solve(on_model=self.add_model_to_extension)
         return self.all_extensions
+
+    def iterate_extensions(
+            self, argumentation_framework: AbstractArgumentationFramework,
+            max_models: Optional[int] = None,
+            time_limit: Optional[float] = None,
+            program: Optional[Tuple[Dict[str, str], Dict[str, str], str]] =
+            None) -> \
+            Iterator[FrozenSet[Argument]]:
+        """
+        Yield the extensions of the argumentation framework one by one, as
+        soon as the solver finds them. Search stops when the caller stops
+        iterating, after max_models extensions or when time_limit seconds
+        have passed, whichever comes first.
+
+        :param argumentation_framework: The argumentation framework.
+        :param max_models: Maximum number of extensions to yield.
+        :param time_limit: Time budget (in seconds) for the whole search.
+        :param program: Optional facts program (see
+            get_argumentation_framework_program).
+        :return: Iterator over the extensions.
+        """
+        if max_models is not None:
+            if max_models <= 0:
+                return
+            self.control.configuration.solve.models = max_models
+        deadline = None if time_limit is None else \
+            time.monotonic() + time_limit
+
+        self.load_argumentation_framework(argumentation_framework, program)
+        self.load_semantics_programs()
+        self.control.ground([('base', [])])
+        with self.control.solve(yield_=True, async_=True) as handle:
+            while True:
+                handle.resume()
+                if deadline is None:
+                    handle.wait()
+                elif not handle.wait(max(deadline - time.monotonic(), 0)):
+                    # Out of time; leaving the with block cancels the search.
+                    return
+                model = handle.model()
+                if model is None:
+                    return
+                yield self.model_to_extension(model)
+
+    def _set_enum_mode(self, acceptance_strategy: AcceptanceStrategy):
+        if acceptance_strategy == AcceptanceStrategy.CREDULOUS:
+            self.control.configuration.solve.enum_mode = 'brave'
+        elif acceptance_strategy == AcceptanceStrategy.SKEPTICAL:
+            self.control.configuration.solve.enum_mode = 'cautious'
+        else:
+            raise NotImplementedError
+
+    def get_accepted_arguments(
+            self, argumentation_framework: AbstractArgumentationFramework,
+            acceptance_strategy: AcceptanceStrategy,
+            program: Optional[Tuple[Dict[str, str], Dict[str, str], str]] =
+            None) -> Set[Argument]:
+        """
+        Get all credulously or skeptically accepted arguments with a single
+        brave or cautious solver call: each model refines the consequences
+        found so far, so the last model contains exactly the accepted
+        arguments. If there are no extensions, nothing is accepted.
+
+        :param argumentation_framework: The argumentation framework.
+        :param acceptance_strategy: CREDULOUS or SKEPTICAL.
+        :param program: Optional facts program (see
+            get_argumentation_framework_program).
+        :return: The accepted arguments.
+        """
+        self._set_enum_mode(acceptance_strategy)
+        self.load_argumentation_framework(argumentation_framework, program)
+        self.load_semantics_programs()
+        self.control.ground([('base', [])])
+
+        accepted_arguments = frozenset()
+
+        def update_accepted_arguments(model):
+            nonlocal accepted_arguments
+            accepted_arguments = self.model_to_extension(model)
+
+        self.control.solve(on_model=update_accepted_arguments)
+        return set(accepted_arguments)
+
+    def is_accepted(
+            self, argumentation_framework: AbstractArgumentationFramework,
+            argument: Argument, acceptance_strategy: AcceptanceStrategy,
+            program: Optional[Tuple[Dict[str, str], Dict[str, str], str]] =
+            None) -> bool:
+        """
+        Decide if the argument is credulously or skeptically accepted, using
+        brave or cautious reasoning. Search stops as soon as the answer is
+        known. If there are no extensions, nothing is accepted.
+
+        :param argumentation_framework: The argumentation framework.
+        :param argument: The argument that may be accepted.
+        :param acceptance_strategy: CREDULOUS or SKEPTICAL.
+        :param program: Optional facts program (see
+            get_argumentation_framework_program).
+        :return: Is the argument accepted?
+        """
+        self._set_enum_mode(acceptance_strategy)
+        self.load_argumentation_framework(argumentation_framework, program)
+        argumentation_framework.get_argument(argument.name)
+        in_symbol = clingo.Function('in', [clingo.Function(
+            self.argument_name_to_id[argument.name])])
+        self.load_semantics_programs()
+        self.control.ground([('base', [])])
+
+        # Brave consequences only grow and cautious consequences only shrink
+        # with each model, so the first model that (does not) contain the
+        # argument decides.
+        found_model = False
+        with self.control.solve(yield_=True) as handle:
+            for model in handle:
+                found_model = True
+                if acceptance_strategy == AcceptanceStrategy.CREDULOUS and \
+                        model.contains(in_symbol):
+                    return True
+                if acceptance_strategy == AcceptanceStrategy.SKEPTICAL and \
+                        not model.contains(in_symbol):
+                    return False
+        return acceptance_strategy == AcceptanceStrategy.SKEPTICAL and \
+            found_model
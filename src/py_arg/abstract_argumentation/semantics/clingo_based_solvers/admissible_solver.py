@@ -1,24 +1,26 @@
-import pathlib
-from typing import Set, FrozenSet, TypeVar
+from typing import Set, FrozenSet, TypeVar, Optional
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
 from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
     abstract_solver import AbstractSolver
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    solver_session import SolverSession
 
 
-PATH_TO_ENCODINGS = pathlib.Path(__file__).parent / 'encodings'
 T = TypeVar('T', bound=Argument)
 
 
 class AdmissibleSolver(AbstractSolver):
-    def load_semantics_programs(self):
-        self.control.load(str(PATH_TO_ENCODINGS / 'admissible.dl'))
+    encoding_file_name = 'admissible.dl'
 
 
 def get_admissible_sets(
-        argumentation_framework: AbstractArgumentationFramework) -> \
+        argumentation_framework: AbstractArgumentationFramework,
+        session: Optional[SolverSession] = None) -> \
         Set[FrozenSet[T]]:
+    if session is not None:
+        return session.get_all_extensions(AdmissibleSolver)
     solver = AdmissibleSolver()
     return solver.get_all_extensions(argumentation_framework)
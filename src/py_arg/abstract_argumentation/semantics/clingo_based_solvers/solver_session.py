@@ -0,0 +1,103 @@
+import itertools
+from typing import Dict, FrozenSet, Set, Type, Optional, Iterator
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.acceptance_strategy import \
+    AcceptanceStrategy
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    abstract_solver import AbstractSolver, get_argumentation_framework_program
+
+
+class SolverSession:
+    """
+    Clingo-based reasoning about one argumentation framework under several
+    semantics. The facts program of the framework is built only once and the
+    extensions of each semantics are only computed once, so that callers
+    asking for the same semantics repeatedly do not solve again.
+
+    Usage:
+        session = SolverSession(argumentation_framework)
+        preferred = get_preferred_extensions(argumentation_framework, session)
+        stable = get_stable_extensions(argumentation_framework, session)
+    """
+
+    def __init__(self,
+                 argumentation_framework: AbstractArgumentationFramework):
+        self.argumentation_framework = argumentation_framework
+        self.program = \
+            get_argumentation_framework_program(argumentation_framework)
+        self._extensions_by_solver: \
+            Dict[Type[AbstractSolver], Set[FrozenSet[Argument]]] = {}
+
+    def get_all_extensions(self, solver_class: Type[AbstractSolver]) -> \
+            Set[FrozenSet[Argument]]:
+        """
+        Get all extensions of the session's argumentation framework, using a
+        solver of the given class (so: under the corresponding semantics).
+        """
+        if solver_class not in self._extensions_by_solver:
+            self._extensions_by_solver[solver_class] = \
+                solver_class().get_all_extensions(
+                    self.argumentation_framework, self.program)
+        return set(self._extensions_by_solver[solver_class])
+
+    def iterate_extensions(self, solver_class: Type[AbstractSolver],
+                           max_models: Optional[int] = None,
+                           time_limit: Optional[float] = None) -> \
+            Iterator[FrozenSet[Argument]]:
+        """
+        Yield the extensions of the session's argumentation framework one by
+        one (see AbstractSolver.iterate_extensions). If all extensions were
+        already computed for this solver class, these are yielded instead.
+        """
+        if solver_class in self._extensions_by_solver:
+            extensions = iter(self._extensions_by_solver[solver_class])
+            if max_models is not None:
+                extensions = itertools.islice(extensions, max(max_models, 0))
+            yield from extensions
+        else:
+            yield from solver_class().iterate_extensions(
+                self.argumentation_framework, max_models, time_limit,
+                self.program)
+
+    def get_accepted_arguments(
+            self, solver_class: Type[AbstractSolver],
+            acceptance_strategy: AcceptanceStrategy) -> Set[Argument]:
+        """
+        Get the accepted arguments under the semantics of the given solver
+        class (see AbstractSolver.get_accepted_arguments). If all extensions
+        were already computed for this solver class, these are used instead.
+        """
+        if solver_class in self._extensions_by_solver:
+            extensions = self._extensions_by_solver[solver_class]
+            if not extensions:
+                return set()
+            if acceptance_strategy == AcceptanceStrategy.CREDULOUS:
+                return set.union(*(set(extension)
+                                   for extension in extensions))
+            if acceptance_strategy == AcceptanceStrategy.SKEPTICAL:
+                return set.intersection(*(set(extension)
+                                          for extension in extensions))
+        return solver_class().get_accepted_arguments(
+            self.argumentation_framework, acceptance_strategy, self.program)
+
+    def is_accepted(self, solver_class: Type[AbstractSolver],
+                    argument: Argument,
+                    acceptance_strategy: AcceptanceStrategy) -> bool:
+        """
+        Decide if the argument is accepted under the semantics of the given
+        solver class (see AbstractSolver.is_accepted). If all extensions were
+        already computed for this solver class, these are used instead.
+        """
+        if solver_class in self._extensions_by_solver:
+            extensions = self._extensions_by_solver[solver_class]
+            if acceptance_strategy == AcceptanceStrategy.CREDULOUS:
+                return any(argument in extension for extension in extensions)
+            if acceptance_strategy == AcceptanceStrategy.SKEPTICAL:
+                return bool(extensions) and \
+                    all(argument in extension for extension in extensions)
+        return solver_class().is_accepted(
+            self.argumentation_framework, argument, acceptance_strategy,
+            self.program)
@@ -0,0 +1,140 @@
+from typing import Dict, List, Optional, Set, Tuple, TypeVar
+
+import clingo
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    abstract_solver import AbstractSolver
+
+
+T = TypeVar('T', bound=Argument)
+
+SELF_REACHING_SYMBOL = clingo.Function('self_reaching')
+
+
+class SufficientSetsSolver(AbstractSolver):
+    """
+    Solver for the sets of arguments that are sufficient for the acceptance
+    of an argument: the admissible sets containing the argument in which all
+    other arguments (in)directly attack or defend it. The argument itself is
+    left out of each set, unless it (in)directly attacks itself.
+
+    The program is grounded once, for the first argumentation framework
+    asked about; each target argument is then selected by an external atom.
+    So explanations for many arguments of the same framework only need one
+    solver.
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c, d], [Defeat(b, a), Defeat(c, b), Defeat(d, b)])
+    >>> solver = SufficientSetsSolver()
+    >>> sorted(sorted(sufficient_set)
+    ...        for sufficient_set in solver.get_sufficient_sets(af, a))
+    [[c], [c, d], [d]]
+    >>> sorted(sorted(sufficient_set)
+    ...        for sufficient_set in solver.get_sufficient_sets(af, a, True))
+    [[c], [d]]
+    >>> solver.get_necessary_arguments(af, a)
+    set()
+    """
+    encoding_file_name = 'sufficient_sets.dl'
+
+    def __init__(self):
+        super().__init__()
+        self.control.configuration.solver.heuristic = 'Domain'
+        self.target_argument = None
+
+    def _load_target(
+            self, argumentation_framework: AbstractArgumentationFramework,
+            argument: T,
+            program: Optional[Tuple[Dict[str, str], Dict[str, str], str]]):
+        if self.argumentation_framework is None:
+            self.load_argumentation_framework(argumentation_framework,
+                                              program)
+            self.load_semantics_programs()
+            self.control.ground([('base', [])])
+        elif self.argumentation_framework is not argumentation_framework:
+            raise ValueError('This solver was already used for another '
+                             'argumentation framework.')
+        argumentation_framework.get_argument(argument.name)
+
+        if self.target_argument is not None:
+            self.control.assign_external(
+                self._get_target_symbol(self.target_argument), False)
+        self.control.assign_external(self._get_target_symbol(argument), True)
+        self.target_argument = argument
+
+    def _get_target_symbol(self, argument: T) -> clingo.Symbol:
+        return clingo.Function('target', [clingo.Function(
+            self.argument_name_to_id[argument.name])])
+
+    def _model_to_explanation(self, model, argument: T) -> Set[T]:
+        explanation = set(self.model_to_extension(model))
+        if not model.contains(SELF_REACHING_SYMBOL):
+            explanation.remove(argument)
+        return explanation
+
+    def get_sufficient_sets(
+            self, argumentation_framework: AbstractArgumentationFramework,
+            argument: T, minimal: bool = False,
+            program: Optional[Tuple[Dict[str, str], Dict[str, str], str]] =
+            None) -> List[Set[T]]:
+        """
+        Get the sets of arguments that are sufficient for the acceptance of
+        the argument. For the subset-minimal sets, the solver prefers to leave
+        arguments out and only reports sets that cannot be made smaller, so
+        the non-minimal sets are never enumerated.
+
+        :param argumentation_framework: The argumentation framework.
+        :param argument: The argument that is accepted.
+        :param minimal: Only get the subset-minimal sufficient sets?
+        :param program: Optional facts program (see
+            get_argumentation_framework_program).
+        :return: a list of sets of arguments, each sufficient for the
+            acceptance of the argument.
+        """
+        self._load_target(argumentation_framework, argument, program)
+        self.control.configuration.solve.enum_mode = \
+            'domRec' if minimal else 'auto'
+        sufficient_sets = []
+        with self.control.solve(yield_=True) as handle:
+            for model in handle:
+                sufficient_sets.append(
+                    self._model_to_explanation(model, argument))
+        return sufficient_sets
+
+    def get_necessary_arguments(
+            self, argumentation_framework: AbstractArgumentationFramework,
+            argument: T,
+            program: Optional[Tuple[Dict[str, str], Dict[str, str], str]] =
+            None) -> Set[T]:
+        """
+        Get the arguments that are necessary for the acceptance of the
+        argument: those in every sufficient set, found by cautious reasoning.
+        These are also the arguments that are, apart from the argument
+        itself, in every admissible set containing the argument. If there is
+        no such set, there are no necessary arguments.
+
+        :param argumentation_framework: The argumentation framework.
+        :param argument: The argument that is accepted.
+        :param program: Optional facts program (see
+            get_argumentation_framework_program).
+        :return: The necessary arguments.
+        """
+        self._load_target(argumentation_framework, argument, program)
+        self.control.configuration.solve.enum_mode = 'cautious'
+        necessary_arguments = set()
+        with self.control.solve(yield_=True) as handle:
+            for model in handle:
+                necessary_arguments = \
+                    self._model_to_explanation(model, argument)
+        return necessary_arguments
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,78 @@
+import itertools
+import math
+from collections.abc import Set as AbstractSet
+from typing import Dict, FrozenSet, Iterator, List, Set, TypeVar
+
+from py_arg.abstract_argumentation.classes.argument import Argument
+
+T = TypeVar('T', bound=Argument)
+
+
+class ComponentExtensions(AbstractSet):
+    """
+    The extensions of an argumentation framework that consists of
+    independent components (that do not defeat each other), represented by
+    the extensions of each component. Each extension of the whole framework
+    is the union of one extension per component, so the (potentially huge)
+    cartesian product is never built: extensions are only combined while
+    iterating, and membership and size are computed per component.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> extensions = ComponentExtensions(
+    ...     [{frozenset([a]), frozenset([b])}, {frozenset([c])}],
+    ...     {'a': 0, 'b': 0, 'c': 1})
+    >>> len(extensions)
+    2
+    >>> frozenset([b, c]) in extensions, frozenset([a, b, c]) in extensions
+    (True, False)
+    >>> extensions == {frozenset([a, c]), frozenset([b, c])}
+    True
+    >>> extensions - {frozenset([a, c])} == {frozenset([b, c])}
+    True
+    >>> len(extensions | {frozenset([a])}), type(extensions & extensions)
+    (3, <class 'set'>)
+    """
+
+    def __init__(self, extensions_by_component: List[Set[FrozenSet[T]]],
+                 component_by_argument_name: Dict[str, int]):
+        """
+        :param extensions_by_component: For each component, its extensions.
+        :param component_by_argument_name: For each argument of the
+            framework, the position of its component.
+        """
+        self.extensions_by_component = extensions_by_component
+        self.component_by_argument_name = component_by_argument_name
+
+    @classmethod
+    def _from_iterable(cls, iterable) -> Set[FrozenSet[T]]:
+        # Results of set operations (such as - and |) are ordinary sets.
+        return set(iterable)
+
+    def __iter__(self) -> Iterator[FrozenSet[T]]:
+        for parts in itertools.product(*self.extensions_by_component):
+            yield frozenset().union(*parts)
+
+    def __len__(self) -> int:
+        return math.prod(len(extensions)
+                         for extensions in self.extensions_by_component)
+
+    def __contains__(self, extension) -> bool:
+        parts = [set() for _ in self.extensions_by_component]
+        for argument in extension:
+            if argument.name not in self.component_by_argument_name:
+                return False
+            parts[self.component_by_argument_name[argument.name]].add(
+                argument)
+        return all(frozenset(part) in extensions
+                   for part, extensions in
+                   zip(parts, self.extensions_by_component))
+
+    def __repr__(self):
+        return 'ComponentExtensions(' + \
+            repr(self.extensions_by_component) + ')'
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
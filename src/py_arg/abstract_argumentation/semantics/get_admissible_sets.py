@@ -3,6 +3,8 @@ from typing import Set, Dict, FrozenSet, TypeVar
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.branching_heuristics import \
+    BranchingHeuristic, first_blank
 from py_arg.abstract_argumentation.semantics.get_extensions_recursive import \
     recursively_get_extensions
 from py_arg.abstract_argumentation.semantics.get_preferred_extensions import \
@@ -28,17 +30,20 @@ def _update_admissible_sets_by_labelling(
 
 
 def get_admissible_sets(
-        argumentation_framework: AbstractArgumentationFramework) -> \
+        argumentation_framework: AbstractArgumentationFramework,
+        branching_heuristic: BranchingHeuristic = first_blank) -> \
         Set[FrozenSet[T]]:
     """
     Get the admissible sets of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for which we
         need the admissible sets.
+    :param branching_heuristic: Heuristic that chooses the next argument to
+        branch on (see branching_heuristics).
     :return: admissible sets of the argumentation framework.
     """
     initial_labelling = {argument: ExtendedExtensionLabel.BLANK
                          for argument in argumentation_framework.arguments}
     return recursively_get_extensions(
         argumentation_framework, initial_labelling, set(),
-        _update_admissible_sets_by_labelling)
+        _update_admissible_sets_by_labelling, branching_heuristic)
@@ -1,64 +1,279 @@
-from typing import TypeVar, Set, FrozenSet
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar, Set, FrozenSet, Optional, Iterator, List, Tuple
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.classes.defeat import Defeat
 from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
-    admissible_solver import get_admissible_sets
+    admissible_solver import get_admissible_sets, AdmissibleSolver
 from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
-    complete_solver import get_complete_extensions
+    complete_solver import get_complete_extensions, CompleteSolver
 from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
-    stage_solver import get_stage_extensions
+    stage_solver import get_stage_extensions, StageSolver
+from py_arg.abstract_argumentation.semantics.component_extensions import \
+    ComponentExtensions
 from py_arg.abstract_argumentation.semantics.get_conflict_free_extensions \
     import get_conflict_free_extensions
 from py_arg.abstract_argumentation.semantics.get_eager_extension \
     import get_eager_extensions
 from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
-    grounded_solver import get_grounded_extensions
+    grounded_solver import get_grounded_extensions, GroundedSolver
 from py_arg.abstract_argumentation.semantics.get_ideal_extension \
     import get_ideal_extensions
+from py_arg.abstract_argumentation.semantics.get_scc_recursive_extensions \
+    import COMPONENT_SEMANTICS, get_scc_recursive_extensions
 from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
-    naive_solver import get_naive_extensions
+    naive_solver import get_naive_extensions, NaiveSolver
 from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
-    preferred_solver import get_preferred_extensions
+    preferred_solver import get_preferred_extensions, PreferredSolver
 from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
-    semi_stable_solver import get_semi_stable_extensions
+    semi_stable_solver import get_semi_stable_extensions, SemiStableSolver
 from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
-    stable_solver import get_stable_extensions
+    stable_solver import get_stable_extensions, StableSolver
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    solver_session import SolverSession
+from py_arg.abstract_argumentation.semantics import get_admissible_sets as \
+    native_admissible_sets, get_complete_extensions as \
+    native_complete_extensions, get_grounded_extension as \
+    native_grounded_extension, get_naive_extensions as \
+    native_naive_extensions, get_preferred_extensions as \
+    native_preferred_extensions, get_semistable_extensions as \
+    native_semi_stable_extensions, get_stable_extensions as \
+    native_stable_extensions, get_stage_extensions as native_stage_extensions
 
 
 T = TypeVar('T', bound=Argument)
 
+SOLVER_BY_SEMANTICS = {
+    'Admissible': AdmissibleSolver,
+    'Complete': CompleteSolver,
+    'Grounded': GroundedSolver,
+    'Preferred': PreferredSolver,
+    'Stage': StageSolver,
+    'Stable': StableSolver,
+    'SemiStable': SemiStableSolver,
+    'Naive': NaiveSolver
+}
+
+# Semantics with a native (labelling-based) implementation, used when the
+# engine is 'native'. Ideal semantics is always computed with clingo. Native
+# stage semantics compares all naive extensions, of which there can be very
+# many, so clingo is usually faster for it on larger frameworks.
+NATIVE_EXTENSION_FUNCTION_BY_SEMANTICS = {
+    'Admissible': native_admissible_sets.get_admissible_sets,
+    'Complete': native_complete_extensions.get_complete_extensions,
+    'Grounded': native_grounded_extension.get_grounded_extensions,
+    'Preferred': native_preferred_extensions.get_preferred_extensions,
+    'Stage': native_stage_extensions.get_stage_extensions,
+    'Stable': native_stable_extensions.get_stable_extensions,
+    'SemiStable': native_semi_stable_extensions.get_semi_stable_extensions,
+    'Eager': lambda argumentation_framework: get_eager_extensions(
+        argumentation_framework, engine='native'),
+    'ConflictFree': get_conflict_free_extensions,
+    'Naive': native_naive_extensions.get_naive_extensions
+}
+
 
 def get_argumentation_framework_extensions(
         argumentation_framework: AbstractArgumentationFramework,
-        semantics_specification: str) -> Set[FrozenSet[T]]:
+        semantics_specification: str,
+        session: Optional[SolverSession] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        scc_recursive: bool = False,
+        engine: str = 'clingo') -> Set[FrozenSet[T]]:
     """
     Calculate the set of extensions from the given abstract argumentation
     framework and chosen semantics
 
     :param argumentation_framework: The abstract argumentation framework.
     :param semantics_specification: The chosen semantics.
+    :param session: Optional solver session for this argumentation framework,
+        so that clingo-based results can be shared between calls.
+    :param parallel: If True, solve the weakly connected components of the
+        framework in separate processes (see
+        get_component_parallel_extensions). The session is not used then.
+    :param max_workers: Maximum number of processes if parallel is True.
+    :param scc_recursive: If True, solve grounded, complete, preferred,
+        stable and semi-stable semantics one strongly connected component at
+        a time (see get_scc_recursive_extensions), which is much faster on
+        mostly acyclic frameworks. The session is not used then. Other
+        semantics are solved as usual.
+    :param engine: 'clingo', or 'native' to use the native implementations
+        (see NATIVE_EXTENSION_FUNCTION_BY_SEMANTICS) instead of clingo. The
+        session is not used then.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(b, c)])
+    >>> extensions = get_argumentation_framework_extensions(
+    ...     af, 'Preferred', scc_recursive=True)
+    >>> extensions == get_argumentation_framework_extensions(af, 'Preferred')
+    True
+    >>> sorted(sorted(argument.name for argument in extension)
+    ...        for extension in get_argumentation_framework_extensions(
+    ...            af, 'Stage', engine='native'))
+    [['a', 'c'], ['b']]
     """
+    if engine not in ('clingo', 'native'):
+        raise ValueError('Unknown engine ' + engine + '.')
+    if parallel:
+        return get_component_parallel_extensions(
+            argumentation_framework, semantics_specification, max_workers,
+            scc_recursive, engine)
+    if scc_recursive and semantics_specification in COMPONENT_SEMANTICS:
+        return get_scc_recursive_extensions(argumentation_framework,
+                                            semantics_specification)
+    if engine == 'native' and \
+            semantics_specification in NATIVE_EXTENSION_FUNCTION_BY_SEMANTICS:
+        return NATIVE_EXTENSION_FUNCTION_BY_SEMANTICS[
+            semantics_specification](argumentation_framework)
     if semantics_specification == 'Admissible':
-        return get_admissible_sets(argumentation_framework)
+        return get_admissible_sets(argumentation_framework, session)
     if semantics_specification == 'Complete':
-        return get_complete_extensions(argumentation_framework)
+        return get_complete_extensions(argumentation_framework, session)
     if semantics_specification == 'Grounded':
-        return get_grounded_extensions(argumentation_framework)
+        return get_grounded_extensions(argumentation_framework, session)
     if semantics_specification == 'Preferred':
-        return get_preferred_extensions(argumentation_framework)
+        return get_preferred_extensions(argumentation_framework, session)
     if semantics_specification == 'Ideal':
-        return get_ideal_extensions(argumentation_framework)
+        return get_ideal_extensions(argumentation_framework, session)
     if semantics_specification == 'Stage':
-        return get_stage_extensions(argumentation_framework)
+        return get_stage_extensions(argumentation_framework, session)
     if semantics_specification == 'Stable':
-        return get_stable_extensions(argumentation_framework)
+        return get_stable_extensions(argumentation_framework, session)
     if semantics_specification == 'SemiStable':
-        return get_semi_stable_extensions(argumentation_framework)
+        return get_semi_stable_extensions(argumentation_framework, session)
     if semantics_specification == 'Eager':
-        return get_eager_extensions(argumentation_framework)
+        return get_eager_extensions(argumentation_framework, session)
     if semantics_specification == 'ConflictFree':
         return get_conflict_free_extensions(argumentation_framework)
     if semantics_specification == 'Naive':
-        return get_naive_extensions(argumentation_framework)
+        return get_naive_extensions(argumentation_framework, session)
+
+
+def get_component_parallel_extensions(
+        argumentation_framework: AbstractArgumentationFramework,
+        semantics_specification: str,
+        max_workers: Optional[int] = None,
+        scc_recursive: bool = False,
+        engine: str = 'clingo') -> Set[FrozenSet[T]]:
+    """
+    Calculate the extensions of the argumentation framework by splitting it
+    into weakly connected components, which do not defeat each other, and
+    solving these in a pool of processes (each with its own clingo Control).
+    All supported semantics decompose this way: the extensions of the
+    framework are the unions of one extension per component.
+
+    :param argumentation_framework: The abstract argumentation framework.
+    :param semantics_specification: The chosen semantics.
+    :param max_workers: Maximum number of processes (by default, the number
+        of processors).
+    :param scc_recursive: If True, solve each component SCC-recursively (see
+        get_argumentation_framework_extensions).
+    :param engine: The engine for each component, 'clingo' or 'native'.
+    :return: The extensions. If there are several components, these are a
+        ComponentExtensions set, combined lazily from those of the
+        components.
+    """
+    graph = argumentation_framework.compact_graph
+    components = graph.weakly_connected_components()
+    if len(components) <= 1:
+        return get_argumentation_framework_extensions(
+            argumentation_framework, semantics_specification,
+            scc_recursive=scc_recursive, engine=engine)
+
+    tasks = []
+    for component in components:
+        names = [graph.arguments[index].name for index in component]
+        defeat_names = [(graph.arguments[index].name,
+                         graph.arguments[target].name)
+                        for index in component
+                        for target in graph.successors(index)]
+        tasks.append((names, defeat_names, semantics_specification,
+                      scc_recursive, engine))
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # Send components in chunks, as most of them tend to be tiny.
+    chunk_size = max(1, len(tasks) // (4 * max_workers))
+    with ProcessPoolExecutor(max_workers) as executor:
+        extension_names = list(executor.map(
+            _get_component_extension_names, tasks, chunksize=chunk_size))
+
+    extensions_by_component = [
+        {frozenset(argumentation_framework.get_argument(name)
+                   for name in names)
+         for names in component_extension_names}
+        for component_extension_names in extension_names]
+    component_by_argument_name = {
+        graph.arguments[index].name: position
+        for position, component in enumerate(components)
+        for index in component}
+    return ComponentExtensions(extensions_by_component,
+                               component_by_argument_name)
+
+
+def _get_component_extension_names(
+        task: Tuple[List[str], List[Tuple[str, str]], str, bool, str]) -> \
+        List[FrozenSet[str]]:
+    """
+    Solve one component in a worker process. Arguments are passed (and
+    extensions are returned) by name, so that the results can be mapped back
+    to the arguments of the original framework.
+    """
+    names, defeat_names, semantics_specification, scc_recursive, engine = \
+        task
+    arguments = {name: Argument(name) for name in names}
+    component_framework = AbstractArgumentationFramework(
+        '', list(arguments.values()),
+        [Defeat(arguments[from_name], arguments[to_name])
+         for from_name, to_name in defeat_names])
+    return [frozenset(argument.name for argument in extension)
+            for extension in get_argumentation_framework_extensions(
+                component_framework, semantics_specification,
+                scc_recursive=scc_recursive, engine=engine)]
+
+
+def iterate_argumentation_framework_extensions(
+        argumentation_framework: AbstractArgumentationFramework,
+        semantics_specification: str,
+        max_models: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        session: Optional[SolverSession] = None) -> Iterator[FrozenSet[T]]:
+    """
+    Yield the extensions from the given abstract argumentation framework and
+    chosen semantics one by one, as soon as they are found. The caller can
+    stop iterating at any point, which stops the search.
+
+    :param argumentation_framework: The abstract argumentation framework.
+    :param semantics_specification: The chosen semantics.
+    :param max_models: Maximum number of extensions to yield.
+    :param time_limit: Time budget in seconds for the search (only for the
+        clingo-based semantics).
+    :param session: Optional solver session for this argumentation framework.
+    """
+    if semantics_specification in SOLVER_BY_SEMANTICS:
+        solver_class = SOLVER_BY_SEMANTICS[semantics_specification]
+        if session is None:
+            yield from solver_class().iterate_extensions(
+                argumentation_framework, max_models, time_limit)
+        else:
+            yield from session.iterate_extensions(
+                solver_class, max_models, time_limit)
+        return
+
+    extensions = iter(get_argumentation_framework_extensions(
+        argumentation_framework, semantics_specification))
+    if max_models is not None:
+        extensions = itertools.islice(extensions, max(max_models, 0))
+    yield from extensions
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
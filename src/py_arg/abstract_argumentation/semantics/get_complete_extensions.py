@@ -3,8 +3,11 @@ from typing import Set, Dict, FrozenSet, TypeVar
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.branching_heuristics import \
+    BranchingHeuristic, first_blank
 from py_arg.abstract_argumentation.semantics.get_extensions_recursive import \
-    recursively_get_extensions
+    recursively_get_extensions, get_complete_pruning, \
+    get_complete_propagation
 from py_arg.abstract_argumentation.semantics.get_preferred_extensions import \
     ExtendedExtensionLabel
 
@@ -52,17 +55,22 @@ def _update_complete_extensions_by_labelling(
 
 
 def get_complete_extensions(
-        argumentation_framework: AbstractArgumentationFramework) -> \
+        argumentation_framework: AbstractArgumentationFramework,
+        branching_heuristic: BranchingHeuristic = first_blank) -> \
         Set[FrozenSet[T]]:
     """
     Get the complete extensions of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for which we
     need the complete extensions.
+    :param branching_heuristic: Heuristic that chooses the next argument to
+    branch on (see branching_heuristics).
     :return: complete extensions of the argumentation framework.
     """
     initial_labelling = {argument: ExtendedExtensionLabel.BLANK
                          for argument in argumentation_framework.arguments}
     return recursively_get_extensions(
         argumentation_framework, initial_labelling, set(),
-        _update_complete_extensions_by_labelling)
+        _update_complete_extensions_by_labelling, branching_heuristic,
+        get_complete_pruning(argumentation_framework),
+        get_complete_propagation(argumentation_framework))
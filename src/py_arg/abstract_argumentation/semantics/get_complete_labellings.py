@@ -0,0 +1,81 @@
+from typing import Dict, FrozenSet, List, Optional, Tuple, TypeVar
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    complete_solver import get_complete_extensions
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    solver_session import SolverSession
+from py_arg.abstract_argumentation.semantics.get_scc_recursive_extensions \
+    import get_scc_recursive_extensions
+
+T = TypeVar('T', bound=Argument)
+
+# A labelling is given by its IN, UNDEC and OUT arguments (in that order).
+Labelling = Tuple[FrozenSet[T], FrozenSet[T], FrozenSet[T]]
+
+
+def get_complete_labellings(
+        argumentation_framework: AbstractArgumentationFramework,
+        session: Optional[SolverSession] = None,
+        scc_recursive: bool = False) -> List[Labelling]:
+    """
+    Get the complete labellings of an argumentation framework, ordered by the
+    (sorted) names of their IN arguments.
+
+    :param argumentation_framework: The argumentation framework for which we
+        need the complete labellings.
+    :param session: Optional solver session for this argumentation framework.
+    :param scc_recursive: If True, enumerate the complete extensions one
+        strongly connected component at a time (see
+        get_scc_recursive_extensions) instead of with clingo. The session is
+        not used then.
+    :return: The complete labellings as (IN, UNDEC, OUT) triples.
+    """
+    all_arguments = frozenset(argumentation_framework.arguments)
+    if scc_recursive:
+        extensions = get_scc_recursive_extensions(argumentation_framework,
+                                                  'Complete')
+    else:
+        extensions = get_complete_extensions(argumentation_framework, session)
+    labellings = []
+    for extension in extensions:
+        out_arguments = frozenset(
+            defeated for argument in extension
+            for defeated in
+            argumentation_framework.get_outgoing_defeat_arguments(argument))
+        undec_arguments = all_arguments - extension - out_arguments
+        labellings.append((extension, undec_arguments, out_arguments))
+    return sorted(labellings, key=lambda labelling: sorted(
+        argument.name for argument in labelling[0]))
+
+
+def get_complete_labellings_by_semantics(
+        argumentation_framework: AbstractArgumentationFramework,
+        session: Optional[SolverSession] = None,
+        scc_recursive: bool = False) -> Dict[str, List[Labelling]]:
+    """
+    Get the complete, grounded, preferred and stable labellings of an
+    argumentation framework from a single enumeration of its complete
+    labellings: the grounded labelling is the one with the least IN
+    arguments, the preferred labellings are those with maximal IN arguments
+    and the stable labellings are those without UNDEC arguments.
+
+    :param argumentation_framework: The argumentation framework for which we
+        need the labellings.
+    :param session: Optional solver session for this argumentation framework.
+    :param scc_recursive: See get_complete_labellings.
+    :return: Dictionary from semantics ('Complete', 'Grounded', 'Preferred'
+        and 'Stable') to the labellings under that semantics, ordered as in
+        get_complete_labellings.
+    """
+    complete = get_complete_labellings(argumentation_framework, session,
+                                       scc_recursive)
+    grounded = [labelling for labelling in complete
+                if all(labelling[0] <= other[0] for other in complete)]
+    preferred = [labelling for labelling in complete
+                 if not any(labelling[0] < other[0] for other in complete)]
+    stable = [labelling for labelling in preferred if not labelling[1]]
+    return {'Complete': complete, 'Grounded': grounded,
+            'Preferred': preferred, 'Stable': stable}
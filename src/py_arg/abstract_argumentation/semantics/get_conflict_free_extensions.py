@@ -1,7 +1,8 @@
-from typing import Set, TypeVar
+from typing import Set, TypeVar, Iterator, List, FrozenSet
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.utils.bitset import iterate_bits, to_bitset
 
 T = TypeVar('T', bound=Argument)
 
@@ -9,39 +10,71 @@ T = TypeVar('T', bound=Argument)
 def get_conflict_free_extensions(
         argumentation_framework: AbstractArgumentationFramework) -> \
         Set[frozenset[T]]:
-    return _recursively_get_conflict_free(
-        set(), set(argumentation_framework.arguments),
-        argumentation_framework)
+    return set(iterate_conflict_free_extensions(argumentation_framework))
 
 
-def _recursively_get_conflict_free(
-        previous_cf: Set[T],
-        todo: Set[T],
+def iterate_conflict_free_extensions(
         argumentation_framework: AbstractArgumentationFramework) -> \
-        Set[frozenset[T]]:
-    if not todo:
-        return set()
-
-    new_cf = {frozenset(previous_cf)}
-    for argument in todo:
-        # If this argument is self-defeating, we will not add it to any
-        # conflict-free set.
-        if argument in argumentation_framework.\
-                get_outgoing_defeat_arguments(argument):
+        Iterator[FrozenSet[T]]:
+    """
+    Yield the conflict-free sets of an argumentation framework one by one,
+    each exactly once. Each set is extended only with arguments that come
+    later (in the order of the framework's arguments) and do not conflict
+    with any argument in it, so that no subtree is explored twice.
+
+    :param argumentation_framework: The argumentation framework.
+    :return: Iterator over the conflict-free sets.
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c], [Defeat(a, b), Defeat(c, c)])
+    >>> [sorted(extension)
+    ...  for extension in iterate_conflict_free_extensions(af)]
+    [[], [b], [a]]
+    """
+    graph = argumentation_framework.compact_graph
+    arguments = graph.arguments
+    compatible_masks = get_compatible_masks(argumentation_framework)
+    candidate_mask = to_bitset(
+        index for index in range(len(graph))
+        if not graph.is_self_defeating(index))
+
+    stack = [(0, candidate_mask)]
+    while stack:
+        in_mask, candidate_mask = stack.pop()
+        yield frozenset(arguments[index] for index in iterate_bits(in_mask))
+        for index in iterate_bits(candidate_mask):
+            later_mask = ~((2 << index) - 1)
+            stack.append((in_mask | (1 << index),
+                          candidate_mask & compatible_masks[index] &
+                          later_mask))
+
+
+def get_compatible_masks(
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        List[int]:
+    """
+    For each argument (by compact graph id), get the bitset of other
+    arguments that it can be together with in a conflict-free set: those
+    that do not defeat themselves and are not in conflict with it.
+    Self-defeating arguments are compatible with nothing.
+    """
+    graph = argumentation_framework.compact_graph
+    acceptable_mask = to_bitset(index for index in range(len(graph))
+                                if not graph.is_self_defeating(index))
+    compatible_masks = []
+    for index in range(len(graph)):
+        if not acceptable_mask >> index & 1:
+            compatible_masks.append(0)
             continue
+        conflict_mask = to_bitset(graph.successors(index)) | \
+            to_bitset(graph.predecessors(index)) | (1 << index)
+        compatible_masks.append(acceptable_mask & ~conflict_mask)
+    return compatible_masks
+
+
+if __name__ == "__main__":
+    import doctest
 
-        new_todo = \
-            {other_argument for other_argument in todo
-             if other_argument != argument and
-             not other_argument < argument and
-             other_argument not in
-             argumentation_framework.get_incoming_defeat_arguments(
-                 argument) and
-             other_argument not in
-             argumentation_framework.get_outgoing_defeat_arguments(argument)}
-
-        new_cf.add(frozenset(previous_cf.union({argument})))
-        new_cf.update(_recursively_get_conflict_free(
-            previous_cf.union({argument}), new_todo, argumentation_framework))
-
-    return new_cf
+    doctest.testmod()
@@ -1,10 +1,16 @@
-from typing import Set, TypeVar, FrozenSet
+from typing import Set, TypeVar, FrozenSet, Optional
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
-from py_arg.abstract_argumentation.semantics.get_admissible_sets import \
-    get_admissible_sets
+from py_arg.abstract_argumentation.semantics.acceptance_strategy import \
+    AcceptanceStrategy
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    semi_stable_solver import SemiStableSolver
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    solver_session import SolverSession
+from py_arg.abstract_argumentation.semantics.get_maximal_admissible_subset \
+    import get_maximal_admissible_subset
 from py_arg.abstract_argumentation.semantics.get_semistable_extensions import \
     get_semi_stable_extensions
 
@@ -12,34 +18,61 @@ T = TypeVar('T', bound=Argument)
 
 
 def get_eager_extension(
-        argumentation_framework: AbstractArgumentationFramework) -> \
+        argumentation_framework: AbstractArgumentationFramework,
+        session: Optional[SolverSession] = None,
+        engine: str = 'clingo') -> \
         Set[T]:
     """
-    Get the eager extension of an argumentation framework.
+    Get the eager extension of an argumentation framework: the largest
+    admissible set that is contained in each semi-stable extension.
+
+    The skeptically accepted arguments under semi-stable semantics are found
+    by a single cautious reasoning call (or, with the native engine, as the
+    intersection of the semi-stable extensions), and then arguments that are
+    not defended by the others are removed until a fixpoint is reached.
 
     :param argumentation_framework: The argumentation framework for which we
         need the eager extension.
+    :param session: Optional solver session for this argumentation framework
+        (only used by the clingo engine).
+    :param engine: 'clingo' or 'native'.
     :return: eager extension of the argumentation framework.
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c, d], [Defeat(a, b), Defeat(b, a), Defeat(b, c),
+    ...                          Defeat(c, c), Defeat(c, d)])
+    >>> sorted(get_eager_extension(af))
+    [b, d]
+    >>> sorted(get_eager_extension(af, engine='native'))
+    [b, d]
     """
-    admissible_sets = get_admissible_sets(argumentation_framework)
-    semi_stable_extensions = get_semi_stable_extensions(
-        argumentation_framework)
-    semi_stable_extension_sets = (set(ext) for ext in semi_stable_extensions)
+    if engine == 'native':
+        skeptically_accepted = frozenset.intersection(
+            *get_semi_stable_extensions(argumentation_framework))
+    elif engine != 'clingo':
+        raise ValueError('Unknown engine ' + engine + '.')
+    elif session is None:
+        skeptically_accepted = SemiStableSolver().get_accepted_arguments(
+            argumentation_framework, AcceptanceStrategy.SKEPTICAL)
+    else:
+        skeptically_accepted = session.get_accepted_arguments(
+            SemiStableSolver, AcceptanceStrategy.SKEPTICAL)
+    return get_maximal_admissible_subset(skeptically_accepted,
+                                         argumentation_framework)
 
-    intersect_semi_stable = set.intersection(*semi_stable_extension_sets)
 
-    max_admissible_subset_of_semi_stable = None
-    for candidate_eager in admissible_sets:
-        if candidate_eager <= intersect_semi_stable:
-            if not max_admissible_subset_of_semi_stable:
-                max_admissible_subset_of_semi_stable = candidate_eager
-            if candidate_eager > max_admissible_subset_of_semi_stable:
-                max_admissible_subset_of_semi_stable = candidate_eager
+def get_eager_extensions(
+        argumentation_framework: AbstractArgumentationFramework,
+        session: Optional[SolverSession] = None,
+        engine: str = 'clingo') -> \
+        Set[FrozenSet[T]]:
+    return {frozenset(get_eager_extension(argumentation_framework, session,
+                                          engine))}
 
-    return set(max_admissible_subset_of_semi_stable)
 
+if __name__ == "__main__":
+    import doctest
 
-def get_eager_extensions(
-        argumentation_framework: AbstractArgumentationFramework) -> \
-        Set[FrozenSet[T]]:
-    return {frozenset(get_eager_extension(argumentation_framework))}
+    doctest.testmod()
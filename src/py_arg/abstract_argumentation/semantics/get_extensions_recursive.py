@@ -1,18 +1,39 @@
-from typing import Set, Dict, FrozenSet, Callable, TypeVar
+from typing import Set, Dict, FrozenSet, Callable, TypeVar, List, Tuple, \
+    Optional
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.branching_heuristics import \
+    BranchingHeuristic, first_blank
 from py_arg.abstract_argumentation.semantics.extended_extension_label import \
     ExtendedExtensionLabel
+from py_arg.utils.bitset import iterate_bits, to_bitset
 
 
 # This is an abstraction from Algorithm 1 from Samer Nofal, Katie Atkinson and
 # Paul E. Dunne. "Algorithms for decision problems in argument systems under
 # preferred semantics." Artificial Intelligence 207 (2014): 23-51.
+#
+# Labellings are represented by one integer bitset per label (IN, OUT,
+# MUST_OUT and UNDEC; BLANK is everything else), indexed by the ids of the
+# framework's compact graph. Search states are tuples of these immutable
+# masks, so backtracking just pops the previous state from an explicit stack
+# and nothing needs to be copied or undone.
+#
+# States in which some MUST_OUT argument no longer has a BLANK defeater can
+# never lead to a labelling without MUST_OUT arguments, so they are pruned
+# right away. Semantics can add their own pruning through the prune argument,
+# which gets the labelling masks and the BLANK mask of a state and returns
+# True if no extension can be found below it. Likewise, the propagate
+# argument returns the bitset of BLANK arguments that have to be IN in any
+# extension below a state; these are labelled IN without branching.
 
 T = TypeVar('T', bound=Argument)
 
+# (in_mask, out_mask, must_out_mask, undec_mask)
+MaskLabelling = Tuple[int, int, int, int]
+
 
 def recursively_get_extensions(
         argumentation_framework: AbstractArgumentationFramework,
@@ -20,66 +41,182 @@ def recursively_get_extensions(
         extensions: Set[FrozenSet[T]],
         update_extensions_by_labelling: Callable[[
             AbstractArgumentationFramework, Set[FrozenSet[T]],
-            Dict[T, ExtendedExtensionLabel]], None]) -> \
+            Dict[T, ExtendedExtensionLabel]], None],
+        branching_heuristic: BranchingHeuristic = first_blank,
+        prune: Optional[Callable[[MaskLabelling, int], bool]] = None,
+        propagate: Optional[Callable[[MaskLabelling, int], int]] = None) -> \
         Set[FrozenSet[T]]:
-    if all(labelling[argument] != ExtendedExtensionLabel.BLANK
-           for argument in argumentation_framework.arguments):
-        if all(labelling[argument] != ExtendedExtensionLabel.MUST_OUT
-               for argument in argumentation_framework.arguments):
-            # All arguments have some label in {IN, OUT, UNDEC}.
-            update_extensions_by_labelling(
-                argumentation_framework, extensions, labelling)
-    else:
-        # There must be some BLANK argument(s). Select the first one.
-        blank_argument = \
-            [argument for argument in argumentation_framework.arguments
-             if labelling[argument] == ExtendedExtensionLabel.BLANK][0]
+    graph = argumentation_framework.compact_graph
+    arguments = graph.arguments
+    all_mask = (1 << len(arguments)) - 1
+    defeater_masks = get_defeater_masks(argumentation_framework)
+    defeated_masks = _get_defeated_masks(argumentation_framework)
+    select_blank_argument = branching_heuristic(graph)
 
-        # Assume that it is IN and get all preferred extensions assuming this.
-        alternative_labelling = _in_trans(labelling, blank_argument,
-                                          argumentation_framework)
-        extensions = recursively_get_extensions(
-            argumentation_framework, alternative_labelling,
-            extensions, update_extensions_by_labelling)
+    stack = [_labelling_to_masks(arguments, labelling)]
+    while stack:
+        masks = stack.pop()
+        blank_mask = all_mask & ~(masks[0] | masks[1] | masks[2] | masks[3])
+        if propagate is not None:
+            forced_in_mask = propagate(masks, blank_mask)
+            while forced_in_mask:
+                for index in iterate_bits(forced_in_mask):
+                    masks = _in_trans(masks, index, defeated_masks[index],
+                                      defeater_masks[index])
+                blank_mask = all_mask & ~(masks[0] | masks[1] | masks[2] |
+                                          masks[3])
+                forced_in_mask = propagate(masks, blank_mask)
+        in_mask, out_mask, must_out_mask, undec_mask = masks
+        if any(not defeater_masks[index] & blank_mask
+               for index in iterate_bits(must_out_mask)):
+            continue
+        if prune is not None and prune(masks, blank_mask):
+            continue
+        if not blank_mask:
+            if not must_out_mask:
+                # All arguments have some label in {IN, OUT, UNDEC}.
+                update_extensions_by_labelling(
+                    argumentation_framework, extensions,
+                    _masks_to_labelling(arguments, in_mask, out_mask))
+            continue
+
+        # There must be some BLANK argument(s). Select one of them.
+        blank_index = select_blank_argument(blank_mask)
 
         # Assume that it might not be part of any preferred extension and
-        # get all preferred extensions assuming this.
-        alternative_labelling = _undec_trans(labelling, blank_argument)
-        extensions = recursively_get_extensions(
-            argumentation_framework, alternative_labelling,
-            extensions, update_extensions_by_labelling)
+        # get all preferred extensions assuming this. This state is pushed
+        # first, so that it is explored after the IN branch.
+        stack.append((in_mask, out_mask, must_out_mask,
+                      undec_mask | (1 << blank_index)))
+
+        # Assume that it is IN and get all preferred extensions assuming this.
+        stack.append(_in_trans(masks, blank_index,
+                               defeated_masks[blank_index],
+                               defeater_masks[blank_index]))
 
     return extensions
 
 
-def _in_trans(labelling: Dict[T, ExtendedExtensionLabel],
-              argument: T,
-              argumentation_framework: AbstractArgumentationFramework) -> \
-        Dict[T, ExtendedExtensionLabel]:
+def get_defeater_masks(
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        List[int]:
+    """
+    Get, for each argument id in the compact graph, the bitset of the ids of
+    the arguments that defeat it.
+    """
+    graph = argumentation_framework.compact_graph
+    return [to_bitset(graph.predecessors(index))
+            for index in range(len(graph))]
+
+
+def get_complete_pruning(
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        Callable[[MaskLabelling, int], bool]:
+    """
+    Get a prune function for semantics whose extensions are complete.
+
+    :param argumentation_framework: The argumentation framework that will be
+    searched.
+    :return: Function that tells if a search state should be pruned.
+    """
+    defeater_masks = get_defeater_masks(argumentation_framework)
+
+    def prune(labelling: MaskLabelling, blank_mask: int) -> bool:
+        # In a complete labelling, each UNDEC argument has an UNDEC defeater.
+        # OUT labels are final and MUST_OUT arguments will be OUT in any
+        # labelling below this state, so every UNDEC argument still needs a
+        # BLANK or UNDEC defeater. In particular, the UNDEC branch of an
+        # argument whose defeaters are all OUT is cut off right away.
+        undec_mask = labelling[3]
+        return any(not defeater_masks[index] & (blank_mask | undec_mask)
+                   for index in iterate_bits(undec_mask))
+    return prune
+
+
+def get_complete_propagation(
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        Callable[[MaskLabelling, int], int]:
+    """
+    Get a propagate function for semantics whose extensions are complete.
+
+    :param argumentation_framework: The argumentation framework that will be
+    searched.
+    :return: Function that gives the BLANK arguments that are forced to be IN
+    in a search state.
+    """
+    defeater_masks = get_defeater_masks(argumentation_framework)
+
+    def propagate(labelling: MaskLabelling, blank_mask: int) -> int:
+        # A BLANK argument whose defeaters are all OUT or MUST_OUT is
+        # defended by the IN arguments of any labelling below this state, so
+        # it is IN in any complete labelling below this state.
+        out_mask = labelling[1] | labelling[2]
+        return to_bitset(index for index in iterate_bits(blank_mask)
+                         if not defeater_masks[index] & ~out_mask)
+    return propagate
+
+
+def _get_defeated_masks(
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        List[int]:
+    # For each argument: the arguments that become OUT if it is labelled IN.
+    graph = argumentation_framework.compact_graph
+    result = []
+    for index in range(len(graph)):
+        defeated_mask = 0
+        for defeated in graph.successors(index):
+            if defeated == index:
+                break
+            defeated_mask |= 1 << defeated
+        result.append(defeated_mask)
+    return result
+
+
+def _in_trans(labelling: MaskLabelling, index: int,
+              defeated_mask: int, defeater_mask: int) -> MaskLabelling:
+    in_mask, out_mask, must_out_mask, undec_mask = labelling
+
     # Assume that the argument is IN.
-    new_labelling = labelling.copy()
-    new_labelling[argument] = ExtendedExtensionLabel.IN
+    in_mask |= 1 << index
 
-    # Try to make the arguments defeated by the new IN argument OUT.
-    for defeated in argumentation_framework.get_outgoing_defeat_arguments(
-            argument):
-        if defeated == argument:
-            break
-        else:
-            new_labelling[defeated] = ExtendedExtensionLabel.OUT
+    # Make the arguments defeated by the new IN argument OUT.
+    out_mask |= defeated_mask
+    in_mask &= ~defeated_mask
+    must_out_mask &= ~defeated_mask
+    undec_mask &= ~defeated_mask
 
     # Label the arguments that defeat the new IN argument by MUST_OUT.
-    for defeater in argumentation_framework.get_incoming_defeat_arguments(
-            argument):
-        if new_labelling[defeater] != ExtendedExtensionLabel.OUT:
-            new_labelling[defeater] = ExtendedExtensionLabel.MUST_OUT
-    return new_labelling
-
-
-def _undec_trans(labelling: Dict[T, ExtendedExtensionLabel],
-                 argument: T) -> \
-        Dict[Argument, ExtendedExtensionLabel]:
-    # Assume that the argument is UNDEC.
-    new_labelling = labelling.copy()
-    new_labelling[argument] = ExtendedExtensionLabel.UNDEC
-    return new_labelling
+    new_must_out = defeater_mask & ~out_mask
+    must_out_mask |= new_must_out
+    in_mask &= ~new_must_out
+    undec_mask &= ~new_must_out
+    return in_mask, out_mask, must_out_mask, undec_mask
+
+
+def _labelling_to_masks(arguments: List[T],
+                        labelling: Dict[T, ExtendedExtensionLabel]) -> \
+        MaskLabelling:
+    masks = {ExtendedExtensionLabel.IN: 0,
+             ExtendedExtensionLabel.OUT: 0,
+             ExtendedExtensionLabel.MUST_OUT: 0,
+             ExtendedExtensionLabel.UNDEC: 0,
+             ExtendedExtensionLabel.BLANK: 0}
+    for index, argument in enumerate(arguments):
+        masks[labelling[argument]] |= 1 << index
+    return masks[ExtendedExtensionLabel.IN], \
+        masks[ExtendedExtensionLabel.OUT], \
+        masks[ExtendedExtensionLabel.MUST_OUT], \
+        masks[ExtendedExtensionLabel.UNDEC]
+
+
+def _masks_to_labelling(arguments: List[T], in_mask: int, out_mask: int) -> \
+        Dict[T, ExtendedExtensionLabel]:
+    # Leaf labellings have no BLANK or MUST_OUT arguments, so everything that
+    # is not IN or OUT is UNDEC.
+    labelling = {argument: ExtendedExtensionLabel.UNDEC
+                 for argument in arguments}
+    for index in iterate_bits(in_mask):
+        labelling[arguments[index]] = ExtendedExtensionLabel.IN
+    for index in iterate_bits(out_mask):
+        labelling[arguments[index]] = ExtendedExtensionLabel.OUT
+    return labelling
@@ -1,11 +1,9 @@
-from typing import Set, FrozenSet, TypeVar
+from collections import deque
+from typing import Set, FrozenSet, TypeVar, Dict, Optional, Tuple
 
-from py_arg.abstract_argumentation.semantics.get_acceptable_with_respect_to \
-    import get_acceptable_with_respect_to
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
-from py_arg.utils.fixpoint import get_least_fixed_point
 
 T = TypeVar('T', bound=Argument)
 
@@ -13,12 +11,117 @@ T = TypeVar('T', bound=Argument)
 def get_grounded_extension(
         argumentation_framework: AbstractArgumentationFramework) -> \
         Set[T]:
-    return get_least_fixed_point(
-        lambda x: get_acceptable_with_respect_to(x, argumentation_framework),
-        set())
+    """
+    Get the grounded extension of an argumentation framework, in time linear
+    in the number of arguments and defeats.
+
+    :param argumentation_framework: The argumentation framework for which we
+        need the grounded extension.
+    :return: The grounded extension of the argumentation framework.
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c, d], [Defeat(a, b), Defeat(b, c), Defeat(d, d)])
+    >>> sorted(get_grounded_extension(af))
+    [a, c]
+    """
+    status_by_argument, _ = \
+        get_numbered_grounded_labelling(argumentation_framework)
+    return {argument for argument, status in status_by_argument.items()
+            if status == 'accepted'}
 
 
 def get_grounded_extensions(
         argumentation_framework: AbstractArgumentationFramework) -> \
         Set[FrozenSet[T]]:
     return {frozenset(get_grounded_extension(argumentation_framework))}
+
+
+def get_numbered_grounded_labelling(
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        Tuple[Dict[T, str], Dict[T, Optional[int]]]:
+    """
+    Get the grounded labelling of an argumentation framework, together with
+    the length of the (game-theoretic) proof for each argument.
+
+    Unattacked arguments are accepted with number 0. An argument is defeated
+    with number n + 1 if its accepted defeater with the smallest number has
+    number n. An argument is accepted with number n + 1 if all its defeaters
+    are defeated and n is the largest of their numbers. Remaining arguments
+    are undefined and get number None. Accepted arguments thus get even
+    numbers and defeated arguments get odd numbers.
+
+    The labelling is computed by a worklist algorithm that keeps, for each
+    argument, the number of defeaters that are not (yet) defeated. Since the
+    worklist is processed in order of increasing numbers, this takes time
+    O(|arguments| + |defeats|).
+
+    :param argumentation_framework: The argumentation framework to label.
+    :return: Two dictionaries: one that maps each argument to its status
+        ('accepted', 'defeated' or 'undefined') and one that maps each
+        argument to its number.
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c, d], [Defeat(a, b), Defeat(b, c), Defeat(d, d)])
+    >>> status_by_argument, number_by_argument = \\
+    ...     get_numbered_grounded_labelling(af)
+    >>> [status_by_argument[argument] for argument in [a, b, c, d]]
+    ['accepted', 'defeated', 'accepted', 'undefined']
+    >>> [number_by_argument[argument] for argument in [a, b, c, d]]
+    [0, 1, 2, None]
+    """
+    graph = argumentation_framework.compact_graph
+    nr_of_arguments = len(graph)
+
+    number = [None] * nr_of_arguments
+    is_accepted = [False] * nr_of_arguments
+    nr_of_undefeated_defeaters = [graph.in_degree(index)
+                                  for index in range(nr_of_arguments)]
+
+    worklist = deque()
+    for index in range(nr_of_arguments):
+        if nr_of_undefeated_defeaters[index] == 0:
+            number[index] = 0
+            is_accepted[index] = True
+            worklist.append(index)
+
+    while worklist:
+        index = worklist.popleft()
+        successors = graph.successors(index)
+        if is_accepted[index]:
+            # Everything defeated by an accepted argument is defeated.
+            for defeated in successors:
+                if number[defeated] is None:
+                    number[defeated] = number[index] + 1
+                    worklist.append(defeated)
+        else:
+            # Arguments whose last undefeated defeater is now defeated are
+            # accepted.
+            for defeated in successors:
+                nr_of_undefeated_defeaters[defeated] -= 1
+                if nr_of_undefeated_defeaters[defeated] == 0 and \
+                        number[defeated] is None:
+                    number[defeated] = number[index] + 1
+                    is_accepted[defeated] = True
+                    worklist.append(defeated)
+
+    status_by_argument = {}
+    number_by_argument = {}
+    for index, argument in enumerate(graph.arguments):
+        if number[index] is None:
+            status_by_argument[argument] = 'undefined'
+        elif is_accepted[index]:
+            status_by_argument[argument] = 'accepted'
+        else:
+            status_by_argument[argument] = 'defeated'
+        number_by_argument[argument] = number[index]
+    return status_by_argument, number_by_argument
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -1,44 +1,73 @@
-from typing import Set, TypeVar, FrozenSet
+from typing import Set, TypeVar, FrozenSet, Optional
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
-from py_arg.abstract_argumentation.semantics.get_admissible_sets import \
-    get_admissible_sets
-from py_arg.abstract_argumentation.semantics.get_preferred_extensions import \
-    get_preferred_extensions
+from py_arg.abstract_argumentation.semantics.acceptance_strategy import \
+    AcceptanceStrategy
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    admissible_solver import AdmissibleSolver
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    solver_session import SolverSession
+from py_arg.abstract_argumentation.semantics.get_maximal_admissible_subset \
+    import get_maximal_admissible_subset
+
+# Based on Theorem 3 from Dunne, Paul E. "The computational complexity of
+# ideal semantics." Artificial Intelligence 173.18 (2009): 1559-1591.
 
 T = TypeVar('T', bound=Argument)
 
 
 def get_ideal_extension(
-        argumentation_framework: AbstractArgumentationFramework) -> \
+        argumentation_framework: AbstractArgumentationFramework,
+        session: Optional[SolverSession] = None) -> \
         Set[T]:
     """
-    Get the ideal extension of an argumentation framework.
+    Get the ideal extension of an argumentation framework: the largest
+    admissible set that is contained in each preferred extension.
+
+    This is the largest admissible subset of the (conflict-free) set of
+    credulously accepted arguments that are not defeated by any credulously
+    accepted argument. So instead of enumerating all admissible sets and
+    preferred extensions, a single brave reasoning call is needed.
 
     :param argumentation_framework: The argumentation framework for which we
         need the ideal extension.
+    :param session: Optional solver session for this argumentation framework.
     :return: ideal extension of the argumentation framework.
-    """
-    admissible_sets = get_admissible_sets(argumentation_framework)
-    preferred_extensions = get_preferred_extensions(argumentation_framework)
-    preferred_extension_sets = (set(ext) for ext in preferred_extensions)
-
-    intersect_preferred = set.intersection(*preferred_extension_sets)
 
-    max_admissible_subset_of_preferred = None
-    for candidate_ideal_extension in admissible_sets:
-        if candidate_ideal_extension <= intersect_preferred:
-            if not max_admissible_subset_of_preferred:
-                max_admissible_subset_of_preferred = candidate_ideal_extension
-            if candidate_ideal_extension > max_admissible_subset_of_preferred:
-                max_admissible_subset_of_preferred = candidate_ideal_extension
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c, d], [Defeat(a, b), Defeat(b, a), Defeat(a, c),
+    ...                          Defeat(b, c), Defeat(c, d)])
+    >>> sorted(get_ideal_extension(af))
+    []
+    """
+    if session is None:
+        credulously_accepted = AdmissibleSolver().get_accepted_arguments(
+            argumentation_framework, AcceptanceStrategy.CREDULOUS)
+    else:
+        credulously_accepted = session.get_accepted_arguments(
+            AdmissibleSolver, AcceptanceStrategy.CREDULOUS)
 
-    return set(max_admissible_subset_of_preferred)
+    candidates = {
+        argument for argument in credulously_accepted
+        if not any(defeater in credulously_accepted
+                   for defeater in
+                   argumentation_framework.get_incoming_defeat_arguments(
+                       argument))}
+    return get_maximal_admissible_subset(candidates, argumentation_framework)
 
 
 def get_ideal_extensions(
-        argumentation_framework: AbstractArgumentationFramework) -> \
+        argumentation_framework: AbstractArgumentationFramework,
+        session: Optional[SolverSession] = None) -> \
         Set[FrozenSet[T]]:
-    return {frozenset(get_ideal_extension(argumentation_framework))}
+    return {frozenset(get_ideal_extension(argumentation_framework, session))}
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
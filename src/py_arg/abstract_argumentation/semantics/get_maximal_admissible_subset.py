@@ -0,0 +1,50 @@
+from typing import Set, Iterable, TypeVar
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+
+T = TypeVar('T', bound=Argument)
+
+
+def get_maximal_admissible_subset(
+        argument_set: Iterable[T],
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        Set[T]:
+    """
+    Get the largest admissible subset of a conflict-free set of arguments,
+    by removing arguments that are not defended by the remaining arguments
+    until all are. (Any admissible subset defends all its arguments, so none
+    of them is ever removed; and the union of admissible subsets of a
+    conflict-free set is admissible.)
+
+    :param argument_set: A conflict-free set of arguments.
+    :param argumentation_framework: Abstract argumentation framework.
+    :return: The maximal admissible subset of the argument set.
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c, d], [Defeat(a, b), Defeat(b, c), Defeat(d, d)])
+    >>> sorted(get_maximal_admissible_subset([a, c], af))
+    [a, c]
+    >>> get_maximal_admissible_subset([c], af)
+    set()
+    """
+    graph = argumentation_framework.compact_graph
+    candidates = {graph.index_of[argument.name] for argument in argument_set}
+    while True:
+        defeated = {defeated_index for index in candidates
+                    for defeated_index in graph.successors(index)}
+        defended = {index for index in candidates
+                    if all(defeater in defeated
+                           for defeater in graph.predecessors(index))}
+        if defended == candidates:
+            return {graph.arguments[index] for index in candidates}
+        candidates = defended
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -1,9 +1,17 @@
-from typing import Set, TypeVar
+from typing import Set, TypeVar, Iterator, FrozenSet
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
 from py_arg.abstract_argumentation.semantics.get_conflict_free_extensions \
-    import get_conflict_free_extensions
+    import get_compatible_masks
+from py_arg.utils.bitset import iterate_bits, to_bitset
+
+# Naive extensions are the maximal independent sets of the conflict graph,
+# so the maximal cliques of its complement. These are enumerated by the
+# algorithm of Bron and Kerbosch with pivoting as in Tomita, Etsuji, Akira
+# Tanaka, and Haruhisa Takahashi. "The worst-case time complexity for
+# generating all maximal cliques and computational experiments." Theoretical
+# Computer Science 363.1 (2006): 28-42.
 
 T = TypeVar('T', bound=Argument)
 
@@ -11,13 +19,61 @@ T = TypeVar('T', bound=Argument)
 def get_naive_extensions(
         argumentation_framework: AbstractArgumentationFramework) -> \
         Set[frozenset[T]]:
-    conflict_free_extensions = \
-        get_conflict_free_extensions(argumentation_framework)
+    return set(iterate_naive_extensions(argumentation_framework))
+
+
+def iterate_naive_extensions(
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        Iterator[FrozenSet[T]]:
+    """
+    Yield the naive extensions (maximal conflict-free sets) of an
+    argumentation framework one by one, each exactly once.
+
+    :param argumentation_framework: The argumentation framework.
+    :return: Iterator over the naive extensions.
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c, d], [Defeat(a, b), Defeat(b, c), Defeat(d, d)])
+    >>> sorted(sorted(extension)
+    ...        for extension in iterate_naive_extensions(af))
+    [[a, c], [b]]
+    """
+    graph = argumentation_framework.compact_graph
+    arguments = graph.arguments
+    compatible_masks = get_compatible_masks(argumentation_framework)
+    candidate_mask = to_bitset(
+        index for index in range(len(graph))
+        if not graph.is_self_defeating(index))
+
+    # States are (IN arguments, candidates that can still be added, excluded
+    # arguments that could be added but were already covered by another
+    # branch).
+    stack = [(0, candidate_mask, 0)]
+    while stack:
+        in_mask, candidate_mask, excluded_mask = stack.pop()
+        if not candidate_mask:
+            if not excluded_mask:
+                yield frozenset(arguments[index]
+                                for index in iterate_bits(in_mask))
+            continue
+
+        # Each maximal set below this state contains the pivot or an
+        # argument in conflict with it, so only branch on those.
+        pivot = max(iterate_bits(candidate_mask | excluded_mask),
+                    key=lambda index: bin(
+                        candidate_mask & compatible_masks[index]).count('1'))
+        for index in iterate_bits(candidate_mask &
+                                  ~compatible_masks[pivot]):
+            stack.append((in_mask | (1 << index),
+                          candidate_mask & compatible_masks[index],
+                          excluded_mask & compatible_masks[index]))
+            candidate_mask &= ~(1 << index)
+            excluded_mask |= 1 << index
+
 
-    naive_extensions = {
-        extension for extension in conflict_free_extensions
-        if not any(other_extension > extension
-                   for other_extension in conflict_free_extensions)
-    }
+if __name__ == "__main__":
+    import doctest
 
-    return naive_extensions
+    doctest.testmod()
@@ -1,12 +1,16 @@
-from typing import Set, Dict, FrozenSet, TypeVar
+from typing import Set, Dict, FrozenSet, TypeVar, Callable
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.branching_heuristics import \
+    BranchingHeuristic, first_blank
 from py_arg.abstract_argumentation.semantics.extended_extension_label import \
     ExtendedExtensionLabel
 from py_arg.abstract_argumentation.semantics.get_extensions_recursive import \
-    recursively_get_extensions
+    recursively_get_extensions, get_complete_pruning, \
+    get_complete_propagation, MaskLabelling
+from py_arg.utils.bitset import to_bitset
 
 
 # Algorithm 1 from Samer Nofal, Katie Atkinson and Paul E. Dunne.
@@ -25,24 +29,63 @@ def _update_preferred_extensions_by_labelling(
         argument for argument in argumentation_framework.arguments
         if labelling[argument] == ExtendedExtensionLabel.IN}))
     # Only keep this extension if no other extension that was found
-    # earlier is a proper subset of this one.
+    # earlier is a proper superset of this one.
     if not any(candidate_preferred_extension < preferred_extension
                for preferred_extension in extensions):
+        # Extensions found earlier that are a proper subset of this one are
+        # not preferred after all (this can only happen for some branching
+        # heuristics).
+        for preferred_extension in \
+                [preferred_extension for preferred_extension in extensions
+                 if preferred_extension < candidate_preferred_extension]:
+            extensions.remove(preferred_extension)
         extensions.add(candidate_preferred_extension)
 
 
+def _get_preferred_pruning(
+        argumentation_framework: AbstractArgumentationFramework,
+        extensions: Set[FrozenSet[T]]) -> \
+        Callable[[MaskLabelling, int], bool]:
+    index_of = argumentation_framework.compact_graph.index_of
+    mask_by_extension = {}
+    # Preferred extensions are complete.
+    complete_pruning = get_complete_pruning(argumentation_framework)
+
+    def prune(labelling: MaskLabelling, blank_mask: int) -> bool:
+        if complete_pruning(labelling, blank_mask):
+            return True
+        # The IN arguments of any labelling below this state are among the
+        # current IN and BLANK arguments. If those are all in an extension
+        # that was already found, nothing new can be found here.
+        in_or_blank_mask = labelling[0] | blank_mask
+        for extension in extensions:
+            if extension not in mask_by_extension:
+                mask_by_extension[extension] = to_bitset(
+                    index_of[argument.name] for argument in extension)
+            if not in_or_blank_mask & ~mask_by_extension[extension]:
+                return True
+        return False
+    return prune
+
+
 def get_preferred_extensions(
-        argumentation_framework: AbstractArgumentationFramework) -> \
+        argumentation_framework: AbstractArgumentationFramework,
+        branching_heuristic: BranchingHeuristic = first_blank) -> \
         Set[FrozenSet[T]]:
     """
     Get the preferred extensions of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for
         which we need the preferred extensions.
+    :param branching_heuristic: Heuristic that chooses the next argument to
+        branch on (see branching_heuristics).
     :return: Preferred extension of the argumentation framework.
     """
     initial_labelling = {argument: ExtendedExtensionLabel.BLANK
                          for argument in argumentation_framework.arguments}
+    extensions = set()
     return recursively_get_extensions(
-        argumentation_framework, initial_labelling, set(),
-        _update_preferred_extensions_by_labelling)
+        argumentation_framework, initial_labelling, extensions,
+        _update_preferred_extensions_by_labelling, branching_heuristic,
+        _get_preferred_pruning(argumentation_framework, extensions),
+        get_complete_propagation(argumentation_framework))
@@ -0,0 +1,219 @@
+from typing import Callable, Dict, FrozenSet, List, Set, Tuple, TypeVar
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.classes.compact_graph import CompactGraph
+from py_arg.abstract_argumentation.classes.defeat import Defeat
+from py_arg.abstract_argumentation.semantics import get_complete_extensions, \
+    get_grounded_extension, get_preferred_extensions, get_stable_extensions
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers import \
+    complete_solver, grounded_solver, preferred_solver, stable_solver
+
+# Based on Baroni, Pietro, Massimiliano Giacomin, and Giovanni Guida.
+# "SCC-recursiveness: a general schema for argumentation semantics."
+# Artificial Intelligence 168.1-2 (2005): 162-210, in the labelling-based
+# form of Baroni, Pietro, et al. "On the input/output behavior of
+# argumentation frameworks." Artificial Intelligence 217 (2014): 144-197.
+
+T = TypeVar('T', bound=Argument)
+
+IN, OUT, UNDEC = 1, 2, 3
+
+ExtensionFunction = Callable[[AbstractArgumentationFramework],
+                             Set[FrozenSet[Argument]]]
+
+# Per engine and semantics: the function that solves a single component.
+EXTENSION_FUNCTION_BY_ENGINE: Dict[str, Dict[str, ExtensionFunction]] = {
+    'native': {
+        'Complete': get_complete_extensions.get_complete_extensions,
+        'Grounded': get_grounded_extension.get_grounded_extensions,
+        'Preferred': get_preferred_extensions.get_preferred_extensions,
+        'Stable': get_stable_extensions.get_stable_extensions,
+    },
+    'clingo': {
+        'Complete': complete_solver.get_complete_extensions,
+        'Grounded': grounded_solver.get_grounded_extensions,
+        'Preferred': preferred_solver.get_preferred_extensions,
+        'Stable': stable_solver.get_stable_extensions,
+    }
+}
+
+# Semi-stable semantics is not SCC-recursive, but its extensions are the
+# preferred extensions with minimal UNDEC arguments.
+COMPONENT_SEMANTICS = {'Complete': 'Complete', 'Grounded': 'Grounded',
+                       'Preferred': 'Preferred', 'Stable': 'Stable',
+                       'SemiStable': 'Preferred'}
+
+
+def get_scc_recursive_extensions(
+        argumentation_framework: AbstractArgumentationFramework,
+        semantics_specification: str, engine: str = 'native') -> \
+        Set[FrozenSet[T]]:
+    """
+    Get the extensions of an argumentation framework by solving its strongly
+    connected components one at a time, in topological order.
+
+    Each component is solved given the labels of the arguments defeating it
+    from upstream components: arguments defeated by an upstream IN argument
+    are OUT, and arguments defeated by an upstream UNDEC argument cannot be
+    IN. This is done by solving a small framework consisting of the other
+    arguments of the component, plus (self-defeating copies of) the upstream
+    UNDEC arguments. Components are often solved for the same upstream
+    labels, so their solutions are cached; components of a single argument
+    are labelled directly.
+
+    :param argumentation_framework: The argumentation framework.
+    :param semantics_specification: 'Grounded', 'Complete', 'Preferred',
+        'Stable' or 'SemiStable'.
+    :param engine: Solver for the components: 'native' or 'clingo'.
+    :return: The extensions of the argumentation framework.
+
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c, d], [Defeat(a, b), Defeat(b, a), Defeat(b, c),
+    ...                          Defeat(c, d), Defeat(d, c)])
+    >>> sorted(sorted(argument.name for argument in extension) for extension
+    ...        in get_scc_recursive_extensions(af, 'Preferred'))
+    [['a', 'c'], ['a', 'd'], ['b', 'd']]
+    >>> sorted(sorted(argument.name for argument in extension) for extension
+    ...        in get_scc_recursive_extensions(af, 'Grounded', 'clingo'))
+    [[]]
+    """
+    if engine not in EXTENSION_FUNCTION_BY_ENGINE:
+        raise ValueError('Unknown engine ' + engine + '.')
+    if semantics_specification not in COMPONENT_SEMANTICS:
+        raise ValueError('The semantics ' + semantics_specification +
+                         ' is not supported by the SCC-recursive evaluator.')
+    component_semantics = COMPONENT_SEMANTICS[semantics_specification]
+    get_extensions = \
+        EXTENSION_FUNCTION_BY_ENGINE[engine][component_semantics]
+
+    graph = argumentation_framework.compact_graph
+    labellings = [[None] * len(graph)]
+    for component in graph.strongly_connected_components():
+        solution_cache = {}
+        next_labellings = []
+        for labelling in labellings:
+            component_labellings = _get_component_labellings(
+                graph, component, labelling, component_semantics,
+                get_extensions, solution_cache)
+            # Copy the labelling only if the component has several solutions.
+            for position, component_labelling in \
+                    enumerate(component_labellings):
+                if position < len(component_labellings) - 1:
+                    next_labelling = list(labelling)
+                else:
+                    next_labelling = labelling
+                for index, label in zip(component, component_labelling):
+                    next_labelling[index] = label
+                next_labellings.append(next_labelling)
+        labellings = next_labellings
+        if not labellings:
+            return set()
+
+    if semantics_specification == 'SemiStable':
+        undec_sets = [frozenset(index for index, label in enumerate(labelling)
+                                if label == UNDEC)
+                      for labelling in labellings]
+        labellings = [labelling
+                      for labelling, undec in zip(labellings, undec_sets)
+                      if not any(other < undec for other in undec_sets)]
+
+    return {frozenset(graph.arguments[index]
+                      for index, label in enumerate(labelling) if label == IN)
+            for labelling in labellings}
+
+
+def _get_component_labellings(
+        graph: CompactGraph, component: List[int], labelling: List[int],
+        component_semantics: str, get_extensions: ExtensionFunction,
+        solution_cache: Dict[Tuple[FrozenSet[int], FrozenSet[int]],
+                             List[Tuple[int, ...]]]) -> \
+        List[Tuple[int, ...]]:
+    """
+    Get the labellings of one component (labels in the order of the
+    component's arguments), given the labels of all upstream arguments.
+    """
+    members = set(component)
+    forced_out = set()
+    undec_defeater = {}
+    for index in component:
+        for defeater in graph.predecessors(index):
+            if defeater in members:
+                continue
+            if labelling[defeater] == IN:
+                forced_out.add(index)
+            elif labelling[defeater] == UNDEC:
+                undec_defeater[index] = defeater
+    for index in forced_out:
+        undec_defeater.pop(index, None)
+
+    key = (frozenset(forced_out), frozenset(undec_defeater))
+    if key in solution_cache:
+        return solution_cache[key]
+
+    if len(component) == 1 and not graph.is_self_defeating(component[0]):
+        if forced_out:
+            label = OUT
+        elif undec_defeater:
+            label = UNDEC
+        else:
+            label = IN
+        if label == UNDEC and component_semantics == 'Stable':
+            solution = []
+        else:
+            solution = [(label,)]
+    else:
+        solution = _solve_component(graph, component, forced_out,
+                                    undec_defeater, get_extensions)
+    solution_cache[key] = solution
+    return solution
+
+
+def _solve_component(
+        graph: CompactGraph, component: List[int], forced_out: Set[int],
+        undec_defeater: Dict[int, int], get_extensions: ExtensionFunction) -> \
+        List[Tuple[int, ...]]:
+    """
+    Solve the framework of the component's arguments that are not forced OUT,
+    where upstream UNDEC defeaters are replaced by self-defeating arguments.
+    """
+    remaining = [index for index in component if index not in forced_out]
+    remaining_set = set(remaining)
+    arguments = graph.arguments
+    undec_arguments = sorted(set(undec_defeater.values()))
+    defeats = [Defeat(arguments[index], arguments[index])
+               for index in undec_arguments]
+    for index in remaining:
+        for defeater in graph.predecessors(index):
+            if defeater in remaining_set:
+                defeats.append(Defeat(arguments[defeater], arguments[index]))
+        if index in undec_defeater:
+            defeats.append(Defeat(arguments[undec_defeater[index]],
+                                  arguments[index]))
+    component_framework = AbstractArgumentationFramework(
+        '', [arguments[index] for index in remaining + undec_arguments],
+        defeats)
+
+    solution = []
+    for extension in get_extensions(component_framework):
+        in_indices = {graph.index_of[argument.name] for argument in extension}
+        component_labelling = []
+        for index in component:
+            if index in in_indices:
+                component_labelling.append(IN)
+            elif index in forced_out or any(
+                    defeater in in_indices
+                    for defeater in graph.predecessors(index)):
+                component_labelling.append(OUT)
+            else:
+                component_labelling.append(UNDEC)
+        solution.append(tuple(component_labelling))
+    return solution
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
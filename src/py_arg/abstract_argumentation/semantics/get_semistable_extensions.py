@@ -1,173 +1,87 @@
-from typing import Set, Dict, FrozenSet, TypeVar
+from typing import Set, FrozenSet, TypeVar, Iterable, Dict, List
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.branching_heuristics import \
+    BranchingHeuristic, first_blank
 from py_arg.abstract_argumentation.semantics.get_preferred_extensions import \
-    ExtendedExtensionLabel
+    get_preferred_extensions
+from py_arg.utils.bitset import MinimalBitsets, iterate_bits, to_bitset
 
 
-# Algorithm for preferred semantics (Section 5.1), adapted as described in
-# Section 6 in Sanjay Modgil and Martin Caminada.
-# "Proof Theories and Algorithms for Abstract Argumentation Frameworks."
-# In Argumentation in Artificial Intelligence (2009), 105–132
+# Semi-stable extensions are the complete extensions with a minimal set of
+# UNDEC arguments (Caminada, Martin. "Semi-stable semantics." COMMA 2006),
+# and these are preferred. So instead of the labelling transitions of
+# Modgil and Caminada, the preferred extensions are found by the (pruned)
+# labelling search of get_extensions_recursive, which never visits a
+# labelling twice, and only those with a minimal UNDEC set are kept.
 
 T = TypeVar('T', bound=Argument)
 
 
 def get_semi_stable_extensions(
-        argumentation_framework: AbstractArgumentationFramework) -> \
+        argumentation_framework: AbstractArgumentationFramework,
+        branching_heuristic: BranchingHeuristic = first_blank) -> \
         Set[FrozenSet[T]]:
     """
     Get the semi-stable extensions of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for which we
         need the semi-stable extensions.
+    :param branching_heuristic: Heuristic that chooses the next argument to
+        branch on (see branching_heuristics).
     :return: semi-stable extension of the argumentation framework.
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(b, c),
+    ...                       Defeat(c, c)])
+    >>> get_semi_stable_extensions(af)
+    {frozenset({b})}
+    """
+    return get_extensions_with_minimal_uncovered_arguments(
+        argumentation_framework,
+        get_preferred_extensions(argumentation_framework,
+                                 branching_heuristic))
+
+
+def get_extensions_with_minimal_uncovered_arguments(
+        argumentation_framework: AbstractArgumentationFramework,
+        extensions: Iterable[FrozenSet[T]]) -> Set[FrozenSet[T]]:
+    """
+    Get the extensions whose range (the extension and the arguments it
+    defeats) is maximal, that is: whose set of arguments outside the range
+    (the UNDEC arguments of the corresponding labelling) is minimal.
+
+    :param argumentation_framework: The argumentation framework.
+    :param extensions: The (conflict-free) candidate extensions.
+    :return: The candidate extensions with a maximal range.
     """
-    candidate_labellings = []
-    initial_labelling = {argument: ExtendedExtensionLabel.IN
-                         for argument in argumentation_framework.arguments}
-
-    def _find_semi_stable_labellings(
-            current_labelling: Dict[T, ExtendedExtensionLabel]):
-        nonlocal candidate_labellings
-        nonlocal argumentation_framework
-
-        # Return if the UNDEC labels of some candidate labelling is a strict
-        # subset of the UNDEC labels of the current labelling.
-        current_undec_arguments = frozenset(sorted(
-            {argument for argument in argumentation_framework.arguments
-             if current_labelling[argument] == ExtendedExtensionLabel.UNDEC}))
-        for other_labelling in candidate_labellings:
-            other_undec_arguments = frozenset(sorted(
-                {argument for argument in argumentation_framework.arguments
-                 if
-                 other_labelling[argument] == ExtendedExtensionLabel.UNDEC}))
-            if other_undec_arguments < current_undec_arguments:
-                return
-
-        # Check if current_labelling has an argument that is illegally IN.
-        illegally_in_arguments = {
-            argument for argument in argumentation_framework.arguments
-            if is_illegally_in(current_labelling, argument,
-                               argumentation_framework)
-        }
-
-        if not illegally_in_arguments:
-            new_candidate_labellings = []
-            for candidate_labelling in candidate_labellings:
-                # Only keep this candidate if the current labelling's UNDEC
-                # arguments are not a strict super subset of the candidate's
-                # UNDEC arguments.
-                other_in_arguments = frozenset(sorted(
-                    {argument for argument in argumentation_framework.arguments
-                     if candidate_labelling[argument] ==
-                     ExtendedExtensionLabel.UNDEC}))
-                if not current_undec_arguments < other_in_arguments and \
-                        candidate_labelling not in new_candidate_labellings:
-                    new_candidate_labellings.append(candidate_labelling)
-
-            # Also add the current candidate itself and return.
-            new_candidate_labellings.append(current_labelling)
-            candidate_labellings = new_candidate_labellings
-            return
-        else:
-            # Try to find a super illegally IN argument in the current
-            # labelling.
-            super_illegally_in_argument = None
-            for argument in argumentation_framework.arguments:
-                if is_super_illegally_in(current_labelling, argument,
-                                         argumentation_framework):
-                    super_illegally_in_argument = argument
-                    break
-
-            if super_illegally_in_argument:
-                new_labelling = transition_step(
-                    current_labelling, super_illegally_in_argument,
-                    argumentation_framework)
-                _find_semi_stable_labellings(new_labelling)
-            else:
-                for illegally_in_argument in illegally_in_arguments:
-                    new_labelling = transition_step(
-                        current_labelling, illegally_in_argument,
-                        argumentation_framework)
-                    _find_semi_stable_labellings(new_labelling)
-
-    _find_semi_stable_labellings(initial_labelling)
-    return {
-        frozenset(sorted(
-            {argument for argument in argumentation_framework.arguments
-             if labelling[argument] == ExtendedExtensionLabel.IN}))
-        for labelling in candidate_labellings
-    }
-
-
-def is_illegally_in(
-        labelling: Dict[T, ExtendedExtensionLabel],
-        argument: T,
-        argumentation_framework: AbstractArgumentationFramework
-) -> bool:
-    if not labelling[argument] == ExtendedExtensionLabel.IN:
-        return False
-
-    defeaters = argumentation_framework.get_incoming_defeat_arguments(argument)
-    for defeater in defeaters:
-        if labelling[defeater] != ExtendedExtensionLabel.OUT:
-            return True
-
-    return False
-
-
-def is_legally_in(
-        labelling: Dict[T, ExtendedExtensionLabel],
-        argument: T,
-        argumentation_framework: AbstractArgumentationFramework
-) -> bool:
-    if not labelling[argument] == ExtendedExtensionLabel.IN:
-        return False
-
-    defeaters = argumentation_framework.get_incoming_defeat_arguments(argument)
-    for defeater in defeaters:
-        if labelling[defeater] != ExtendedExtensionLabel.OUT:
-            return False
-
-    return True
-
-
-def is_super_illegally_in(
-        labelling: Dict[T, ExtendedExtensionLabel],
-        argument: T,
-        argumentation_framework: AbstractArgumentationFramework
-) -> bool:
-    if not labelling[argument] == ExtendedExtensionLabel.IN:
-        return False
-
-    defeaters = argumentation_framework.get_incoming_defeat_arguments(argument)
-    for defeater in defeaters:
-        if labelling[defeater] == ExtendedExtensionLabel.UNDEC:
-            return True
-        if is_legally_in(labelling, defeater, argumentation_framework):
-            return True
-    return False
-
-
-def transition_step(
-        labelling: Dict[T, ExtendedExtensionLabel],
-        argument: T,
-        argumentation_framework: AbstractArgumentationFramework) -> \
-        Dict[T, ExtendedExtensionLabel]:
-    # The label of the argument is changed from IN to OUT.
-    new_labelling = labelling.copy()
-    new_labelling[argument] = ExtendedExtensionLabel.OUT
-
-    # Specific arguments that are illegally labelled OUT become UNDEC.
-    arguments_to_check = [argument] + \
-        argumentation_framework.get_outgoing_defeat_arguments(argument)
-    for argument_to_check in arguments_to_check:
-        if new_labelling[argument_to_check] == ExtendedExtensionLabel.OUT and \
-            all(new_labelling[defeater] != ExtendedExtensionLabel.IN
-                for defeater in argumentation_framework.
-                get_incoming_defeat_arguments(argument_to_check)):
-            new_labelling[argument_to_check] = ExtendedExtensionLabel.UNDEC
-    return new_labelling
+    graph = argumentation_framework.compact_graph
+    all_mask = (1 << len(graph)) - 1
+    defeated_masks = [to_bitset(graph.successors(index))
+                      for index in range(len(graph))]
+
+    minimal_uncovered_masks = MinimalBitsets()
+    extensions_by_uncovered_mask: Dict[int, List[FrozenSet[T]]] = {}
+    for extension in extensions:
+        in_mask = to_bitset(graph.index_of[argument.name]
+                            for argument in extension)
+        range_mask = in_mask
+        for index in iterate_bits(in_mask):
+            range_mask |= defeated_masks[index]
+        uncovered_mask = all_mask & ~range_mask
+        if minimal_uncovered_masks.add(uncovered_mask):
+            extensions_by_uncovered_mask.setdefault(
+                uncovered_mask, []).append(extension)
+
+    return {extension for uncovered_mask in minimal_uncovered_masks
+            for extension in extensions_by_uncovered_mask[uncovered_mask]}
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
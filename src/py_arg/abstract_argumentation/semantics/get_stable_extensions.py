@@ -1,12 +1,16 @@
-from typing import Set, Dict, FrozenSet, TypeVar
+from typing import Set, Dict, FrozenSet, TypeVar, Callable
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
 from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.branching_heuristics import \
+    BranchingHeuristic, first_blank
 from py_arg.abstract_argumentation.semantics.get_extensions_recursive import \
-    recursively_get_extensions
+    recursively_get_extensions, get_defeater_masks, \
+    get_complete_propagation, MaskLabelling
 from py_arg.abstract_argumentation.semantics.get_preferred_extensions import \
     ExtendedExtensionLabel
+from py_arg.utils.bitset import iterate_bits
 
 
 # Adapted from Algorithm 1 from Nofal, Samer, Katie Atkinson, and Paul E.
@@ -31,18 +35,38 @@ def _update_stable_extensions_by_labelling(
             if labelling[argument] == ExtendedExtensionLabel.IN})))
 
 
-def get_stable_extensions(
+def _get_stable_pruning(
         argumentation_framework: AbstractArgumentationFramework) -> \
+        Callable[[MaskLabelling, int], bool]:
+    defeater_masks = get_defeater_masks(argumentation_framework)
+
+    def prune(labelling: MaskLabelling, blank_mask: int) -> bool:
+        # An UNDEC argument can only end up OUT if some BLANK argument can
+        # still be labelled IN and defeat it. Otherwise it stays UNDEC, which
+        # is not allowed in a stable labelling.
+        undec_mask = labelling[3]
+        return any(not defeater_masks[index] & blank_mask
+                   for index in iterate_bits(undec_mask))
+    return prune
+
+
+def get_stable_extensions(
+        argumentation_framework: AbstractArgumentationFramework,
+        branching_heuristic: BranchingHeuristic = first_blank) -> \
         Set[FrozenSet[T]]:
     """
     Get the stable extensions of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for which we
     need the stable extensions.
+    :param branching_heuristic: Heuristic that chooses the next argument to
+    branch on (see branching_heuristics).
     :return: stable extension of the argumentation framework.
     """
     initial_labelling = {argument: ExtendedExtensionLabel.BLANK
                          for argument in argumentation_framework.arguments}
     return recursively_get_extensions(
         argumentation_framework, initial_labelling, set(),
-        _update_stable_extensions_by_labelling)
+        _update_stable_extensions_by_labelling, branching_heuristic,
+        _get_stable_pruning(argumentation_framework),
+        get_complete_propagation(argumentation_framework))
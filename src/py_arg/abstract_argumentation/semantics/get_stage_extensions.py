@@ -0,0 +1,42 @@
+from typing import Set, FrozenSet, TypeVar
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.get_naive_extensions import \
+    get_naive_extensions
+from py_arg.abstract_argumentation.semantics.get_semistable_extensions \
+    import get_extensions_with_minimal_uncovered_arguments
+
+T = TypeVar('T', bound=Argument)
+
+
+def get_stage_extensions(
+        argumentation_framework: AbstractArgumentationFramework) -> \
+        Set[FrozenSet[T]]:
+    """
+    Get the stage extensions of an argumentation framework: the
+    conflict-free sets with a maximal range. These are naive, so only the
+    naive extensions are compared.
+
+    :param argumentation_framework: The argumentation framework for which we
+        need the stage extensions.
+    :return: stage extensions of the argumentation framework.
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c], [Defeat(a, b), Defeat(b, c), Defeat(c, a)])
+    >>> sorted(sorted(argument.name for argument in extension)
+    ...        for extension in get_stage_extensions(af))
+    [['a'], ['b'], ['c']]
+    """
+    return get_extensions_with_minimal_uncovered_arguments(
+        argumentation_framework,
+        get_naive_extensions(argumentation_framework))
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
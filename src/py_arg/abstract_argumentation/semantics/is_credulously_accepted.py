@@ -0,0 +1,87 @@
+from typing import Optional
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.acceptance_strategy import \
+    AcceptanceStrategy
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    admissible_solver import AdmissibleSolver
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    solver_session import SolverSession
+from py_arg.abstract_argumentation.semantics.\
+    get_argumentation_framework_extensions import SOLVER_BY_SEMANTICS
+from py_arg.abstract_argumentation.semantics.get_eager_extension import \
+    get_eager_extension
+from py_arg.abstract_argumentation.semantics.get_grounded_extension import \
+    get_numbered_grounded_labelling
+from py_arg.abstract_argumentation.semantics.get_ideal_extension import \
+    get_ideal_extension
+
+
+def is_credulously_accepted(
+        argumentation_framework: AbstractArgumentationFramework,
+        argument: Argument,
+        semantics_specification: str,
+        session: Optional[SolverSession] = None) -> bool:
+    """
+    Check if the argument is in at least one extension of the argumentation
+    framework under the chosen semantics, without enumerating all
+    extensions.
+
+    Grounded, conflict-free and naive acceptance are decided natively.
+    Complete and preferred acceptance coincide with admissible acceptance,
+    which (like the other clingo-based semantics) is decided by brave
+    reasoning that stops at the first extension containing the argument.
+
+    :param argumentation_framework: The abstract argumentation framework.
+    :param argument: The argument that may be accepted.
+    :param semantics_specification: The chosen semantics.
+    :param session: Optional solver session for this argumentation framework.
+    :return: Is the argument credulously accepted?
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(c, c)])
+    >>> is_credulously_accepted(af, a, 'Preferred')
+    True
+    >>> is_credulously_accepted(af, a, 'Grounded')
+    False
+    >>> is_credulously_accepted(af, c, 'Naive')
+    False
+    """
+    argumentation_framework.get_argument(argument.name)
+
+    if semantics_specification == 'Grounded':
+        status_by_argument, _ = \
+            get_numbered_grounded_labelling(argumentation_framework)
+        return status_by_argument[argument] == 'accepted'
+    if semantics_specification in ('ConflictFree', 'Naive'):
+        graph = argumentation_framework.compact_graph
+        return not graph.is_self_defeating(graph.index_of[argument.name])
+    if semantics_specification == 'Ideal':
+        return argument in get_ideal_extension(argumentation_framework,
+                                               session)
+    if semantics_specification == 'Eager':
+        return argument in get_eager_extension(argumentation_framework,
+                                               session)
+
+    if semantics_specification in ('Complete', 'Preferred'):
+        solver_class = AdmissibleSolver
+    elif semantics_specification in SOLVER_BY_SEMANTICS:
+        solver_class = SOLVER_BY_SEMANTICS[semantics_specification]
+    else:
+        raise ValueError('Unknown semantics ' + semantics_specification + '.')
+
+    if session is None:
+        return solver_class().is_accepted(
+            argumentation_framework, argument, AcceptanceStrategy.CREDULOUS)
+    return session.is_accepted(solver_class, argument,
+                               AcceptanceStrategy.CREDULOUS)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
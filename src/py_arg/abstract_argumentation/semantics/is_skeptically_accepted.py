@@ -0,0 +1,90 @@
+from typing import Optional
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
+    import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.classes.argument import Argument
+from py_arg.abstract_argumentation.semantics.acceptance_strategy import \
+    AcceptanceStrategy
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.\
+    solver_session import SolverSession
+from py_arg.abstract_argumentation.semantics.\
+    get_argumentation_framework_extensions import SOLVER_BY_SEMANTICS
+from py_arg.abstract_argumentation.semantics.get_eager_extension import \
+    get_eager_extension
+from py_arg.abstract_argumentation.semantics.get_grounded_extension import \
+    get_numbered_grounded_labelling
+from py_arg.abstract_argumentation.semantics.get_ideal_extension import \
+    get_ideal_extension
+
+
+def is_skeptically_accepted(
+        argumentation_framework: AbstractArgumentationFramework,
+        argument: Argument,
+        semantics_specification: str,
+        session: Optional[SolverSession] = None) -> bool:
+    """
+    Check if the argument is in all extensions of the argumentation framework
+    under the chosen semantics (and there is at least one), without
+    enumerating all extensions.
+
+    Grounded and complete acceptance are decided natively by the grounded
+    extension. Admissible and conflict-free acceptance never hold, as the
+    empty set is always an extension. An argument is in all naive extensions
+    iff it does not defeat itself and all other arguments it conflicts with
+    do. The other clingo-based semantics are decided by cautious reasoning
+    that stops at the first extension without the argument.
+
+    :param argumentation_framework: The abstract argumentation framework.
+    :param argument: The argument that may be accepted.
+    :param semantics_specification: The chosen semantics.
+    :param session: Optional solver session for this argumentation framework.
+    :return: Is the argument skeptically accepted?
+
+    >>> from py_arg.abstract_argumentation.classes.defeat import Defeat
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework(
+    ...     'af', [a, b, c], [Defeat(a, b), Defeat(b, b), Defeat(c, c)])
+    >>> is_skeptically_accepted(af, a, 'Stable')
+    False
+    >>> is_skeptically_accepted(af, a, 'Preferred')
+    True
+    >>> is_skeptically_accepted(af, a, 'Naive')
+    True
+    """
+    argumentation_framework.get_argument(argument.name)
+
+    if semantics_specification in ('Grounded', 'Complete'):
+        status_by_argument, _ = \
+            get_numbered_grounded_labelling(argumentation_framework)
+        return status_by_argument[argument] == 'accepted'
+    if semantics_specification in ('Admissible', 'ConflictFree'):
+        return False
+    if semantics_specification == 'Naive':
+        graph = argumentation_framework.compact_graph
+        index = graph.index_of[argument.name]
+        return not graph.is_self_defeating(index) and all(
+            graph.is_self_defeating(other)
+            for neighbours in (graph.predecessors(index),
+                               graph.successors(index))
+            for other in neighbours)
+    if semantics_specification == 'Ideal':
+        return argument in get_ideal_extension(argumentation_framework,
+                                               session)
+    if semantics_specification == 'Eager':
+        return argument in get_eager_extension(argumentation_framework,
+                                               session)
+
+    if semantics_specification not in SOLVER_BY_SEMANTICS:
+        raise ValueError('Unknown semantics ' + semantics_specification + '.')
+    solver_class = SOLVER_BY_SEMANTICS[semantics_specification]
+    if session is None:
+        return solver_class().is_accepted(
+            argumentation_framework, argument, AcceptanceStrategy.SKEPTICAL)
+    return session.is_accepted(solver_class, argument,
+                               AcceptanceStrategy.SKEPTICAL)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,106 @@
+from typing import Dict, Iterable, Iterator, Set
+
+
+def to_bitset(indices: Iterable[int]) -> int:
+    """
+    Get the integer bitset in which exactly the given indices are set.
+
+    >>> bin(to_bitset([0, 2, 3]))
+    '0b1101'
+    >>> to_bitset([])
+    0
+    """
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+def iterate_bits(mask: int) -> Iterator[int]:
+    """
+    Iterate (in increasing order) over the indices that are set in a bitset.
+
+    >>> list(iterate_bits(0b1101))
+    [0, 2, 3]
+    >>> list(iterate_bits(0))
+    []
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def lowest_bit(mask: int) -> int:
+    """
+    Get the smallest index that is set in a (nonzero) bitset.
+
+    >>> lowest_bit(0b1100)
+    2
+    """
+    return (mask & -mask).bit_length() - 1
+
+
+class MinimalBitsets:
+    """
+    The inclusion-minimal bitsets among all bitsets added so far (so: an
+    antichain). Bitsets are grouped by their number of set bits, so a new
+    bitset is only compared with smaller ones (to see if it is minimal) and
+    with larger ones (to remove those that are not minimal anymore).
+
+    >>> minimal_bitsets = MinimalBitsets()
+    >>> minimal_bitsets.add(0b110), minimal_bitsets.add(0b111)
+    (True, False)
+    >>> minimal_bitsets.add(0b010), minimal_bitsets.add(0b001)
+    (True, True)
+    >>> sorted(minimal_bitsets)
+    [1, 2]
+    """
+
+    def __init__(self):
+        self._bitsets_by_size: Dict[int, Set[int]] = {}
+
+    def has_strict_subset(self, mask: int) -> bool:
+        """
+        Check if some bitset in the antichain is a strict subset of mask.
+        """
+        size = bin(mask).count('1')
+        return any(not other & ~mask
+                   for other_size, others in self._bitsets_by_size.items()
+                   if other_size < size
+                   for other in others)
+
+    def add(self, mask: int) -> bool:
+        """
+        Add a bitset, unless it is a strict superset of a bitset in the
+        antichain. Bitsets in the antichain that are strict supersets of the
+        new bitset are removed.
+
+        :param mask: The bitset to add.
+        :return: Was the bitset added (or already in the antichain)?
+        """
+        if self.has_strict_subset(mask):
+            return False
+        size = bin(mask).count('1')
+        for other_size, others in self._bitsets_by_size.items():
+            if other_size > size:
+                others.difference_update(
+                    [other for other in others if not mask & ~other])
+        self._bitsets_by_size.setdefault(size, set()).add(mask)
+        return True
+
+    def __contains__(self, mask: int) -> bool:
+        return mask in self._bitsets_by_size.get(bin(mask).count('1'), ())
+
+    def __iter__(self) -> Iterator[int]:
+        for others in self._bitsets_by_size.values():
+            yield from others
+
+    def __len__(self) -> int:
+        return sum(len(others) for others in self._bitsets_by_size.values())
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -2,14 +2,8 @@ from typing import List, Set
 
 from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
     import AbstractArgumentationFramework
-from py_arg.abstract_argumentation.explanation.get_defending_arguments \
-    import get_defending_arguments_in_extensions, \
-    get_directly_defending_arguments
-from py_arg.abstract_argumentation.explanation.get_attackers_without_defense \
-    import get_attackers_without_defense_in_extensions, get_no_dir_defending, \
-    get_no_self_defense
-from py_arg.abstract_argumentation.explanation.suff_nec \
-    import get_sufficient_or_necessary
+from py_arg.abstract_argumentation.explanation.explanation_engine import \
+    ExplanationEngine
 
 
 def get_argumentation_framework_explanations(
@@ -34,33 +28,19 @@ def get_argumentation_framework_explanations(
     :return: A dictionary with for each (non-)accepted argument its
      explanation, given the parameters.
     """
-    explanation = {}
+    engine = ExplanationEngine(arg_framework, extensions)
     if explanation_type == 'Acceptance':
-        for arg in accepted_arguments:
-            if explanation_function == 'Defending':
-                explanation[str(arg)] = get_defending_arguments_in_extensions(
-                    arg_framework, arg, extensions)
-            elif explanation_function == 'DirDefending':
-                explanation[str(arg)] = get_directly_defending_arguments(
-                    arg_framework, arg, extensions)
-            else:
-                explanation[str(arg)] = get_sufficient_or_necessary(
-                    arg_framework, arg, explanation_function,
-                    explanation_type)
-        return explanation
+        if explanation_function not in ('Defending', 'DirDefending', 'Suff',
+                                        'MinSuff', 'Nec'):
+            raise NotImplementedError
+        return engine.get_explanations(accepted_arguments,
+                                       explanation_function)
 
     elif explanation_type == 'NonAcceptance':
         not_accepted_arguments = [arg for arg in arg_framework.arguments
                                   if arg not in accepted_arguments]
-        for arg in not_accepted_arguments:
-            if explanation_function == 'NoDefAgainst':
-                explanation[str(arg)] = \
-                    get_attackers_without_defense_in_extensions(
-                        arg_framework, arg, extensions)
-            elif explanation_function == 'NoDirDefense':
-                explanation[str(arg)] = get_no_dir_defending(
-                    arg_framework, arg, extensions)
-            elif explanation_function == 'NoSelfDefense':
-                explanation[str(arg)] = get_no_self_defense(
-                    arg_framework, arg, extensions)
-        return explanation
+        if explanation_function not in ('NoDefAgainst', 'NoDirDefense',
+                                        'NoSelfDefense'):
+            return {}
+        return engine.get_explanations(not_accepted_arguments,
+                                       explanation_function)
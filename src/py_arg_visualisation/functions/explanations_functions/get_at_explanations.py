@@ -1,11 +1,5 @@
-from py_arg.abstract_argumentation.explanation.get_defending_arguments \
-    import get_defending_arguments_in_extensions, \
-    get_directly_defending_arguments
-from py_arg.abstract_argumentation.explanation.get_attackers_without_defense \
-    import get_attackers_without_defense_in_extensions, get_no_dir_defending, \
-    get_no_self_defense
-from py_arg.abstract_argumentation.explanation.suff_nec \
-    import get_sufficient_or_necessary
+from py_arg.abstract_argumentation.explanation.explanation_engine import \
+    ExplanationEngine
 
 
 def get_str_explanations(argumentation_theory, semantics,
@@ -38,6 +32,7 @@ def get_str_explanations(argumentation_theory, semantics,
     argumentation_framework = \
         argumentation_theory.create_abstract_argumentation_framework(
             'af', ordering_specification)
+    engine = ExplanationEngine(argumentation_framework, extensions)
     abstract_explanation = {}
     if expl_type == 'Acceptance':
         for formula in accepted_formulas:
@@ -46,14 +41,11 @@ def get_str_explanations(argumentation_theory, semantics,
             suff_expl = []
             for arg in form_arg:
                 if function == 'Defending':
-                    arg_expl.extend(get_defending_arguments_in_extensions(
-                        argumentation_framework, arg, extensions))
+                    arg_expl.extend(engine.get_defending(arg))
                 elif function == 'DirDefending':
-                    arg_expl.extend(get_directly_defending_arguments(
-                        argumentation_framework, arg, extensions))
+                    arg_expl.extend(engine.get_directly_defending(arg))
                 else:
-                    suff_expl.extend(get_sufficient_or_necessary(
-                        argumentation_framework, arg, 'Suff', expl_type))
+                    suff_expl.extend(engine.get_sufficient(arg))
             if suff_expl != []:
                 if function == 'Suff':
                     arg_expl.extend(suff_expl)
@@ -125,15 +117,11 @@ def get_str_explanations(argumentation_theory, semantics,
             arg_expl = []
             for arg in form_arg:
                 if function == 'NoDefAgainst':
-                    arg_expl.extend(
-                        get_attackers_without_defense_in_extensions(
-                            argumentation_framework, arg, extensions))
+                    arg_expl.extend(engine.get_attackers_without_defense(arg))
                 elif function == 'NoDirDefense':
-                    arg_expl.extend(get_no_dir_defending(
-                        argumentation_framework, arg, extensions))
+                    arg_expl.extend(engine.get_no_dir_defending(arg))
                 elif function == 'NoSelfDefense':
-                    arg_expl.extend(get_no_self_defense(
-                        argumentation_framework, arg, extensions))
+                    arg_expl.extend(engine.get_no_self_defense(arg))
             abstract_explanation[str(formula)] = arg_expl
 
     if form == 'Arg':
@@ -0,0 +1,123 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def quote_dot_id(value) -> str:
+    """Quote a name or attribute value for use in a DOT string."""
+    return '"' + str(value).replace('"', '\\"') + '"'
+
+
+def _get_attribute_list(attributes: Dict[str, str]) -> str:
+    return " ".join(f"{key}={quote_dot_id(value)}" for key, value in attributes.items())
+
+
+class DotEdge:
+    """
+    An attack drawn as an edge. Edges drawn "back" are written from the attacked to the attacking argument with
+    dir=back, so that Graphviz ranks them against the direction of the attack while the arrow still points the right
+    way.
+    """
+
+    def __init__(self, from_name: str, to_name: str, attributes: Optional[Dict[str, str]] = None, back: bool = False):
+        self.from_name = from_name
+        self.to_name = to_name
+        self.attributes: Dict[str, str] = dict(attributes or {})
+        self.back = back
+
+    @property
+    def tail(self) -> str:
+        return self.to_name if self.back else self.from_name
+
+    @property
+    def head(self) -> str:
+        return self.from_name if self.back else self.to_name
+
+    def to_dot(self) -> str:
+        attributes = dict(self.attributes)
+        if self.back:
+            attributes["dir"] = "back"
+        edge = f"{quote_dot_id(self.tail)} -> {quote_dot_id(self.head)}"
+        return f"{edge} [{_get_attribute_list(attributes)}]" if attributes else edge
+
+
+class DotGraph:
+    """
+    An in-memory DOT digraph: graph attributes, default node and edge attributes, nodes and edges with their
+    attributes, and rank constraints. The DOT generators build a DotGraph, styling passes (highlighting, provenance,
+    fixes) change it in place, and it is turned into a DOT string once, by to_dot.
+
+    >>> graph = DotGraph({"rankdir": "BT"})
+    >>> graph.add_node("a", {"label": "a.1"})
+    >>> graph.add_node("b")
+    >>> graph.add_edge("a", "b", {"color": "black"}, back=True)
+    >>> graph.add_rank("same", ["a", "b"])
+    >>> graph.get_edge("a", "b").tail
+    'b'
+    >>> print(graph.to_dot())
+    digraph {
+    rankdir="BT"
+        "a" [label="a.1"]
+        "b"
+        "b" -> "a" [color="black" dir="back"]
+        {rank = same "a" "b"}
+    }
+    """
+
+    def __init__(
+        self,
+        graph_attributes: Optional[Dict[str, str]] = None,
+        node_defaults: Optional[Dict[str, str]] = None,
+        edge_defaults: Optional[Dict[str, str]] = None,
+    ):
+        self.graph_attributes: Dict[str, str] = dict(graph_attributes or {})
+        self.node_defaults: Dict[str, str] = dict(node_defaults or {})
+        self.edge_defaults: Dict[str, str] = dict(edge_defaults or {})
+        self.nodes: Dict[str, Dict[str, str]] = {}
+        self.edges: List[DotEdge] = []
+        self.ranks: List[Tuple[str, List[str]]] = []
+        self._edge_by_attack: Dict[Tuple[str, str], DotEdge] = {}
+
+    def add_node(self, name: str, attributes: Optional[Dict[str, str]] = None):
+        self.nodes[name] = dict(attributes or {})
+
+    def add_edge(self, from_name: str, to_name: str, attributes: Optional[Dict[str, str]] = None, back: bool = False):
+        edge = DotEdge(from_name, to_name, attributes, back)
+        self.edges.append(edge)
+        self._edge_by_attack.setdefault((from_name, to_name), edge)
+
+    def get_edge(self, from_name: str, to_name: str) -> Optional[DotEdge]:
+        """Get the edge of the attack from from_name on to_name, however it is drawn."""
+        return self._edge_by_attack.get((from_name, to_name))
+
+    def add_rank(self, rank: str, names: Iterable[str]):
+        """Add a rank constraint, such as {rank = same a b}."""
+        self.ranks.append((rank, list(names)))
+
+    def copy(self) -> "DotGraph":
+        graph = DotGraph(self.graph_attributes, self.node_defaults, self.edge_defaults)
+        graph.nodes = {name: dict(attributes) for name, attributes in self.nodes.items()}
+        for edge in self.edges:
+            graph.add_edge(edge.from_name, edge.to_name, edge.attributes, edge.back)
+        graph.ranks = [(rank, list(names)) for rank, names in self.ranks]
+        return graph
+
+    def to_dot(self) -> str:
+        lines = ["digraph {"]
+        lines.extend(f"{key}={quote_dot_id(value)}" for key, value in self.graph_attributes.items())
+        if self.node_defaults:
+            lines.append(f"node [{_get_attribute_list(self.node_defaults)}]")
+        for name, attributes in self.nodes.items():
+            node = "    " + quote_dot_id(name)
+            lines.append(f"{node} [{_get_attribute_list(attributes)}]" if attributes else node)
+        if self.edge_defaults:
+            lines.append(f"edge [{_get_attribute_list(self.edge_defaults)}]")
+        lines.extend("    " + edge.to_dot() for edge in self.edges)
+        for rank, names in self.ranks:
+            lines.append(f"    {{rank = {rank} {' '.join(quote_dot_id(name) for name in names)}}}")
+        lines.append("}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
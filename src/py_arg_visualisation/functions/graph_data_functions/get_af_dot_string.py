@@ -1,83 +1,105 @@
 import pathlib
+import shlex
 from collections import defaultdict
 import clingo
 import re
 
+from py_arg.abstract_argumentation.semantics.get_grounded_extension import get_numbered_grounded_labelling
+from py_arg_visualisation.functions.graph_data_functions.dot_graph import DotGraph
 from py_arg_visualisation.functions.graph_data_functions.get_color import get_color
+from py_arg_visualisation.functions.graph_data_functions.graphviz_layout_pool import get_graphviz_layout_pool
+from py_arg_visualisation.functions.graph_data_functions.provenance_engine import ProvenanceEngine
 
 PATH_TO_ENCODINGS = pathlib.Path(__file__).parent / "encodings"
 
 
-def generate_plain_dot_string(argumentation_framework, layout=any, raw_json=any, layout_file=None):
-    dot_string = "digraph {\n "
-    dot_string += 'rankdir={}  \n \n node [fontname = "helvetica" , shape=circle, fixedsize=true, width=0.8, height=0.8] \n '.format(
-        layout
+def generate_plain_dot_string(argumentation_framework, layout=any, raw_json=any, node_positions=None):
+    return generate_plain_dot_graph(argumentation_framework, layout, raw_json, node_positions).to_dot()
+
+
+def generate_plain_dot_graph(argumentation_framework, layout=any, raw_json=any, node_positions=None):
+    """
+    Builds the DotGraph of an argumentation framework without any evaluation: each argument is a node, each attack
+    an edge.
+
+    Args:
+        argumentation_framework (AbstractArgumentationFramework): The argumentation framework.
+        layout (str): The rank direction, e.g. "BT".
+        raw_json (dict): The imported JSON, of which the annotations of arguments are shown as tooltips.
+        node_positions (dict, optional): Frozen node positions (see compute_node_positions).
+
+    Returns:
+        DotGraph: The graph.
+    """
+    dot_graph = DotGraph(
+        {"rankdir": layout},
+        {"fontname": "helvetica", "shape": "circle", "fixedsize": "true", "width": "0.8", "height": "0.8"},
+        {"labeldistance": "1.5", "fontsize": "12", "fontname": "helvetica"},
     )
     arg_meta = {n["id"]: n for n in raw_json.get("arguments", [])}
 
-    # Get node positions if layout file is provided
-    node_positions = {}
-    if layout_file:
-        node_positions = extract_node_positions(layout_file)
+    # Frozen node positions, if any (see compute_node_positions)
+    node_positions = node_positions or {}
 
     # Adding node information
     for arg in argumentation_framework.arguments:
         name = arg.name
         meta = arg_meta.get(name, {})
-        attrs = [
-            f'label="{name}"',
-            "fontsize=14",
-            'cursor="pointer"',  # Add cursor style only to individual nodes
-            f'id="node-{name}"',  # Add unique ID for each node
-        ]
+        attributes = {
+            "label": name,
+            "fontsize": "14",
+            "cursor": "pointer",  # Add cursor style only to individual nodes
+            "id": f"node-{name}",  # Add unique ID for each node
+        }
         # Add position information if available
         if name in node_positions:
             x, y = node_positions[name]
-            attrs.append(f'pos="{x},{y}!"')
+            attributes["pos"] = f"{x},{y}!"
         if meta.get("annotation"):
             # tooltip shows on hover in many viewers
-            tip = meta["annotation"].replace('"', '\\"')
-            attrs.append(f'tooltip="{tip}"')
-        dot_string += (f'  "{name}" [{", ".join(attrs)}]\n')
+            attributes["tooltip"] = meta["annotation"]
+        dot_graph.add_node(name, attributes)
 
     # Adding edge information
-    dot_string += '\n edge[labeldistance=1.5 fontsize=12 fontname="helvetica"]\n'
     for attack in argumentation_framework.defeats:
-        dot_string += f'    "{attack.from_argument}" -> "{attack.to_argument}"\n'
-    dot_string += "}"
+        dot_graph.add_edge(attack.from_argument.name, attack.to_argument.name)
 
-    return dot_string
+    return dot_graph
 
 
-def extract_node_positions(layout_file):
+def parse_node_positions(plain_layout):
     """
-    Reads a layout.txt file and extracts node positions.
+    Extracts node positions from the output of dot -Tplain.
 
     Args:
-        layout_file (str): Path to the layout file.
+        plain_layout (str): The layout in Graphviz' plain format.
 
     Returns:
         dict: A dictionary mapping node names to (x, y) positions.
     """
     node_positions = {}
+    for line in plain_layout.splitlines():
+        if not line.startswith("node "):
+            continue
+        # Names with spaces or special characters are quoted in the plain format
+        parts = shlex.split(line) if '"' in line else line.split()
+        node_positions[parts[1]] = (float(parts[2]), float(parts[3]))
+    return node_positions
 
-    try:
-        with open(layout_file, "r") as f:
-            lines = f.readlines()
 
-        for line in lines:
-            parts = line.split()
-            if parts and parts[0] == "node":
-                node_id = parts[1]  # Node name
-                x, y = float(parts[2]), float(parts[3])  # Extract x, y coordinates
-                node_positions[node_id] = (x, y)
+def compute_node_positions(dot_source):
+    """
+    Lays out a DOT string with Graphviz and returns the resulting node positions. The DOT string is piped through
+    dot -Tplain by the layout pool of this process (see graphviz_layout_pool), so no files are written and concurrent
+    users do not share any state.
 
-    except FileNotFoundError:
-        print(f"Warning: Layout file {layout_file} not found. Using default positions.")
-    except Exception as e:
-        print(f"Error reading layout file {layout_file}: {e}")
+    Args:
+        dot_source (str): The DOT string to lay out.
 
-    return node_positions
+    Returns:
+        dict: A dictionary mapping node names to (x, y) positions.
+    """
+    return parse_node_positions(get_graphviz_layout_pool().render(dot_source, "plain"))
 
 
 def generate_dot_string(
@@ -88,27 +110,72 @@ def generate_dot_string(
     rank=any,
     special_handling=any,
     layout_freeze=False,
-    layout_file=None,
+    node_positions=None,
+    raw_json=None,
+    grounded_engine="native",
+):
+    return generate_dot_graph(
+        argumentation_framework,
+        selected_arguments,
+        color_blind_mode,
+        layout,
+        rank,
+        special_handling,
+        layout_freeze,
+        node_positions,
+        raw_json,
+        grounded_engine,
+    ).to_dot()
+
+
+def generate_dot_graph(
+    argumentation_framework,
+    selected_arguments,
+    color_blind_mode=False,
+    layout=any,
+    rank=any,
+    special_handling=any,
+    layout_freeze=False,
+    node_positions=None,
     raw_json=None,
+    grounded_engine="native",
 ):
-    # print(raw_json)
+    """
+    Builds the DotGraph of an argumentation framework in which the selected arguments are coloured; if the selection
+    is a labelling (green, red and yellow arguments), edges are styled by the grounded game and the labelling.
+
+    Args:
+        argumentation_framework (AbstractArgumentationFramework): The argumentation framework.
+        selected_arguments (dict): Argument names by colour.
+        color_blind_mode (bool): Whether to use colours for colour blind users.
+        layout (str): The rank direction, e.g. "BT".
+        rank (str): How to rank the nodes: "NR" (no ranks), "AR" (by game length) or "MR" (shortest games first).
+        special_handling (list): "BU" and/or "RD" if blunders and/or re-derivations constrain the ranks.
+        layout_freeze (bool): Whether the nodes are placed at node_positions.
+        node_positions (dict, optional): Frozen node positions (see compute_node_positions).
+        raw_json (dict, optional): The imported JSON, of which the annotations of arguments are shown as tooltips.
+        grounded_engine (str): "native" or "asp", see get_numbered_grounded_extension.
+
+    Returns:
+        DotGraph: The graph.
+    """
     arg_meta = {n["id"]: n for n in raw_json.get("arguments", [])} if raw_json else {}
     gr_status_by_arg, number_by_argument = get_numbered_grounded_extension(
-        argumentation_framework
+        argumentation_framework, grounded_engine
     )
-    # Get node positions if layout file is provided
-    node_positions = extract_node_positions(layout_file) if layout_file else {}
-    # print(node_positions)
+    # Frozen node positions, if any (see compute_node_positions)
+    node_positions = node_positions or {}
 
     if layout_freeze:
-        graph_layout = "graph[layout=neato overlap=false]"
+        graph_attributes = {"layout": "neato", "overlap": "false"}
     else:
-        graph_layout = "layout=dot"
+        graph_attributes = {"layout": "dot"}
+    graph_attributes["rankdir"] = layout
 
-    # creating the dot string
-    dot_string = f"digraph {{\n{graph_layout} \n"
-    dot_string += 'rankdir={} \n \n node [fontname = "helvetica"  shape=circle fixedsize=true width=0.8, height=0.8] \n'.format(
-        layout
+    dot_graph = DotGraph(
+        graph_attributes,
+        {"fontname": "helvetica", "shape": "circle", "fixedsize": "true", "width": "0.8", "height": "0.8"},
+        {"labeldistance": "1.5", "fontsize": "12", "fontname": "helvetica"},
     )
 
     # Adding node information
@@ -142,208 +209,162 @@ def generate_dot_string(
                 else:
                     argument_label = argument_name
 
-                pos_attr = (
-                    f'pos="{node_positions[argument_name][0]},{node_positions[argument_name][1]}!"'
-                    if argument_name in node_positions and layout_freeze
-                    else ""
-                )
+                attributes = {
+                    "style": "filled",
+                    "fillcolor": argument_color,
+                    "label": argument_label,
+                    "fontsize": "14",
+                }
+                if argument_name in node_positions and layout_freeze:
+                    x, y = node_positions[argument_name]
+                    attributes["pos"] = f"{x},{y}!"
+                attributes["cursor"] = "pointer"  # Add cursor style to individual nodes
                 meta = arg_meta.get(argument_name, {})
-                tip = meta.get("annotation", "").replace('"', '\\"')
-                
-                node = (
-                    f'    "{argument_name}" [style="filled" '
-                    f'fillcolor="{argument_color}" '
-                    f'label="{argument_label}" '
-                    f'fontsize=14 {pos_attr}'
-                    f' cursor="pointer"'  # Add cursor style to individual nodes
-                )
-                
-                if tip:
-                    node += f' tooltip="{tip}"'
-                
-                node += "]\n"
-                dot_string += node
-
-                unselected_arguments.remove(argument_name)
-    for argument_name in unselected_arguments:
-        dot_string += f'    "{argument_name}" [fontsize=14, cursor="pointer"]\n'  # Add cursor style to unselected nodes too
+                if meta.get("annotation"):
+                    attributes["tooltip"] = meta["annotation"]
+                dot_graph.add_node(argument_name, attributes)
+
+                unselected_arguments.discard(argument_name)
+    for argument in argumentation_framework.arguments:
+        if argument.name in unselected_arguments:
+            # Add cursor style to unselected nodes too
+            dot_graph.add_node(argument.name, {"fontsize": "14", "cursor": "pointer"})
 
     # Adding edge information
-    dot_string += '\n edge[labeldistance=1.5 fontsize=12 fontname="helvetica"]\n'
     for attack in argumentation_framework.defeats:
-        if is_extension_representation:
-            from_argument_grounded_state = gr_status_by_arg[attack.from_argument.name]
-            to_argument_grounded_state = gr_status_by_arg[attack.to_argument.name]
-            from_argument_extension_state = argument_extension_state[
-                attack.from_argument.name
-            ]
-            to_argument_extension_state = argument_extension_state[
-                attack.to_argument.name
-            ]
-            from_argument_number = number_by_argument[attack.from_argument.name]
-            to_argument_number = number_by_argument[attack.to_argument.name]
-
-            # cal the against wind
-            against_wind = False
-            from_num = (
-                float("inf")
-                if from_argument_number == "∞"
-                else int(from_argument_number)
-            )
-            to_num = (
-                float("inf") if to_argument_number == "∞" else int(to_argument_number)
-            )
-            against_wind = from_num == float("inf") and to_num != float("inf")
-            against_wind = against_wind or (from_num > to_num)
-
-            if from_num == float("inf"):
-                label = "∞"
-            else:
-                label = str(from_num + 1)
-
-            # set initial style
-            style = "solid"
-            arrow_style = "vee"
-            constraint_value = ""
-            full_color = get_color("black", color_blind_mode)
-            # handle grounded extensions
-            # Accepted -> Defeated
+        if not is_extension_representation:
+            dot_graph.add_edge(attack.from_argument.name, attack.to_argument.name)
+            continue
+        from_argument_grounded_state = gr_status_by_arg[attack.from_argument.name]
+        to_argument_grounded_state = gr_status_by_arg[attack.to_argument.name]
+        from_argument_extension_state = argument_extension_state[attack.from_argument.name]
+        to_argument_extension_state = argument_extension_state[attack.to_argument.name]
+        from_num = get_number_value(number_by_argument[attack.from_argument.name])
+        to_num = get_number_value(number_by_argument[attack.to_argument.name])
+
+        # cal the against wind
+        against_wind = from_num == float("inf") and to_num != float("inf")
+        against_wind = against_wind or (from_num > to_num)
+
+        if from_num == float("inf"):
+            label = "∞"
+        else:
+            label = str(from_num + 1)
+
+        # set initial style
+        style = "solid"
+        arrow_style = "vee"
+        constraint = {}
+        full_color = get_color("black", color_blind_mode)
+        # handle grounded extensions
+        # Accepted -> Defeated
+        if (
+            from_argument_grounded_state == "accepted"
+            and to_argument_grounded_state == "defeated"
+        ):
+            full_color = get_color("edge-green", color_blind_mode)
+        # Defeated -> Accepted
+        elif (
+            from_argument_grounded_state == "defeated"
+            and to_argument_grounded_state == "accepted"
+        ):
+            full_color = get_color("edge-red", color_blind_mode)
+        else:
+            # handle the stable extensions
+            # Stable Accepted -> Defeated (Grounded Undefined)
             if (
-                from_argument_grounded_state == "accepted"
-                and to_argument_grounded_state == "defeated"
+                from_argument_extension_state == "accepted"
+                and to_argument_extension_state == "defeated"
             ):
                 full_color = get_color("edge-green", color_blind_mode)
-            # Defeated -> Accepted
+                label = ""
+            # Stable Defeated -> Accepted(Grounded Undefined)
             elif (
-                from_argument_grounded_state == "defeated"
-                and to_argument_grounded_state == "accepted"
+                from_argument_extension_state == "defeated"
+                and to_argument_extension_state == "accepted"
             ):
                 full_color = get_color("edge-red", color_blind_mode)
-            else:
-                # handle the stable extensions
-                # Stable Accepted -> Defeated (Grounded Undefined)
-                if (
-                    from_argument_extension_state == "accepted"
-                    and to_argument_extension_state == "defeated"
-                ):
-                    extension_edge_color = get_color("edge-green", color_blind_mode)
-                    full_color = f"{extension_edge_color}"
-                    label = ""
-                # Stable Defeated -> Accepted(Grounded Undefined)
-                elif (
-                    from_argument_extension_state == "defeated"
-                    and to_argument_extension_state == "accepted"
-                ):
-                    extension_edge_color = get_color("edge-red", color_blind_mode)
-                    full_color = f"{extension_edge_color}"
-                    label = ""
-                # Undefined -> Undefined
-                elif (
-                    from_argument_extension_state == "undefined"
-                    and to_argument_extension_state == "undefined"
-                ):
-                    full_color = get_color("dark-yellow", color_blind_mode)
-                # Undefined -> Defeated
-                elif (
-                    from_argument_extension_state == "undefined"
-                    and to_argument_extension_state == "defeated"
-                ):
-                    full_color = get_color("gray", color_blind_mode)
-                    style = "dotted"
-                    arrow_style = "onormal"
-                    constraint_value = set_constraint_con(special_handling, "BU")
-                    label = ""
-                # Defeated -> Undefined
-                elif (
-                    from_argument_extension_state == "defeated"
-                    and to_argument_extension_state == "undefined"
-                ):
-                    full_color = get_color("gray", color_blind_mode)
-                    style = "dotted"
-                    arrow_style = "onormal"
-                    constraint_value = set_constraint_con(special_handling, "BU")
-                    label = ""
-                # Defeated -> Defeated
-                elif (
-                    from_argument_extension_state == "defeated"
-                    and from_argument_extension_state == "defeated"
-                ):
-                    full_color = get_color("gray", color_blind_mode)
-                    style = "dotted"
-                    arrow_style = "onormal"
-                    constraint_value = set_constraint_con(special_handling, "BU")
-                    label = ""
-
-            if against_wind:
-                if style == "dotted":
-                    pass
-                elif style == "invis":
-                    pass
-                else:
-                    style = "dashed"
-                constraint_value = set_constraint_con(special_handling, "RD")
-                edge = (
-                    f'"{attack.to_argument.name}" -> '
-                    f'"{attack.from_argument.name}" '
-                    f"[dir=back "
-                    f'color="{full_color}" '
-                    f'style= "{style}"'
-                    f"{constraint_value}"
-                    f'fontcolor="{full_color}"'
-                    f'arrowtail="{arrow_style}"'
-                    f'arrowhead="{arrow_style}"'
-                    f'headlabel="{label}"]\n'
-                )
-            else:
-                edge = (
-                    f'"{attack.from_argument.name}" -> '
-                    f'"{attack.to_argument.name}" '
-                    f'[color="{full_color}" '
-                    f'style="{style}"'
-                    f"{constraint_value}"
-                    f'fontcolor="{full_color}"'
-                    f'arrowtail="{arrow_style}"'
-                    f'arrowhead="{arrow_style}"'
-                    f'taillabel="{label}"]\n'
-                )
-        else:
-            edge = f'"{attack.from_argument.name}" -> "{attack.to_argument.name}"\n'
-        dot_string += "    " + edge
+                label = ""
+            # Undefined -> Undefined
+            elif (
+                from_argument_extension_state == "undefined"
+                and to_argument_extension_state == "undefined"
+            ):
+                full_color = get_color("dark-yellow", color_blind_mode)
+            # Undefined -> Defeated, Defeated -> Undefined and Defeated -> Defeated
+            elif from_argument_extension_state == "defeated" or (
+                from_argument_extension_state == "undefined"
+                and to_argument_extension_state == "defeated"
+            ):
+                full_color = get_color("gray", color_blind_mode)
+                style = "dotted"
+                arrow_style = "onormal"
+                constraint = set_constraint_con(special_handling, "BU")
+                label = ""
+
+        if against_wind:
+            if style not in ["dotted", "invis"]:
+                style = "dashed"
+            constraint = set_constraint_con(special_handling, "RD")
+        attributes = {"color": full_color, "style": style}
+        attributes.update(constraint)
+        attributes.update(
+            {
+                "fontcolor": full_color,
+                "arrowtail": arrow_style,
+                "arrowhead": arrow_style,
+                "headlabel" if against_wind else "taillabel": label,
+            }
+        )
+        dot_graph.add_edge(attack.from_argument.name, attack.to_argument.name, attributes, back=against_wind)
 
-    dot_string += "\n"
     # Enable Ranks
     number_by_argument = {k: v for k, v in number_by_argument.items() if v != "∞"}
     if rank == "NR":
         pass
     elif rank == "AR":
-        # in case we need the rank = max
-        # max_value = max(number_by_argument.values())
-        filtered_arguments = {k: v for k, v in number_by_argument.items()}
         nodes_by_value = defaultdict(list)
-        for node, value in filtered_arguments.items():
+        for node, value in number_by_argument.items():
             nodes_by_value[value].append(node)
-        for value in sorted(nodes_by_value.keys()):
-            nodes = nodes_by_value[value]
-            if len(nodes) == 1:
-                same_rank_string = f"// {{rank = same {' '.join(nodes)}}}"
-            else:
-                same_rank_string = f"{{rank = same {' '.join(nodes)}}}"
-            dot_string += f"    {same_rank_string}\n"
-    elif rank == "MR":
-        min_state_nodes = [
-            node
-            for node, value in number_by_argument.items()
-            if value == min(number_by_argument.values())
-        ]
-        min_rank_string = f"{{rank = min {' '.join(min_state_nodes)}}}"
-        dot_string += f"    {min_rank_string}\n"
-
-    dot_string += "}"
-    # print(dot_string)
-    return dot_string
-
-
-def get_numbered_grounded_extension(argumentation_framework):
+        for value in sorted(nodes_by_value.keys(), key=int):
+            dot_graph.add_rank("same", nodes_by_value[value])
+    elif rank == "MR" and number_by_argument:
+        min_value = min(number_by_argument.values(), key=int)
+        dot_graph.add_rank("min", [node for node, value in number_by_argument.items() if value == min_value])
+
+    return dot_graph
+
+
+def get_number_value(number):
+    """The value of a game length as given by get_numbered_grounded_extension, with "∞" as infinity."""
+    return float("inf") if number == "∞" else int(number)
+
+
+def get_numbered_grounded_extension(argumentation_framework, engine="native"):
+    """
+    Get the grounded status ('accepted', 'defeated' or 'undefined') and the game length of each argument, both keyed
+    by argument name. Lengths are strings; undefined arguments get "∞".
+
+    The native engine is a linear-time worklist algorithm without depth limit. The "asp" engine runs
+    grounded_encoding.dl with clingo, which stops after state_max (100) rounds, so on longer attack chains the
+    arguments it does not reach are reported as undefined.
+    """
+    if engine == "asp":
+        return _get_numbered_grounded_extension_asp(argumentation_framework)
+    if engine != "native":
+        raise ValueError(f"Unknown grounded engine: {engine}.")
+
+    status_by_arg, number_by_arg = get_numbered_grounded_labelling(argumentation_framework)
+    status_by_argument = {}
+    number_by_argument = {}
+    for argument in argumentation_framework.arguments:
+        status_by_argument[argument.name] = status_by_arg[argument]
+        number = number_by_arg[argument]
+        number_by_argument[argument.name] = "∞" if number is None else str(number)
+    return status_by_argument, number_by_argument
+
+
+def _get_numbered_grounded_extension_asp(argumentation_framework):
     # Keep argument ID dictionary.
     argument_name_to_id = {}
     id_to_argument_name = {}
@@ -391,17 +412,34 @@ def set_style(keyword, style, rm_edge):
 
 
 def set_constraint_con(bool, con_type):
+    """The edge attributes that stop an edge from constraining the ranks, unless con_type is in special handling."""
     if not bool:
-        return 'constraint="false"'
+        return {"constraint": "false"}
     if con_type == "BU" and "BU" not in bool:
-        return 'constraint="false"'
+        return {"constraint": "false"}
     elif con_type == "RD" and "RD" not in bool:
-        return 'constraint="false"'
+        return {"constraint": "false"}
     else:
-        return ""
+        return {}
 
 
-def get_provenance(arg_framework, prov_type: str, node: str):
+def get_provenance(arg_framework, prov_type: str, node: str, engine="native"):
+    """
+    Get the PO, AC or PR provenance of an argument: the moves (attacks) of the game for the argument, as
+    '("attacker","attacked")' strings, and the quoted names of the arguments involved, including the argument itself.
+
+    The native engine (see ProvenanceEngine) does a breadth-first search over the attacks, which takes time
+    O(|arguments| + |attacks|). The "asp" engine runs provenance_calculation.dl with clingo, which stops after
+    state_max (100) rounds.
+    """
+    if engine == "asp":
+        return _get_provenance_asp(arg_framework, prov_type, node)
+    if engine != "native":
+        raise ValueError(f"Unknown provenance engine: {engine}.")
+    return ProvenanceEngine(arg_framework).get_provenance(prov_type, node)
+
+
+def _get_provenance_asp(arg_framework, prov_type: str, node: str):
     """Executes a Clingo-based algorithm with given facts and a specific provenance type for a node.
 
     Args:
@@ -462,7 +500,22 @@ def get_provenance(arg_framework, prov_type: str, node: str):
     return edges, list(nodes)
 
 
-def get_local_view_rank(arg_framework, prov_arg):
+def get_local_view_rank(arg_framework, prov_arg, engine="native"):
+    """
+    Group the arguments by their distance (in attacks) to the provenance argument, e.g.
+    {0: ['"A"'], 1: ['"B"', '"C"'], 2: ['"D"']}.
+
+    The native engine (see ProvenanceEngine) does a breadth-first search; the "asp" engine runs local_view_rank.dl
+    with clingo.
+    """
+    if engine == "asp":
+        return _get_local_view_rank_asp(arg_framework, prov_arg)
+    if engine != "native":
+        raise ValueError(f"Unknown provenance engine: {engine}.")
+    return ProvenanceEngine(arg_framework).get_local_view_rank(prov_arg)
+
+
+def _get_local_view_rank_asp(arg_framework, prov_arg):
     """
     Calculates the local view rank for a given argument.
 
@@ -517,13 +570,19 @@ def get_local_view_rank(arg_framework, prov_arg):
     return rank_groups
 
 
-def highlight_dot_source(dot_source, highlight_nodes, prov_arg, prov_type, local_view, local_view_rank=None):
+def _unquote(name):
+    """Clingo shows string constants, such as the names in provenance results, with quotes."""
+    return name[1:-1] if len(name) > 1 and name[0] == name[-1] == '"' else name
+
+
+def highlight_dot_graph(dot_graph, highlight_nodes, prov_arg, prov_type, local_view, local_view_rank=None):
     """
-    Processes a DOT source string and returns a modified version based on provenance type.
-    
+    Changes a DotGraph in place to show the provenance of an argument: the nodes and edges of the provenance keep
+    (part of) their styling, all others are greyed out.
+
     Parameters:
-        dot_source (str): Original DOT graph.
-        highlight_nodes (list of str): List of nodes to keep unchanged.
+        dot_graph (DotGraph): The graph, as made by generate_dot_graph or generate_plain_dot_graph.
+        highlight_nodes (list of str): List of nodes to keep unchanged, quoted as in get_provenance.
         prov_arg (str): The provenance argument.
         prov_type (str): Type of provenance ("PO", "PR", "AC").
         local_view (bool): Whether to use local view.
@@ -531,7 +590,7 @@ def highlight_dot_source(dot_source, highlight_nodes, prov_arg, prov_type, local
                                         Example: {1: ['"D"', '"E"'], 2: ['"F"', '"G"']}
 
     Returns:
-        str: Modified DOT source.
+        DotGraph: The same graph.
     """
     COLORS = {
         'light_gray': '#d3d3d3',
@@ -540,388 +599,161 @@ def highlight_dot_source(dot_source, highlight_nodes, prov_arg, prov_type, local
         'white': 'white',
         'black': 'black'
     }
-    # print(local_view_rank)
-    def is_highlighted_node(line):
-        match = re.search(r'"([^"]+)"\s*\[', line)
-        return match and f'"{match.group(1)}"' in highlight_nodes
-
-    def is_highlighted_edge(line):
-        edge_match = re.match(r'^\s*"([^"]+)"\s*->\s*"([^"]+)"', line)
-        if edge_match:
-            src, dst = f'"{edge_match.group(1)}"', f'"{edge_match.group(2)}"'
-            return src in highlight_nodes and dst in highlight_nodes
-        return False
-
-    def process_node_line(line, stripped_line):
-        # Skip the default node attributes line
-        if 'node [fontname' in line:
-            return line
-            
+    highlight_nodes = {_unquote(node) for node in highlight_nodes}
+    rank_by_node = {}
+    for rank, nodes in (local_view_rank or {}).items():
+        for node in nodes:
+            rank_by_node.setdefault(_unquote(node), rank)
+
+    for name, attributes in dot_graph.nodes.items():
         # Remove numbers and infinite symbols for PO and AC
-        if prov_type in ["PO", "AC"]:
-            line = re.sub(r'"([^"]+)\.(?:\d+|∞)"', r'"\1"', line)
-        
-        if not is_highlighted_node(stripped_line):
-            new_line = line
-            # If color exists, replace it
-            if 'color=' in new_line:
-                new_line = re.sub(r'color="[^"]*"', f'color="{COLORS["border_gray"]}"', new_line)
+        if prov_type in ["PO", "AC"] and "label" in attributes:
+            attributes["label"] = re.sub(r'^(.+)\.(?:\d+|∞)$', r'\1', attributes["label"])
+
+        if name not in highlight_nodes:
+            if "color" in attributes or "fillcolor" in attributes:
+                if "color" in attributes:
+                    attributes["color"] = COLORS["border_gray"]
+                if "fillcolor" in attributes:
+                    attributes["fillcolor"] = COLORS["white"]
             else:
-                # Add color if it doesn't exist
-                new_line = new_line.replace('[', f'[color="{COLORS["border_gray"]}", ', 1)
-                
-            # Replace fillcolor if it exists
-            if 'fillcolor=' in new_line:
-                new_line = re.sub(r'fillcolor="[^"]*"', f'fillcolor="{COLORS["white"]}"', new_line)
-            
-            return new_line
-        
-        # For highlighted nodes, keep original line
-        if prov_type == "PO":
-            new_line = re.sub(r'fillcolor="[^"]*"', f'fillcolor="{COLORS["gray"]}"', line)
-            if 'fillcolor=' not in new_line:
-                new_line = new_line.replace('[', f'[fillcolor="{COLORS["gray"]}", ', 1)
-            if 'style=' not in new_line:
-                new_line = new_line.replace('[', '[style="filled", ', 1)
-        else:
-            new_line = line
+                attributes["color"] = COLORS["border_gray"]
+            continue
 
+        if prov_type == "PO":
+            attributes["fillcolor"] = COLORS["gray"]
+            attributes.setdefault("style", "filled")
         # Add penwidth for the chosen argument
-        if f'"{prov_arg}"' in new_line and 'penwidth=' not in new_line:
-            new_line = new_line.replace('[', '[penwidth="5", ', 1)
-            
-        return new_line
-
-    def process_edge_line(line):
-        # Check for dir=back in original line
-        dir_back = False  # Initialize dir_back to False for all cases
-        new_line = re.sub(r'\[.*?\]', '', line).strip()  # Remove all edge attributes
-        
-        # Extract source and target nodes
-        match = re.match(r'^\s*"([^"]+)"\s*->\s*"([^"]+)"', new_line)
-        if not match:
-            return line
-        
-        src, dst = match.group(1), match.group(2)
-        
+        if name == prov_arg:
+            attributes.setdefault("penwidth", "5")
+
+    for edge in dot_graph.edges:
+        src, dst = edge.from_name, edge.to_name
         # Always apply rank-based handling when local_view is True, regardless of prov_type
         if local_view:
-            # If original line had dir=back, normalize the direction first
-            if 'dir=back' in line:
-                src, dst = dst, src
-                new_line = f'"{src}" -> "{dst}"'
-            
-            # Handle edge direction based on local_view_rank
-            if local_view_rank:
-                # Find ranks for source and target nodes
-                src_rank = next((r for r, nodes in local_view_rank.items() if f'"{src}"' in nodes), None)
-                dst_rank = next((r for r, nodes in local_view_rank.items() if f'"{dst}"' in nodes), None)
-                
-                # Handle special case for provenance argument (rank 0)
-                if dst == prov_arg.strip('"'):
-                    dst_rank = 0
-                    
-                # Keep dir=back only for edges from lower rank to higher rank
-                # Only consider rank comparison if neither node is the provenance argument
-                if src_rank is not None and dst_rank is not None:
-                    if src_rank < dst_rank:
-                        # Lower to higher rank: use dir=back and swap nodes
-                        new_line = f'"{dst}" -> "{src}"'
-                        dir_back = True
-                    else:
-                        # Ensure we use normal direction for all other cases
-                        new_line = f'"{src}" -> "{dst}"'
-                        dir_back = False
-        else:
-            # If not in local_view mode, preserve original dir=back
-            dir_back = 'dir=back' in line
-        
-        if not is_highlighted_edge(line):
-            attrs = [f'color="{COLORS["light_gray"]}"']
-            if dir_back:
-                attrs.append('dir=back')
-            return new_line + f' [{", ".join(attrs)}]'
-            
-        if prov_type == "PO":
-            attrs = ['color="black"']
-            if dir_back:
-                attrs.append('dir=back')
+            # Keep dir=back only for edges from lower rank to higher rank
+            src_rank = rank_by_node.get(src)
+            # Handle special case for provenance argument (rank 0)
+            dst_rank = 0 if dst == prov_arg.strip('"') else rank_by_node.get(dst)
+            edge.back = src_rank is not None and dst_rank is not None and src_rank < dst_rank
+
+        if src not in highlight_nodes or dst not in highlight_nodes:
+            edge.attributes = {"color": COLORS["light_gray"]}
+        elif prov_type == "PO":
+            edge.attributes = {"color": "black"}
         elif prov_type == "AC":
-            color_match = re.search(r'color="([^"]*)"', line)
-            color = color_match.group(1) if color_match else COLORS["black"]
-            attrs = [f'color="{color}"']
-            if dir_back:
-                attrs.append('dir=back')
+            edge.attributes = {"color": edge.attributes.get("color", COLORS["black"])}
         else:  # PR
-            # For PR, preserve all attributes except dir=back
-            color_match = re.search(r'color="([^"]*)"', line)
-            style_match = re.search(r'style="([^"]*)"', line)
-            fontcolor_match = re.search(r'fontcolor="([^"]*)"', line)
-            arrowtail_match = re.search(r'arrowtail="([^"]*)"', line)
-            arrowhead_match = re.search(r'arrowhead="([^"]*)"', line)
-            label_match = re.search(r'(tail|head)label="([^"]*)"', line)
-            
-            attrs = []
-            if color_match:
-                attrs.append(f'color="{color_match.group(1)}"')
-            if style_match:
-                attrs.append(f'style="{style_match.group(1)}"')
-            if fontcolor_match:
-                attrs.append(f'fontcolor="{fontcolor_match.group(1)}"')
-            if arrowtail_match:
-                attrs.append(f'arrowtail="{arrowtail_match.group(1)}"')
-            if arrowhead_match:
-                attrs.append(f'arrowhead="{arrowhead_match.group(1)}"')
-            if label_match:
-                attrs.append(f'{label_match.group(1)}label="{label_match.group(2)}"')
-            if dir_back:
-                attrs.append('dir=back')
-            
-        return new_line + f' [{", ".join(attrs)}]'
-
-    modified_lines = []
-    in_rank_section = False
-    rank_section_added = False
-    
-    for line in dot_source.split('\n'):
-        stripped_line = line.strip()
+            # For PR, preserve the styling of the edge
+            edge.attributes = {
+                key: value
+                for key, value in edge.attributes.items()
+                if key in ["color", "style", "fontcolor", "arrowtail", "arrowhead", "taillabel", "headlabel"]
+            }
 
-        # Skip existing rank definitions when local_view is True
-        if local_view and "rank =" in line:
-            in_rank_section = True
-            continue
-        
-        if in_rank_section:
-            if not any(keyword in line for keyword in ["rank =", "}"]):
-                continue
-            if "}" in line:
-                in_rank_section = False
-                if not rank_section_added and local_view_rank:
-                    # Add new rank definitions
-                    for rank, nodes in sorted(local_view_rank.items()):
-                        node_str = ' '.join(nodes)  # nodes are already in correct format ('"D"', '"E"', etc.)
-                        modified_lines.append(f'    {{rank = same {node_str}}}')
-                    rank_section_added = True
-
-        # Process non-rank lines
-        if not in_rank_section:
-            if '->' not in stripped_line and '[' in stripped_line:
-                modified_lines.append(process_node_line(line, stripped_line))
-            elif '->' in stripped_line:
-                modified_lines.append(process_edge_line(line))
-            else:
-                modified_lines.append(line)
+    # Rank the nodes by their distance to the provenance argument in the local view
+    if local_view and dot_graph.ranks:
+        dot_graph.ranks = []
+        for rank, nodes in sorted((local_view_rank or {}).items()):
+            dot_graph.add_rank("same", [_unquote(node) for node in nodes])
 
-    return "\n".join(modified_lines)
+    return dot_graph
 
 
-def highlight_critical_edges(dot_source, edges_to_highlight):
+def highlight_critical_edges(dot_graph, edges_to_highlight):
     """
-    Highlights specified edges in red and dashed style in the DOT source.
+    Highlights specified edges in red and dashed style in a DotGraph, in place.
     Also ensures nodes with infinite (∞) have dashed style and penwidth=1.5.
-    
+
     Args:
-        dot_source (str): The original DOT source string
+        dot_graph (DotGraph): The graph, as made by generate_dot_graph
         edges_to_highlight (list): List of edges to highlight, each edge is [from_arg, to_arg]
-    
+
     Returns:
-        str: Modified DOT source with highlighted edges
+        DotGraph: The same graph
     """
     if not edges_to_highlight:
-        return dot_source
-        
-    modified_source = dot_source
-    
+        return dot_graph
+
     # First handle nodes with infinite symbol
-    lines = modified_source.split('\n')
-    for i, line in enumerate(lines):
-        if '.∞"' in line and '[' in line:
-            if 'style=' in line:
-                # Keep existing style attributes and add dashed if not present
-                style_match = re.search(r'style="([^"]*)"', line)
-                if style_match:
-                    current_styles = style_match.group(1).split(',')
-                    if 'dashed' not in current_styles:
-                        current_styles.append('dashed')
-                    new_style = ','.join(s.strip() for s in current_styles)
-                    lines[i] = re.sub(r'style="[^"]*"', f'style="{new_style}"', line)
-                    # Add penwidth if not present
-                    if 'penwidth=' not in lines[i]:
-                        lines[i] = lines[i].replace(']', ', penwidth=1.5]')
-            else:
-                # Add both style and penwidth attributes before the closing bracket
-                lines[i] = line.replace(']', ', style="dashed", penwidth=1.5]')
-    modified_source = '\n'.join(lines)
-    
+    for attributes in dot_graph.nodes.values():
+        if attributes.get("label", "").endswith(".∞"):
+            # Keep existing style attributes and add dashed if not present
+            styles = [style.strip() for style in attributes["style"].split(",")] if "style" in attributes else []
+            if "dashed" not in styles:
+                styles.append("dashed")
+            attributes["style"] = ",".join(styles)
+            attributes.setdefault("penwidth", "1.5")
+
     # Then handle critical edges
-    for edge in edges_to_highlight:
-        from_arg, to_arg = edge
-        # Look for the edge pattern in both directions (normal and dir=back)
-        edge_patterns = [
-            f'"{from_arg}" -> "{to_arg}"',
-            f'"{to_arg}" -> "{from_arg}".*dir=back'
-        ]
-        
-        for pattern in edge_patterns:
-            edge_match = re.search(pattern, modified_source)
-            if edge_match:
-                edge_pos = edge_match.start()
-                # Find the closing bracket of the edge attributes
-                bracket_end = modified_source.find(']', edge_pos)
-                if bracket_end != -1:
-                    # Extract existing attributes
-                    attrs_start = modified_source.find('[', edge_pos)
-                    existing_attrs = modified_source[attrs_start+1:bracket_end]
-                    
-                    # Parse existing attributes
-                    attrs = {}
-                    for attr in re.findall(r'(\w+)="([^"]*)"', existing_attrs):
-                        attrs[attr[0]] = attr[1]
-                    
-                    # Update attributes
-                    attrs['color'] = '#ff0000'
-                    attrs['style'] = 'dashed'  # Replace style instead of appending
-                    attrs['penwidth'] = '3'    # Set thicker penwidth for critical attacks
-                    
-                    # Reconstruct attributes string
-                    new_attrs = ' '.join(f'{k}="{v}"' for k, v in attrs.items())
-                    
-                    # Replace attributes in source
-                    modified_source = (
-                        modified_source[:attrs_start+1] +
-                        new_attrs +
-                        modified_source[bracket_end:]
-                    )
-                break  # Found the edge, no need to check other pattern
-    
-    return modified_source
-
-def fixed_process_node_line(line, numbering_dict):
-    """Process a node definition line in the DOT source."""
-    # Only process node lines with infinite labels
-    if 'label=' in line and '∞' in line:
-        # Extract argument name
-        arg_name = line.split('"')[1]
-        if arg_name in numbering_dict:
-            # Replace "∞" with the new number and add prime
-            new_number = numbering_dict[arg_name]
-            line = line.replace('.∞"', f'.{new_number}"')  # Using unicode prime symbol
-    return line
-
-def fixed_process_edge_line(line, numbering_dict):
-    """Process an edge definition line in the DOT source."""
-    # Extract source and target nodes
-    match = re.match(r'^\s*"([^"]+)"\s*->\s*"([^"]+)"', line)
-    if not match:
-        return line
-        
-    source, target = match.group(1), match.group(2)
-    
-    # Extract existing attributes
-    attrs_match = re.search(r'\[(.*)\]', line)
-    if not attrs_match:
-        return line
-        
-    existing_attrs = attrs_match.group(1)
-    
-    # Check if this is a critical attack (red edge)
-    is_critical = 'color="#ff0000"' in existing_attrs
-    
-    # Check if dir=back exists and swap nodes if it does
-    has_dir_back = 'dir=back' in existing_attrs
-    if has_dir_back:
-        source, target = target, source  # Swap nodes
-        existing_attrs = re.sub(r',?\s*dir=back', '', existing_attrs)  # Remove dir=back
-    
-    source_val = numbering_dict.get(source)
-    target_val = numbering_dict.get(target)
-    
-    # Replace existing labels with empty ones
-    existing_attrs = re.sub(r'taillabel="[^"]*"', 'taillabel=""', existing_attrs)
-    existing_attrs = re.sub(r'headlabel="[^"]*"', 'headlabel=""', existing_attrs)
-     
-    # Check if style is dotted
-    is_dotted = 'style="dotted"' in existing_attrs or 'style= "dotted"' in existing_attrs
-    if source_val > target_val:
-        if is_critical:
-            # For critical edges (red), always use dotted style
-            existing_attrs = re.sub(r'style\s*=\s*"[^"]*"', '', existing_attrs)  # Remove existing style
-            existing_attrs = re.sub(r'penwidth\s*=\s*"[^"]*"', '', existing_attrs)  # Remove existing penwidth
-            existing_attrs = existing_attrs.rstrip(', ')  # Remove trailing commas
-            existing_attrs += ' dir=back style="dotted" penwidth="1"'  # Reset penwidth to 1
-            line = f'    "{target}" -> "{source}" [{existing_attrs}]'
-        else:
-            # Remove any existing style attribute
-            existing_attrs = re.sub(r'style\s*=\s*"[^"]*"', '', existing_attrs)
-            # Add dir=back and dashed style
-            existing_attrs = existing_attrs.rstrip(', ')  # Remove trailing commas
-            existing_attrs += ' dir=back style="dashed"'
-            line = f'    "{target}" -> "{source}" [{existing_attrs}]'
-    else:
-        # Remove any existing style attribute
-        existing_attrs = re.sub(r'style\s*=\s*"[^"]*"', '', existing_attrs)
-        # Add solid style
-        existing_attrs = existing_attrs.rstrip(', ')  # Remove trailing commas
-        existing_attrs += ', style="solid"'
-        line = f'    "{source}" -> "{target}" [{existing_attrs}]'
-
-    if is_dotted:
-        # If the line was originally dotted, restore dotted style
-        line = re.sub(r'style="[^"]*"', 'style="dotted"', line)
-    
-    return line
+    for from_arg, to_arg in edges_to_highlight:
+        edge = dot_graph.get_edge(from_arg, to_arg)
+        if edge is not None:
+            edge.attributes["color"] = "#ff0000"
+            edge.attributes["style"] = "dashed"  # Replace style instead of appending
+            edge.attributes["penwidth"] = "3"  # Set thicker penwidth for critical attacks
 
-def recalculate_fixed_args(arg_framework, dot_source):
+    return dot_graph
+
+
+def recalculate_fixed_args(arg_framework, dot_graph, grounded_engine="native"):
     """
-    Recalculates the grounded extension of an argumentation framework and updates the DOT source.
-    
+    Recalculates the grounded extension of an argumentation framework and updates the DotGraph in place.
+
     Args:
         arg_framework (ArgumentationFramework): The argumentation framework to recalculate.
-        dot_source (str): The original DOT source string.
-    
+        dot_graph (DotGraph): The graph, as made by generate_dot_graph.
+        grounded_engine (str): "native" or "asp", see get_numbered_grounded_extension.
+
     Returns:
-        str: Modified DOT source with recalculated grounded extension.
-    """ 
+        DotGraph: The same graph, with recalculated grounded extension.
+    """
     # Get the new grounded extension and numbering
-    status_dict, numbering_dict = get_numbered_grounded_extension(arg_framework)
-    
-    # Split dot source into lines and process node labels
-    lines = dot_source.split('\n')
-    modified_lines = []
-    
-    # Process existing lines, ignoring rank=same lines
-    for line in lines:
-        # Skip any lines containing rank=same
-        if 'same' in line:
+    status_dict, numbering_dict = get_numbered_grounded_extension(arg_framework, grounded_engine)
+
+    # Replace "∞" in the labels of arguments that now have a number
+    for name, attributes in dot_graph.nodes.items():
+        label = attributes.get("label", "")
+        if label.endswith(".∞") and name in numbering_dict:
+            attributes["label"] = label[:-len("∞")] + numbering_dict[name]
+
+    for edge in dot_graph.edges:
+        attributes = edge.attributes
+        if not attributes:
             continue
-        
-        if '[' in line:
-            if '->' in line:  # Edge definition
-                line = fixed_process_edge_line(line, numbering_dict)
-            else:  # Node definition
-                line = fixed_process_node_line(line, numbering_dict)
-        modified_lines.append(line)
-    
-    # Find the last closing brace
-    while modified_lines[-1].strip() == '}':
-        modified_lines.pop()
-    
-    # Group nodes by their numbers
-    number_groups = {}
-    for arg, number in numbering_dict.items():
-        if number not in number_groups:
-            number_groups[number] = []
-        number_groups[number].append(arg)
-    
-    # Add new rank definitions before the final closing brace
-    for number, args in sorted(number_groups.items(), key=lambda x: int(x[0]) if x[0] != '∞' else float('inf')):
-        if args and number != '∞':  # Skip infinite numbers
-            node_list = '" "'.join(args)
-            modified_lines.append(f'    {{ rank=same; "{node_list}" }}')
-    
-    # Add back the closing brace
-    modified_lines.append('}')
-    
-    return '\n'.join(modified_lines)
+        # Check if this is a critical attack (red edge)
+        is_critical = attributes.get("color") == "#ff0000"
+        is_dotted = attributes.get("style") == "dotted"
+
+        # Replace existing labels with empty ones
+        for label_key in ["taillabel", "headlabel"]:
+            if label_key in attributes:
+                attributes[label_key] = ""
+
+        # Draw attacks from longer to shorter games back, as in generate_dot_graph
+        source_val = get_number_value(numbering_dict[edge.from_name])
+        target_val = get_number_value(numbering_dict[edge.to_name])
+        edge.back = source_val > target_val
+        attributes.pop("style", None)
+        if edge.back and is_critical:
+            # For critical edges (red), always use dotted style
+            attributes["style"] = "dotted"
+            attributes["penwidth"] = "1"  # Reset penwidth to 1
+        elif edge.back:
+            attributes["style"] = "dashed"
+        else:
+            attributes["style"] = "solid"
+        if is_dotted:
+            # If the edge was originally dotted, restore dotted style
+            attributes["style"] = "dotted"
 
+    # Rank the arguments by their new numbers, replacing the old same ranks
+    number_groups = defaultdict(list)
+    for arg, number in numbering_dict.items():
+        if number != "∞":  # Skip infinite numbers
+            number_groups[number].append(arg)
+    dot_graph.ranks = [(rank, names) for rank, names in dot_graph.ranks if rank != "same"]
+    for number in sorted(number_groups, key=int):
+        dot_graph.add_rank("same", number_groups[number])
 
+    return dot_graph
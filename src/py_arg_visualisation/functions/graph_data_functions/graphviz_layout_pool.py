@@ -0,0 +1,202 @@
+import atexit
+import hashlib
+import os
+import queue
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Size of the pool and of its cache, and the number of seconds a single layout job may take (including the wait for a
+# free worker) before it is given up on.
+DEFAULT_NR_OF_WORKERS = 2
+DEFAULT_TIMEOUT = 10.0
+MAX_CACHED_OUTPUTS = 256
+
+# Graphviz can lay out a stream of graphs in a single process; these lines mark the end of the output for one graph.
+_LAST_LINE_BY_OUTPUT_FORMAT = {"plain": "stop", "svg": "</svg>"}
+
+
+class GraphvizLayoutWorker:
+    """
+    A long-lived dot process for one output format. DOT strings are written to its stdin one after the other, and the
+    output for each of them is read back from its stdout, so that no new process has to be started per layout.
+    """
+
+    def __init__(self, output_format: str = "plain", executable: str = "dot"):
+        if output_format not in _LAST_LINE_BY_OUTPUT_FORMAT:
+            raise ValueError(f"Output format {output_format} is not supported.")
+        self.output_format = output_format
+        self._last_line = _LAST_LINE_BY_OUTPUT_FORMAT[output_format]
+        self._process = subprocess.Popen(
+            [executable, "-T" + output_format],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        # Both output streams are drained by reader threads, so that a full pipe never blocks dot and reading can
+        # be given up on after a timeout.
+        self._lines: "queue.Queue[Tuple[str, Optional[str]]]" = queue.Queue()
+        for stream_name, stream in (("stdout", self._process.stdout), ("stderr", self._process.stderr)):
+            threading.Thread(target=self._read_lines, args=(stream_name, stream), daemon=True).start()
+
+    def _read_lines(self, stream_name, stream):
+        for line in stream:
+            self._lines.put((stream_name, line))
+        self._lines.put((stream_name, None))
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
+
+    def render(self, dot_source: str, timeout: float = DEFAULT_TIMEOUT) -> str:
+        """
+        Lay out the DOT string and return the output of dot. If dot reports an error or does not finish in time,
+        the worker is closed and cannot be used anymore.
+
+        :param dot_source: The DOT string (a single graph) to lay out.
+        :param timeout: The number of seconds after which the job is given up on.
+        :return: The output of dot in the output format of this worker.
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            self._process.stdin.write(dot_source + "\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            self.close()
+            raise ValueError("The Graphviz layout process stopped unexpectedly.")
+
+        output_lines: List[str] = []
+        while True:
+            try:
+                stream_name, line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.close()
+                raise TimeoutError("Graphviz did not finish the layout in time.")
+            if line is None:
+                self.close()
+                raise ValueError("The Graphviz layout process stopped unexpectedly.")
+            if stream_name == "stderr":
+                # Warnings do not stop the layout; errors mean that no output will come for this graph.
+                if line.startswith("Error"):
+                    self.close()
+                    raise ValueError("Graphviz could not lay out the graph: " + line.strip())
+                continue
+            output_lines.append(line)
+            if line.rstrip("\r\n") == self._last_line:
+                return "".join(output_lines)
+
+    def close(self):
+        if self.is_alive:
+            self._process.kill()
+        self._process.wait()
+        for stream in (self._process.stdin, self._process.stdout, self._process.stderr):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class GraphvizLayoutPool:
+    """
+    A small pool of GraphvizLayoutWorkers, with a cache of their outputs by content of the DOT string. At most
+    nr_of_workers graphs are laid out at the same time, and a job that takes too long (e.g. for a pathological graph)
+    is stopped, so that it does not stall the app.
+    """
+
+    def __init__(
+        self,
+        nr_of_workers: int = DEFAULT_NR_OF_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_cached_outputs: int = MAX_CACHED_OUTPUTS,
+        executable: str = "dot",
+    ):
+        self.timeout = timeout
+        self.max_cached_outputs = max_cached_outputs
+        self.executable = executable
+        self._free_workers: Dict[str, List[GraphvizLayoutWorker]] = {}
+        self._worker_slots = threading.BoundedSemaphore(nr_of_workers)
+        self._outputs: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, dot_source: str, output_format: str = "plain", timeout: Optional[float] = None) -> str:
+        """
+        Get the output of dot -T<output_format> for the DOT string, from the cache if the same DOT string was laid
+        out before.
+
+        :param dot_source: The DOT string (a single graph) to lay out.
+        :param output_format: The output format, plain or svg.
+        :param timeout: The number of seconds after which the job is given up on (by default, that of the pool).
+        :return: The output of dot.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        key = (output_format, hashlib.sha256(dot_source.encode()).hexdigest())
+        with self._lock:
+            if key in self._outputs:
+                self._outputs.move_to_end(key)
+                return self._outputs[key]
+
+        deadline = time.monotonic() + timeout
+        if not self._worker_slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No Graphviz layout worker became available within {timeout} seconds.")
+        try:
+            worker = self._take_worker(output_format)
+            # A worker that fails closes itself and is not given back to the pool.
+            output = worker.render(dot_source, max(deadline - time.monotonic(), 0))
+            with self._lock:
+                self._free_workers[output_format].append(worker)
+        finally:
+            self._worker_slots.release()
+
+        with self._lock:
+            self._outputs[key] = output
+            if len(self._outputs) > self.max_cached_outputs:
+                self._outputs.popitem(last=False)
+        return output
+
+    def _take_worker(self, output_format: str) -> GraphvizLayoutWorker:
+        with self._lock:
+            free_workers = self._free_workers.setdefault(output_format, [])
+            while free_workers:
+                worker = free_workers.pop()
+                if worker.is_alive:
+                    return worker
+                worker.close()
+        return GraphvizLayoutWorker(output_format, self.executable)
+
+    def close(self):
+        with self._lock:
+            workers = [worker for free_workers in self._free_workers.values() for worker in free_workers]
+            self._free_workers.clear()
+            self._outputs.clear()
+        for worker in workers:
+            worker.close()
+
+
+_pool: Optional[GraphvizLayoutPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_graphviz_layout_pool() -> GraphvizLayoutPool:
+    """
+    Get the layout pool of this process. Worker processes (e.g. of gunicorn) each get their own pool, since dot
+    processes cannot be shared after a fork.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = GraphvizLayoutPool()
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def _close_graphviz_layout_pool():
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.close()
+
+
+atexit.register(_close_graphviz_layout_pool)
@@ -0,0 +1,140 @@
+from collections import deque
+
+from py_arg.abstract_argumentation.semantics.get_grounded_extension import get_numbered_grounded_labelling
+
+PROVENANCE_TYPES = ["PO", "AC", "PR"]
+
+
+def _quote(name):
+    """Quote a name as clingo shows string constants, so that the results look the same as those of the encodings."""
+    return f'"{name}"'
+
+
+class ProvenanceEngine:
+    """
+    Native implementation of provenance_calculation.dl and local_view_rank.dl for one argumentation framework.
+
+    The game is played on moves from an argument to its attackers. The game length of each argument is that of the
+    grounded labelling (see get_numbered_grounded_labelling): accepted arguments are lost positions, defeated
+    arguments are won positions and undefined arguments are drawn. From these, each move is classified once, as in
+    provenance_calculation.dl:
+
+    - a move is a blunder if it goes from a won to a drawn or won position, or from a drawn to a won position;
+    - a move from a won to a lost position is winning, and it is a minimal winning move if no other winning move
+      from the same position goes to a position with a shorter game.
+
+    The potential (PO) provenance of an argument consists of all moves reachable from it, the actual (AC) provenance
+    of the moves reachable without blunders and the primary (PR) provenance of the moves reachable without blunders
+    and non-minimal winning moves. Each provenance and each local view rank is a breadth-first search, so it takes
+    O(|arguments| + |attacks|) time.
+
+    Unlike the clingo encoding (which stops after state_max rounds), game lengths are not limited.
+    """
+
+    def __init__(self, argumentation_framework):
+        graph = argumentation_framework.compact_graph
+        self._graph = graph
+        self._names = [argument.name for argument in graph.arguments]
+        status_by_argument, number_by_argument = get_numbered_grounded_labelling(argumentation_framework)
+        status = [status_by_argument[argument] for argument in graph.arguments]
+        number = [number_by_argument[argument] for argument in graph.arguments]
+
+        # For each move (by position in graph.predecessor_targets), whether it is allowed in AC and PR provenance.
+        offsets, attackers = graph.predecessor_offsets, graph.predecessor_targets
+        is_actual_move = bytearray(len(attackers))
+        is_primary_move = bytearray(len(attackers))
+        for index in range(len(graph)):
+            start, end = offsets[index], offsets[index + 1]
+            index_status = status[index]
+            min_winning_number = None
+            if index_status == "defeated":
+                winning_numbers = [number[attackers[k]] for k in range(start, end) if status[attackers[k]] == "accepted"]
+                min_winning_number = min(winning_numbers) if winning_numbers else None
+            for k in range(start, end):
+                attacker_status = status[attackers[k]]
+                if index_status == "defeated":
+                    is_blunder = attacker_status != "accepted"
+                else:
+                    is_blunder = index_status == "undefined" and attacker_status == "defeated"
+                if is_blunder:
+                    continue
+                is_actual_move[k] = 1
+                # Winning moves (from a won to a lost position) are primary only if they are minimal.
+                if index_status != "defeated" or number[attackers[k]] == min_winning_number:
+                    is_primary_move[k] = 1
+        self._allowed_moves = {"PO": None, "AC": is_actual_move, "PR": is_primary_move}
+
+    def get_provenance(self, prov_type, node):
+        """
+        Get the provenance of an argument, in the same format as the clingo-based get_provenance.
+
+        Args:
+            prov_type (str): Provenance type, one of {"PO", "AC", "PR"}.
+            node (str): Name of the argument.
+        Returns:
+            tuple: A tuple containing:
+                - list of edges as '("attacker","attacked")' strings.
+                - list of nodes as quoted strings.
+        """
+        if prov_type not in self._allowed_moves:
+            raise ValueError(f"Invalid provenance type '{prov_type}'. Expected one of {PROVENANCE_TYPES}.")
+        allowed_moves = self._allowed_moves[prov_type]
+        start = self._graph.index_of.get(node)
+        if start is None:
+            return [], [_quote(node)]
+
+        offsets, attackers = self._graph.predecessor_offsets, self._graph.predecessor_targets
+        reached = {start}
+        nodes = [start]
+        edges = []
+        seen_edges = set()
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            for k in range(offsets[index], offsets[index + 1]):
+                if allowed_moves is not None and not allowed_moves[k]:
+                    continue
+                attacker = attackers[k]
+                if (attacker, index) not in seen_edges:
+                    seen_edges.add((attacker, index))
+                    edges.append(f"({_quote(self._names[attacker])},{_quote(self._names[index])})")
+                if attacker not in reached:
+                    reached.add(attacker)
+                    nodes.append(attacker)
+                    queue.append(attacker)
+        return edges, [_quote(self._names[index]) for index in nodes]
+
+    def get_distances(self, target):
+        """
+        Get the distance of each argument to the target, following attacks: attackers of the target have distance 1,
+        their attackers distance 2, and so on. Arguments from which the target cannot be reached are left out.
+        """
+        start = self._graph.index_of[target]
+        offsets, attackers = self._graph.predecessor_offsets, self._graph.predecessor_targets
+        distance_by_index = {start: 0}
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            for k in range(offsets[index], offsets[index + 1]):
+                attacker = attackers[k]
+                if attacker not in distance_by_index:
+                    distance_by_index[attacker] = distance_by_index[index] + 1
+                    queue.append(attacker)
+        return {self._names[index]: distance for index, distance in distance_by_index.items()}
+
+    def get_local_view_rank(self, prov_arg):
+        """
+        Group the arguments by their distance to the provenance argument, in the same format as the clingo-based
+        get_local_view_rank: a dictionary from distance to lists of quoted argument names.
+        """
+        target = prov_arg
+        if target not in self._graph.index_of:
+            # As in the clingo-based version, match the case of the names of the framework.
+            target = prov_arg.upper() if any(name.isupper() for name in self._names) else prov_arg.lower()
+        rank_groups = {0: [_quote(prov_arg)]}
+        if target not in self._graph.index_of:
+            return rank_groups
+        for name, distance in self.get_distances(target).items():
+            if distance > 0:
+                rank_groups.setdefault(distance, []).append(_quote(name))
+        return rank_groups
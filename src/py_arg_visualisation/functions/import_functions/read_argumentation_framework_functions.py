@@ -3,30 +3,63 @@ from py_arg.abstract_argumentation.classes.abstract_argumentation_framework \
 from py_arg.abstract_argumentation.classes.argument import Argument
 from py_arg.abstract_argumentation.classes.defeat import Defeat
 
+# Characters that are ignored in attack lines such as "(a, b)".
+_ATTACK_SEPARATORS = str.maketrans('', '', ' \t()')
 
-def read_argumentation_framework(arguments_str: str, attacks_str: str):
+
+def read_argumentation_framework(arguments_str: str, attacks_str: str) -> \
+        AbstractArgumentationFramework:
     """
     Calculate the abstract argumentation framework from the given arguments and
     attacks between them.
 
+    Arguments are separated by whitespace (commas are ignored); each nonempty
+    line of attacks has the form "(a, b)", meaning that a attacks b. The input
+    is read in a single pass and each argument is a single Argument object,
+    shared by all defeats it is part of. All invalid attack lines are
+    reported at once, with their line numbers.
+
     :param arguments_str: The provided arguments.
     :param attacks_str: The provided attacks.
+
+    >>> read_argumentation_framework('a, b c', '(a, b)\\n\\n(b,c)')
+    ( [a, b, c], [(a, b), (b, c)] )
+    >>> read_argumentation_framework('a b', '(a, b)\\n(a, c)\\nb')
+    Traceback (most recent call last):
+     ...
+    ValueError: Not a valid defeat on line 2, since argument c does not exist.
+    Not a valid defeat on line 3, since it is not of the form (a, b).
     """
-    arg_list = [Argument(arg)
-                for arg in arguments_str.replace(',', '').split()]
+    argument_by_name = {name: Argument(name)
+                        for name in arguments_str.replace(',', '').split()}
     defeat_list = []
+    errors = []
+
+    for line_number, attack in enumerate(attacks_str.splitlines(), start=1):
+        att_list = attack.translate(_ATTACK_SEPARATORS).split(',')
+        if len(att_list) == 1 and att_list[0] == '':
+            continue
+        if len(att_list) != 2 or att_list[0] == '' or att_list[1] == '':
+            errors.append(f'Not a valid defeat on line {line_number}, since '
+                          f'it is not of the form (a, b).')
+            continue
+        from_argument = argument_by_name.get(att_list[0])
+        to_argument = argument_by_name.get(att_list[1])
+        if from_argument is None or to_argument is None:
+            missing = att_list[0] if from_argument is None else att_list[1]
+            errors.append(f'Not a valid defeat on line {line_number}, since '
+                          f'argument {missing} does not exist.')
+            continue
+        defeat_list.append(Defeat(from_argument, to_argument))
+
+    if errors:
+        raise ValueError('\n'.join(errors))
+
+    return AbstractArgumentationFramework(
+        'AF', list(argument_by_name.values()), defeat_list)
+
+
+if __name__ == "__main__":
+    import doctest
 
-    for attack in attacks_str.splitlines():
-        att_list = attack.replace(' ', '').replace(')', '').replace('(', '').\
-            split(',')
-        if len(att_list) == 2 and att_list[0] != '' and att_list[1] != '':
-            from_argument = Argument(att_list[0])
-            to_argument = Argument(att_list[1])
-            if from_argument not in arg_list or to_argument not in arg_list:
-                raise ValueError('Not a valid defeat, since one of the '
-                                 'arguments does not exist.')
-            defeat_list.append(Defeat(Argument(att_list[0]),
-                                      Argument(att_list[1])))
-
-    arg_framework = AbstractArgumentationFramework('AF', arg_list, defeat_list)
-    return arg_framework
+    doctest.testmod()
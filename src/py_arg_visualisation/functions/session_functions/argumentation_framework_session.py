@@ -0,0 +1,289 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from py_arg.abstract_argumentation.classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation.semantics.clingo_based_solvers.solver_session import SolverSession
+from py_arg.abstract_argumentation.semantics.get_argumentation_framework_extensions import (
+    get_argumentation_framework_extensions,
+)
+from py_arg.abstract_argumentation.semantics.get_complete_labellings import get_complete_labellings_by_semantics
+from py_arg_visualisation.functions.graph_data_functions.dot_graph import DotGraph
+from py_arg_visualisation.functions.graph_data_functions.get_af_dot_string import (
+    compute_node_positions,
+    get_numbered_grounded_extension,
+)
+from py_arg_visualisation.functions.graph_data_functions.provenance_engine import ProvenanceEngine
+from py_arg_visualisation.functions.import_functions.read_argumentation_framework_functions import (
+    read_argumentation_framework,
+)
+
+# Bounds on the number of frameworks kept in the process-wide cache, on the number of results (such as DOT strings
+# for different selections) kept per framework and on the number of frozen layouts kept per framework.
+MAX_SESSIONS = 32
+MAX_RESULTS_PER_SESSION = 128
+MAX_LAYOUTS_PER_SESSION = 16
+
+# Semantics for which the native engine is much faster than clingo (eager extensions are derived from the
+# semi-stable ones).
+NATIVE_SEMANTICS = {"SemiStable", "Eager"}
+
+
+class ArgumentationFrameworkSession:
+    """
+    A parsed argumentation framework together with the data that callbacks derive from it (solver results, the
+    numbered grounded labelling, DOT strings), each computed once and shared by all callbacks. Sessions are obtained
+    with get_argumentation_framework_session and must not be changed by their users.
+    """
+
+    def __init__(self, argumentation_framework: AbstractArgumentationFramework, canonical_hash: Optional[str] = None):
+        self.argumentation_framework = argumentation_framework
+        self.canonical_hash = canonical_hash or get_canonical_hash(argumentation_framework)
+        self.solver_session = SolverSession(argumentation_framework)
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._layouts: "OrderedDict[str, Dict[str, Tuple[float, float]]]" = OrderedDict()
+        # Results that are being computed, by key. Callbacks (possibly of different users) run in parallel threads;
+        # the lock is only held to look up and store results, so that a slow computation does not block the others.
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get the result stored under the key, computing (and storing) it first if needed. If another thread is
+        computing the same result, wait for it instead, so that each result is only computed once. Only the most
+        recently used results are kept.
+        """
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+            pending = self._pending.get(key)
+            is_computing = pending is None
+            if is_computing:
+                pending = self._pending[key] = Future()
+        if not is_computing:
+            return pending.result()
+
+        try:
+            result = compute()
+        except BaseException as error:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(error)
+            raise
+        with self._lock:
+            del self._pending[key]
+            self._results[key] = result
+            if len(self._results) > MAX_RESULTS_PER_SESSION:
+                self._results.popitem(last=False)
+        pending.set_result(result)
+        return result
+
+    def get_numbered_grounded_extension(self, engine: str = "native"):
+        return self.get_or_compute(
+            ("numbered_grounded_extension", engine),
+            lambda: get_numbered_grounded_extension(self.argumentation_framework, engine),
+        )
+
+    def get_complete_labellings_by_semantics(self):
+        return self.get_or_compute(
+            ("complete_labellings_by_semantics",),
+            lambda: get_complete_labellings_by_semantics(
+                self.argumentation_framework, self.solver_session, scc_recursive=True
+            ),
+        )
+
+    def get_extensions(self, semantics_specification: str):
+        """
+        Get the extensions under the semantics. Semantics that allow it are solved one strongly connected component
+        at a time, which is much faster on the mostly acyclic frameworks that are typical here.
+        """
+        engine = "native" if semantics_specification in NATIVE_SEMANTICS else "clingo"
+        return self.get_or_compute(
+            ("extensions", semantics_specification),
+            lambda: get_argumentation_framework_extensions(
+                self.argumentation_framework,
+                semantics_specification,
+                session=self.solver_session,
+                scc_recursive=True,
+                engine=engine,
+            ),
+        )
+
+    def get_provenance_engine(self) -> ProvenanceEngine:
+        return self.get_or_compute(("provenance_engine",), lambda: ProvenanceEngine(self.argumentation_framework))
+
+    def get_provenance(self, prov_type: str, prov_arg: str):
+        """
+        Get the provenance edges and nodes of the argument (see get_af_dot_string.get_provenance), so that styling
+        interactions (provenance type, local view) do not compute them again.
+        """
+        return self.get_or_compute(
+            ("provenance", prov_type, prov_arg),
+            lambda: self.get_provenance_engine().get_provenance(prov_type, prov_arg),
+        )
+
+    def get_local_view_rank(self, prov_arg: str):
+        return self.get_or_compute(
+            ("local_view_rank", prov_arg),
+            lambda: self.get_provenance_engine().get_local_view_rank(prov_arg),
+        )
+
+    def get_fixed_argumentation_framework(self, removed_attacks: Iterable[Sequence[str]]) \
+            -> AbstractArgumentationFramework:
+        """
+        Get the argumentation framework without the given attacks, e.g. the critical attacks of a fix.
+
+        :param removed_attacks: The attacks to remove, as (from_argument, to_argument) names.
+        :return: The argumentation framework without those attacks, sharing its arguments with this framework.
+        """
+        removed_attacks = frozenset((from_name, to_name) for from_name, to_name in removed_attacks)
+        argumentation_framework = self.argumentation_framework
+        return self.get_or_compute(
+            ("fixed_argumentation_framework", tuple(sorted(removed_attacks))),
+            lambda: AbstractArgumentationFramework(
+                argumentation_framework.name,
+                argumentation_framework.arguments,
+                [
+                    defeat
+                    for defeat in argumentation_framework.defeats
+                    if (defeat.from_argument.name, defeat.to_argument.name) not in removed_attacks
+                ],
+            ),
+        )
+
+    def _get_shared_dot_graph(self, generate_dot_graph: Callable[..., DotGraph], args, layout_token, kwargs):
+        if layout_token is not None:
+            kwargs["node_positions"] = self.get_layout(layout_token)
+        key = (
+            "dot_graph",
+            generate_dot_graph.__name__,
+            layout_token,
+            json.dumps([args, {k: v for k, v in kwargs.items() if k != "node_positions"}], sort_keys=True, default=str),
+        )
+        dot_graph = self.get_or_compute(key, lambda: generate_dot_graph(self.argumentation_framework, *args, **kwargs))
+        return key, dot_graph
+
+    def get_dot_graph(self, generate_dot_graph: Callable[..., DotGraph], *args, layout_token: Optional[str] = None,
+                      **kwargs) -> DotGraph:
+        """
+        Get the DotGraph made by generate_dot_graph(argumentation_framework, *args, **kwargs). If a layout token (see
+        freeze_layout) is given, the nodes are placed at the positions of that frozen layout. The graph is a copy,
+        which can be changed by styling passes.
+        """
+        _, dot_graph = self._get_shared_dot_graph(generate_dot_graph, args, layout_token, kwargs)
+        return dot_graph.copy()
+
+    def get_dot_string(self, generate_dot_graph: Callable[..., DotGraph], *args, layout_token: Optional[str] = None,
+                       **kwargs) -> str:
+        """
+        Get the DOT string of the DotGraph that get_dot_graph would return.
+        """
+        key, dot_graph = self._get_shared_dot_graph(generate_dot_graph, args, layout_token, kwargs)
+        return self.get_or_compute(("dot_string",) + key[1:], dot_graph.to_dot)
+
+    def freeze_layout(self, dot_source: str) -> str:
+        """
+        Lay out the DOT string in memory and keep the resulting node positions in this session.
+
+        :param dot_source: The DOT string of the layout to freeze.
+        :return: A small token by which the layout can be retrieved, e.g. to keep in a dcc.Store.
+        """
+        layout_token = hashlib.sha256((self.canonical_hash + dot_source).encode()).hexdigest()[:32]
+        with self._lock:
+            if layout_token in self._layouts:
+                self._layouts.move_to_end(layout_token)
+                return layout_token
+        node_positions = compute_node_positions(dot_source)
+        with self._lock:
+            self._layouts[layout_token] = node_positions
+            if len(self._layouts) > MAX_LAYOUTS_PER_SESSION:
+                self._layouts.popitem(last=False)
+        return layout_token
+
+    def get_layout(self, layout_token: Optional[str]) -> Optional[Dict[str, Tuple[float, float]]]:
+        """
+        Get the node positions of a layout frozen in this session, or None if the token is unknown here (e.g. since
+        it was made for another framework or by another worker process).
+        """
+        with self._lock:
+            return self._layouts.get(layout_token)
+
+    def get_layout_token(self, layout_token: Optional[str], dot_source: Optional[str]) -> Optional[str]:
+        """
+        Get the token if its layout is known to this session, and otherwise freeze the layout of the DOT string
+        (typically the one currently shown, which has the positions of the frozen layout) instead.
+        """
+        if self.get_layout(layout_token) is not None:
+            return layout_token
+        if dot_source is None:
+            return None
+        return self.freeze_layout(dot_source)
+
+
+_sessions: "OrderedDict[str, ArgumentationFrameworkSession]" = OrderedDict()
+_canonical_hash_by_text_hash: "OrderedDict[str, str]" = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def get_canonical_hash(argumentation_framework: AbstractArgumentationFramework) -> str:
+    """
+    Get a hash of the arguments and defeats of the framework (by name, in order) that does not depend on how the
+    framework was written down, e.g. spacing, brackets or blank lines in the text areas.
+    """
+    content: List[Any] = [
+        [argument.name for argument in argumentation_framework.arguments],
+        [[defeat.from_argument.name, defeat.to_argument.name] for defeat in argumentation_framework.defeats],
+    ]
+    return hashlib.sha256(json.dumps(content).encode()).hexdigest()
+
+
+def _get_text_hash(arguments_str: str, attacks_str: str) -> str:
+    return hashlib.sha256(json.dumps([arguments_str, attacks_str]).encode()).hexdigest()
+
+
+def _remember(cache: "OrderedDict[str, Any]", key: str, value: Any):
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > MAX_SESSIONS:
+        cache.popitem(last=False)
+
+
+def get_argumentation_framework_session(arguments_str: str, attacks_str: str) -> ArgumentationFrameworkSession:
+    """
+    Get the session of the argumentation framework given by the text areas. Text that was seen recently is not parsed
+    again, and different texts for the same framework (see get_canonical_hash) share a session. The sessions are kept
+    in a process-wide cache, of which the least recently used ones are removed.
+
+    :param arguments_str: The provided arguments.
+    :param attacks_str: The provided attacks.
+    :return: The session of the argumentation framework.
+    """
+    text_hash = _get_text_hash(arguments_str or "", attacks_str or "")
+    with _sessions_lock:
+        canonical_hash = _canonical_hash_by_text_hash.get(text_hash)
+        if canonical_hash in _sessions:
+            _remember(_canonical_hash_by_text_hash, text_hash, canonical_hash)
+            _remember(_sessions, canonical_hash, _sessions[canonical_hash])
+            return _sessions[canonical_hash]
+
+    # Parse outside of the lock, so that other frameworks can be looked up meanwhile.
+    argumentation_framework = read_argumentation_framework(arguments_str or "", attacks_str or "")
+    canonical_hash = get_canonical_hash(argumentation_framework)
+    with _sessions_lock:
+        session = _sessions.get(canonical_hash)
+        if session is None:
+            session = ArgumentationFrameworkSession(argumentation_framework, canonical_hash)
+        _remember(_sessions, canonical_hash, session)
+        _remember(_canonical_hash_by_text_hash, text_hash, canonical_hash)
+        return session
+
+
+def clear_argumentation_framework_sessions():
+    with _sessions_lock:
+        _sessions.clear()
+        _canonical_hash_by_text_hash.clear()
+